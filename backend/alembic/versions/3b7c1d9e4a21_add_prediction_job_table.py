@@ -0,0 +1,46 @@
+"""Add prediction_job table
+
+Revision ID: 3b7c1d9e4a21
+Revises: 2fd3f2232673
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7c1d9e4a21'
+down_revision: Union[str, None] = '2fd3f2232673'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('prediction_jobs',
+    sa.Column('tenant_id', sa.Integer(), nullable=False, comment='소속 회사'),
+    sa.Column('stored_filename', sa.String(length=255), nullable=False, comment='예측 대상 업로드 파일명'),
+    sa.Column('status', sa.String(length=50), nullable=False, comment='상태(pending/processing/completed/failed)'),
+    sa.Column('progress', sa.Integer(), nullable=False, comment='진행률(0~100)'),
+    sa.Column('error_message', sa.Text(), nullable=True, comment='에러 메시지'),
+    sa.Column('started_at', sa.DateTime(), nullable=True, comment='처리 시작 시각'),
+    sa.Column('finished_at', sa.DateTime(), nullable=True, comment='처리 종료 시각'),
+    sa.Column('total_products', sa.Integer(), nullable=True, comment='예측 상품 수'),
+    sa.Column('csv_path', sa.String(length=500), nullable=True, comment='결과 CSV 경로'),
+    sa.Column('xlsx_path', sa.String(length=500), nullable=True, comment='결과 XLSX 경로'),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_prediction_jobs_id'), 'prediction_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_prediction_jobs_tenant_id'), 'prediction_jobs', ['tenant_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_prediction_jobs_tenant_id'), table_name='prediction_jobs')
+    op.drop_index(op.f('ix_prediction_jobs_id'), table_name='prediction_jobs')
+    op.drop_table('prediction_jobs')
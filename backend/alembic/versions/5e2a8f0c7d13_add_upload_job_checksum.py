@@ -0,0 +1,28 @@
+"""Add upload_job checksum
+
+Revision ID: 5e2a8f0c7d13
+Revises: 3b7c1d9e4a21
+Create Date: 2026-10-18 11:03:47.219584
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a8f0c7d13'
+down_revision: Union[str, None] = '3b7c1d9e4a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('upload_jobs', sa.Column('checksum', sa.String(length=32), nullable=True, comment='파일 체크섬(MD5)'))
+    op.create_index(op.f('ix_upload_jobs_checksum'), 'upload_jobs', ['checksum'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_upload_jobs_checksum'), table_name='upload_jobs')
+    op.drop_column('upload_jobs', 'checksum')
@@ -0,0 +1,47 @@
+"""Add products (tenant_id, sku) unique constraint
+
+Revision ID: 8a4d6b2e9f05
+Revises: 5e2a8f0c7d13
+Create Date: 2026-10-18 11:41:09.663201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4d6b2e9f05'
+down_revision: Union[str, None] = '5e2a8f0c7d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DUPLICATES = """
+    SELECT tenant_id, sku, MIN(id) AS keep_id
+    FROM products
+    GROUP BY tenant_id, sku
+    HAVING COUNT(*) > 1
+"""
+
+
+def upgrade() -> None:
+    # 중복 SKU가 있으면 가장 먼저 생성된 제품으로 판매 데이터를 옮긴 뒤 나머지를 삭제
+    op.execute(f"""
+        UPDATE sales s
+        JOIN products p ON s.product_id = p.id
+        JOIN ({DUPLICATES}) d ON p.tenant_id = d.tenant_id AND p.sku = d.sku
+        SET s.product_id = d.keep_id
+        WHERE p.id <> d.keep_id
+    """)
+    op.execute(f"""
+        DELETE p FROM products p
+        JOIN ({DUPLICATES}) d ON p.tenant_id = d.tenant_id AND p.sku = d.sku
+        WHERE p.id <> d.keep_id
+    """)
+    op.create_unique_constraint('uq_products_tenant_sku', 'products', ['tenant_id', 'sku'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_products_tenant_sku', 'products', type_='unique')
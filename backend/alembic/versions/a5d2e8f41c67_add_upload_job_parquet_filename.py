@@ -0,0 +1,26 @@
+"""Add upload_job parquet_filename
+
+Revision ID: a5d2e8f41c67
+Revises: f1c9a7e3b520
+Create Date: 2026-10-18 17:05:22.631904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d2e8f41c67'
+down_revision: Union[str, None] = 'f1c9a7e3b520'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('upload_jobs', sa.Column('parquet_filename', sa.String(length=255), nullable=True, comment='파싱 결과 Parquet 사본 파일명'))
+
+
+def downgrade() -> None:
+    op.drop_column('upload_jobs', 'parquet_filename')
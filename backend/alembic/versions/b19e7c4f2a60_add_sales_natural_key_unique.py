@@ -0,0 +1,49 @@
+"""Add sales (tenant_id, product_id, sale_date) unique constraint
+
+Revision ID: b19e7c4f2a60
+Revises: 8a4d6b2e9f05
+Create Date: 2026-10-18 12:20:55.108374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b19e7c4f2a60'
+down_revision: Union[str, None] = '8a4d6b2e9f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 같은 (회사, 제품, 판매일) 행은 가장 먼저 생성된 행에 합산하고 나머지는 삭제
+    op.execute("""
+        UPDATE sales s
+        JOIN (
+            SELECT MIN(id) AS keep_id, SUM(quantity) AS quantity, SUM(COALESCE(revenue, 0)) AS revenue
+            FROM sales
+            GROUP BY tenant_id, product_id, sale_date
+            HAVING COUNT(*) > 1
+        ) d ON s.id = d.keep_id
+        SET s.quantity = d.quantity, s.revenue = d.revenue
+    """)
+    op.execute("""
+        DELETE s FROM sales s
+        JOIN (
+            SELECT tenant_id, product_id, sale_date, MIN(id) AS keep_id
+            FROM sales
+            GROUP BY tenant_id, product_id, sale_date
+            HAVING COUNT(*) > 1
+        ) d ON s.tenant_id = d.tenant_id AND s.product_id = d.product_id AND s.sale_date = d.sale_date
+        WHERE s.id <> d.keep_id
+    """)
+    op.create_unique_constraint(
+        'uq_sales_tenant_product_date', 'sales', ['tenant_id', 'product_id', 'sale_date']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_sales_tenant_product_date', 'sales', type_='unique')
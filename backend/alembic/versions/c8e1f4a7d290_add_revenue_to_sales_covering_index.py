@@ -0,0 +1,36 @@
+"""Add revenue to sales covering index
+
+Revision ID: c8e1f4a7d290
+Revises: a5d2e8f41c67
+Create Date: 2026-10-18 21:14:37.502318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e1f4a7d290'
+down_revision: Union[str, None] = 'a5d2e8f41c67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 월별 집계 갱신(refresh_monthly)은 quantity와 revenue를 함께 합산하므로 revenue까지 포함해야 커버링 인덱스가 됨
+    # tenant_id FK가 쓰는 인덱스가 항상 남아 있도록 새 인덱스를 먼저 만들고 기존 인덱스를 삭제
+    op.create_index(
+        'ix_sales_tenant_date_product_qty_rev', 'sales',
+        ['tenant_id', 'sale_date', 'product_id', 'quantity', 'revenue'], unique=False
+    )
+    op.drop_index('ix_sales_tenant_date_product_qty', table_name='sales')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_sales_tenant_date_product_qty', 'sales',
+        ['tenant_id', 'sale_date', 'product_id', 'quantity'], unique=False
+    )
+    op.drop_index('ix_sales_tenant_date_product_qty_rev', table_name='sales')
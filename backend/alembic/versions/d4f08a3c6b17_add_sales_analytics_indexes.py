@@ -0,0 +1,34 @@
+"""Add sales analytics covering index
+
+Revision ID: d4f08a3c6b17
+Revises: b19e7c4f2a60
+Create Date: 2026-10-18 12:58:13.840926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f08a3c6b17'
+down_revision: Union[str, None] = 'b19e7c4f2a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # /analytics/summary, /analytics/products: tenant_id 동등 + sale_date 범위 필터 후 product_id/quantity만 읽으므로
+    # 테이블 본문을 읽지 않고 인덱스만으로 처리 (covering index)
+    op.create_index(
+        'ix_sales_tenant_date_product_qty', 'sales',
+        ['tenant_id', 'sale_date', 'product_id', 'quantity'], unique=False
+    )
+    # tenant_id 단일 인덱스는 위 인덱스의 접두어와 중복 (FK도 복합 인덱스를 사용)
+    op.drop_index('ix_sales_tenant_id', table_name='sales')
+
+
+def downgrade() -> None:
+    op.create_index('ix_sales_tenant_id', 'sales', ['tenant_id'], unique=False)
+    op.drop_index('ix_sales_tenant_date_product_qty', table_name='sales')
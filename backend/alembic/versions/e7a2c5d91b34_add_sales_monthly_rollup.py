@@ -0,0 +1,59 @@
+"""Add sales_monthly rollup table
+
+Revision ID: e7a2c5d91b34
+Revises: d4f08a3c6b17
+Create Date: 2026-10-18 13:41:07.215384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2c5d91b34'
+down_revision: Union[str, None] = 'd4f08a3c6b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sales_monthly',
+    sa.Column('tenant_id', sa.Integer(), nullable=False, comment='소속 회사'),
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='제품'),
+    sa.Column('period', sa.Date(), nullable=False, comment='집계 월(해당 월 1일)'),
+    sa.Column('quantity', sa.Float(), nullable=False, comment='월 판매량'),
+    sa.Column('revenue', sa.Float(), nullable=True, comment='월 매출액'),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tenant_id', 'product_id', 'period', name='uq_sales_monthly_tenant_product_period')
+    )
+    op.create_index(op.f('ix_sales_monthly_id'), 'sales_monthly', ['id'], unique=False)
+    op.create_index(op.f('ix_sales_monthly_product_id'), 'sales_monthly', ['product_id'], unique=False)
+    op.create_index(
+        'ix_sales_monthly_tenant_period_product_qty', 'sales_monthly',
+        ['tenant_id', 'period', 'product_id', 'quantity'], unique=False
+    )
+
+    # 기존 sales 데이터로 초기 집계 생성 (이후에는 업로드 적재 시 해당 월만 갱신)
+    op.execute(
+        """
+        INSERT INTO sales_monthly (tenant_id, product_id, period, quantity, revenue, created_at, updated_at)
+        SELECT tenant_id, product_id, DATE_SUB(sale_date, INTERVAL DAY(sale_date) - 1 DAY),
+               SUM(quantity), SUM(COALESCE(revenue, 0)), NOW(), NOW()
+        FROM sales
+        GROUP BY tenant_id, product_id, DATE_SUB(sale_date, INTERVAL DAY(sale_date) - 1 DAY)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sales_monthly_tenant_period_product_qty', table_name='sales_monthly')
+    op.drop_index(op.f('ix_sales_monthly_product_id'), table_name='sales_monthly')
+    op.drop_index(op.f('ix_sales_monthly_id'), table_name='sales_monthly')
+    op.drop_table('sales_monthly')
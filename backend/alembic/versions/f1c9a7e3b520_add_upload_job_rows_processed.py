@@ -0,0 +1,26 @@
+"""Add upload_job rows_processed
+
+Revision ID: f1c9a7e3b520
+Revises: e7a2c5d91b34
+Create Date: 2026-10-18 16:12:40.508311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c9a7e3b520'
+down_revision: Union[str, None] = 'e7a2c5d91b34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('upload_jobs', sa.Column('rows_processed', sa.Integer(), nullable=True, comment='처리된 행 수(진행률)'))
+
+
+def downgrade() -> None:
+    op.drop_column('upload_jobs', 'rows_processed')
@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from .config import settings
+
+
+async def run_backend(backend, func: Callable, *args, **kwargs) -> Any:
+    """
+    async 핸들러에서 캐시/요청 제한 백엔드 호출
+    네트워크 왕복이 있는 백엔드(blocking=True, Redis)는 스레드풀에서 실행해 이벤트 루프를 막지 않고,
+    메모리 백엔드는 스레드 전환 없이 바로 실행합니다
+    """
+    if getattr(backend, "blocking", False):
+        return await run_in_threadpool(func, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
+class InMemoryCache:
+    """
+    프로세스 내 LRU + TTL 캐시 (기본 백엔드)
+    워커 프로세스마다 따로 동작하므로, 여러 워커에서 무효화를 공유하려면 RedisCache를 사용합니다
+    """
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key → (만료 시각, 값)
+        # 카운터(세대 번호)는 LRU 삭제 대상이 아니도록 따로 보관 (삭제되면 이전 세대 엔트리가 되살아남)
+        self._counters: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._counters:
+                return self._counters[key]
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        with self._lock:
+            expires_at = self._clock() + ttl if ttl else None
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def redis_client(url: str):
+    """Redis 클라이언트 생성 (redis 패키지는 선택 의존성)"""
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError("Redis 백엔드를 사용하려면 redis 패키지를 설치해야 합니다 (pip install redis)") from e
+    return redis.Redis.from_url(url)
+
+
+class RedisCache:
+    """
+    Redis 호환 백엔드 (get / set(ex=) / incr만 사용)
+    redis.Redis 외에도 같은 인터페이스의 클라이언트(fakeredis 등)를 그대로 넘길 수 있습니다
+    동기 클라이언트이므로 async 핸들러에서는 run_backend로 호출합니다
+    """
+
+    blocking = True
+
+    def __init__(self, client, prefix: str = "smartstock:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        return cls(redis_client(url), **kwargs)
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.client.set(self.prefix + key, json.dumps(value, ensure_ascii=False), ex=ttl or None)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+
+def create_backend(backend: str, max_entries: int = 1024, redis_url: Optional[str] = None):
+    """설정값(memory / redis)에 맞는 캐시 백엔드 생성"""
+    if backend == "memory":
+        return InMemoryCache(max_entries=max_entries)
+    if backend == "redis":
+        if not redis_url:
+            raise RuntimeError("redis 캐시 백엔드를 사용하려면 REDIS_URL을 설정해야 합니다")
+        return RedisCache.from_url(redis_url)
+    raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {backend} (허용: memory, redis)")
+
+
+class TenantResponseCache:
+    """
+    회사(tenant)별 API 응답 캐시
+    키 = 네임스페이스 + 엔드포인트 + tenant_id + 회사 세대 번호 + 요청 파라미터
+    invalidate(tenant_id)는 세대 번호만 올려 이전 키를 모두 무효화하고, 남은 엔트리는 TTL/LRU로 정리됩니다
+    백엔드 장애 시에는 캐시 미스로 처리해 DB 조회로 넘어갑니다
+    """
+
+    def __init__(self, backend, namespace: str, ttl: int):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _generation(self, tenant_id: int) -> int:
+        return int(self.backend.get(f"{self.namespace}:gen:{tenant_id}") or 0)
+
+    def _key(self, endpoint: str, tenant_id: int, params: Dict[str, Any]) -> str:
+        param_part = ",".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{self.namespace}:{endpoint}:{tenant_id}:{self._generation(tenant_id)}:{param_part}"
+
+    def _lookup(self, endpoint: str, tenant_id: int, params: Dict[str, Any]) -> Tuple[Optional[str], Optional[Any]]:
+        key = value = None
+        try:
+            key = self._key(endpoint, tenant_id, params)
+            value = self.backend.get(key)
+        except Exception:
+            self._count("errors")
+        self._count("misses" if value is None else "hits")
+        return key, value
+
+    def _store(self, key: Optional[str], value: Any) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception:
+            self._count("errors")
+
+    def get(self, endpoint: str, tenant_id: int, **params) -> Optional[Any]:
+        return self._lookup(endpoint, tenant_id, params)[1]
+
+    def set(self, endpoint: str, tenant_id: int, value: Any, **params) -> None:
+        try:
+            key = self._key(endpoint, tenant_id, params)
+        except Exception:
+            self._count("errors")
+            return
+        self._store(key, value)
+
+    async def lookup(self, endpoint: str, tenant_id: int, **params) -> Tuple[Optional[str], Optional[Any]]:
+        """
+        async 핸들러용 조회: (키, 캐시 값) 반환
+        세대 번호 조회 + 값 조회를 한 번의 스레드풀 호출로 처리하고 (Redis 백엔드),
+        미스 시에는 반환된 키로 store()해 세대 번호를 다시 조회하지 않습니다
+        (DB 조회 중 무효화되면 이전 세대 키에 저장되어 다시 읽히지 않음)
+        """
+        return await run_backend(self.backend, self._lookup, endpoint, tenant_id, params)
+
+    async def store(self, key: Optional[str], value: Any) -> None:
+        """lookup()이 반환한 키로 응답 저장 (키가 없으면 = 백엔드 장애 시 건너뜀)"""
+        await run_backend(self.backend, self._store, key, value)
+
+    def invalidate(self, tenant_id: int) -> None:
+        """해당 회사의 캐시된 응답 전체 무효화 (업로드 적재 완료 시 호출)"""
+        try:
+            self.backend.incr(f"{self.namespace}:gen:{tenant_id}")
+            self._count("invalidations")
+        except Exception:
+            self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else None
+        stats["backend"] = type(self.backend).__name__
+        stats["ttl"] = self.ttl
+        return stats
+
+
+# 분석 API(/analytics) 응답 캐시
+analytics_cache = TenantResponseCache(
+    create_backend(settings.ANALYTICS_CACHE_BACKEND, settings.ANALYTICS_CACHE_MAX_ENTRIES, settings.REDIS_URL),
+    namespace="analytics",
+    ttl=settings.ANALYTICS_CACHE_TTL,
+)
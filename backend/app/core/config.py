@@ -2,6 +2,15 @@ from pydantic_settings import BaseSettings
 from typing import Optional
 
 
+# 동기 드라이버 → 비동기 드라이버 (DB_URL만 지정한 경우 비동기 URL 생성용)
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
 class Settings(BaseSettings):
     """
     애플리케이션 설정 클래스
@@ -20,23 +29,95 @@ class Settings(BaseSettings):
     DB_USER: str = "admin"
     DB_PASSWORD: str = "dbsdk4757"
     DB_NAME: str = "smartstock"
+    # 직접 지정하면 위 DB_* 조합 대신 사용 (예: 로컬 확인용 sqlite:///./smartstock.db)
+    DB_URL: Optional[str] = None
+    ASYNC_DB_URL: Optional[str] = None   # 없으면 DB_URL의 드라이버만 비동기 드라이버로 바꿔 사용
+
+    # 커넥션 풀 설정 (gunicorn 워커 프로세스마다 sync/async 풀이 각각 생성됨)
+    DB_POOL_SIZE: int = 5         # 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 10     # pool_size를 넘어 임시로 더 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: int = 30     # 커넥션을 기다리는 최대 시간(초)
+    DB_POOL_RECYCLE: int = 3600   # 커넥션 재생성 주기(초)
+    DB_ECHO: bool = False         # SQL 쿼리 로깅
 
     # 보안 설정
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # 예측 설정
+    PREDICTION_BATCH_SIZE: int = 512  # model.predict 배치 크기 (메모리 사용량 조절)
+    PREDICTION_WORKERS: int = 2       # 비동기 예측 작업 프로세스 수
+    PREDICTION_MAX_PENDING: int = 20  # 동시에 대기/실행 가능한 예측 작업 수
+    PREDICTION_CACHE_MAX_MB: int = 500  # 예측 결과 캐시(download_prediction) 최대 용량
+    PREDICTION_STALE_SECONDS: int = 1800  # 이 시간 동안 갱신이 없는 pending/processing 예측 작업은 중단된 것으로 보고 실패 처리
+    PREDICTION_HEARTBEAT_SECONDS: int = 60  # 대기/처리 중인 예측 작업의 updated_at 갱신 주기
+
+    # 업로드 처리 (파싱/프로파일링/적재를 백그라운드 스레드에서 실행)
+    UPLOAD_WORKERS: int = 2           # 동시에 처리하는 업로드 수
+    UPLOAD_MAX_PENDING: int = 20      # 동시에 대기/실행 가능한 업로드 작업 수
+    UPLOAD_STALE_SECONDS: int = 1800  # 이 시간 동안 갱신이 없는 pending/processing 작업은 중단된 것으로 보고 실패 처리
+    UPLOAD_HEARTBEAT_SECONDS: int = 60  # 대기/처리 중인 작업의 updated_at 갱신 주기 (다른 워커가 중단 작업으로 보지 않도록)
+    CSV_READER_ENGINE: str = "auto"   # auto / pyarrow / c (설치되지 않았거나 실패하면 다음 엔진 사용)
+    EXCEL_READER_ENGINE: str = "auto" # auto / calamine / openpyxl
+
+    # 캐시 설정
+    ANALYTICS_CACHE_BACKEND: str = "memory"  # memory(프로세스 내 LRU) / redis(워커 간 공유)
+    ANALYTICS_CACHE_TTL: int = 300           # 분석 API 응답 캐시 유효 시간(초)
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 1024  # memory 백엔드 최대 엔트리 수
+    REDIS_URL: Optional[str] = None          # 예: redis://localhost:6379/0
+
+    # 챗봇 요청 제한 (IP 기준 슬라이딩 윈도우)
+    CHAT_RATE_LIMIT: int = 50                # 윈도우당 허용 요청 수
+    CHAT_RATE_WINDOW: int = 3600             # 윈도우 길이(초)
+    RATE_LIMIT_BACKEND: str = "memory"       # memory(워커별) / redis(워커 간 공유)
+    RATE_LIMIT_MAX_KEYS: int = 10000         # memory 백엔드가 추적하는 최대 IP 수
+
+    # 챗봇 응답 캐시
+    CHAT_CACHE_ENABLED: bool = True
+    CHAT_CACHE_BACKEND: str = "memory"       # memory / redis
+    CHAT_CACHE_TTL: int = 3600               # 응답 유효 시간(초)
+    CHAT_CACHE_MAX_ENTRIES: int = 1000
+    CHAT_CACHE_SEMANTIC: bool = False        # 유사 질문 재사용 (질문마다 임베딩 API 호출)
+    CHAT_CACHE_SIMILARITY: float = 0.95      # 유사 질문으로 볼 코사인 유사도 하한
+    CHAT_CACHE_EMBEDDING_MODEL: str = "text-embedding-3-small"
+
+    # 챗봇 대화 컨텍스트 토큰 예산 (초과 시 오래된 대화부터 생략)
+    CHAT_CONTEXT_TOKEN_BUDGET: int = 3000    # 프롬프트(system + 검색 컨텍스트 + 대화) 최대 토큰 수
+
+    # 업로드 데이터 검색 (챗봇 컨텍스트)
+    RETRIEVAL_ENABLED: bool = True
+    EMBED_MODEL_NAME: str = "all-MiniLM-L6-v2"  # sentence-transformers 모델명/경로, "hashing"이면 외부 모델 없이 동작
+    RETRIEVAL_TOP_K: int = 5                    # 챗봇 질문마다 붙이는 업로드 행 수
+    RETRIEVAL_HNSW_THRESHOLD: int = 50000       # 회사별 행 수가 이 이상이면 근사 검색(HNSW) 사용
+    RETRIEVAL_MAX_PENDING: int = 10             # 대기 가능한 업로드 색인 작업 수 (초과분은 /embed/reindex로 색인)
+
     # ✅ OpenAI API 설정 추가
     OPENAI_API_KEY: Optional[str] = None
 
     # 데이터베이스 URL 자동 생성
     @property
     def DATABASE_URL(self) -> str:
+        if self.DB_URL:
+            return self.DB_URL
         return (
             f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    # 비동기 엔진용 URL (MySQL은 aiomysql, SQLite는 aiosqlite 드라이버)
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        if self.ASYNC_DB_URL:
+            return self.ASYNC_DB_URL
+        if self.DB_URL:
+            scheme, rest = self.DB_URL.split("://", 1)
+            return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+        return (
+            f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+        )
+
     # 프로젝트 다른 부분이 이 이름을 쓸 수도 있어서 호환용으로 제공
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
@@ -0,0 +1,22 @@
+"""
+예측 모델 입출력 컬럼 정의
+TensorFlow 없이 import할 수 있도록 prediction_service와 분리 (벤치마크/스크립트에서 사용)
+"""
+
+# 예측 타깃 순서대로 다음 시퀀스에 되먹임되는 피처
+FEEDBACK_COLS = ['재고', '가용재고', '출고예정(B2C)']
+feature_cols = [
+
+    '고객사 코드_encoded', '공급업체 코드_encoded', 'SKU_encoded',
+    '랙번호_encoded', '브랜드명_encoded', '재고차감 순서',
+    '입고예정수량', '입고', '출고', '불량', '재고조정', '재고',
+    '가용재고', '출고예정(B2C)', '출하예정(B2B)', '출고대기(B2C)',
+    '_주차', '_월', '월_sin', '월_cos', '요일_sin', '요일_cos'
+]
+OUTPUT_COLS = ["재고", "가용재고", "재고예정"]
+CATEGORY_COLS = ['고객사 코드', '공급업체 코드', 'SKU', '랙번호', '브랜드명']
+# 업로드 파일에서 예측에 쓰는 원본 컬럼 (나머지 컬럼은 읽지 않음)
+INPUT_COLS = ['_일자', '상품명 (한글)'] + CATEGORY_COLS + [
+    col for col in feature_cols
+    if not col.endswith('_encoded') and col not in ('월_sin', '월_cos', '요일_sin', '요일_cos')
+]
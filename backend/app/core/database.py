@@ -1,15 +1,62 @@
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, PoolMetrics
+
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """sync/async 엔진 공통 옵션 (풀 크기는 gunicorn 워커 프로세스마다 따로 적용됨)"""
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,  # SQL 쿼리 로깅 (기본 off, 디버깅 시에만 켜기)
+        "pool_pre_ping": True,     # 연결 상태 자동 확인
+    }
+    if not url.startswith("sqlite"):
+        options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        })
+    return options
+
+
+def create_db_engine(url: str = None, metrics: PoolMetrics = None) -> Engine:
+    """애플리케이션 공용 동기 엔진 생성 (풀 설정/메트릭을 한 곳에서 관리)"""
+    url = url or settings.DATABASE_URL
+    options = _engine_options(url)
+    if "pool_size" in options:
+        options["poolclass"] = InstrumentedQueuePool
+    db_engine = create_engine(url, **options)
+    if metrics is not None:
+        metrics.attach(db_engine)
+    return db_engine
 
-# 데이터베이스 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # SQL 쿼리 로깅 (개발 모드에서만)
-    pool_pre_ping=True,   # 연결 상태 자동 확인
-    pool_recycle=3600,    # 1시간마다 연결 재생성
-)
+
+def create_async_db_engine(url: str = None, metrics: PoolMetrics = None) -> AsyncEngine:
+    """애플리케이션 공용 비동기 엔진 생성"""
+    url = url or settings.ASYNC_DATABASE_URL
+    options = _engine_options(url)
+    if "pool_size" in options:
+        options["poolclass"] = InstrumentedAsyncQueuePool
+    db_engine = create_async_engine(url, **options)
+    if metrics is not None:
+        metrics.attach(db_engine.sync_engine)
+    return db_engine
+
+
+# 풀 메트릭 (GET /health/db-pool)
+pool_metrics = {
+    "sync": PoolMetrics("sync"),
+    "async": PoolMetrics("async"),
+}
+
+# 데이터베이스 엔진 생성 (프로세스당 하나)
+engine = create_db_engine(metrics=pool_metrics["sync"])
 
 # 세션 팩토리
 SessionLocal = sessionmaker(
@@ -18,6 +65,17 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 엔진 (async def 라우터용, 이벤트 루프를 막지 않음)
+async_engine = create_async_db_engine(metrics=pool_metrics["async"])
+
+# 비동기 세션 팩토리 (커밋 후에도 응답 직렬화에서 속성을 읽을 수 있도록 expire하지 않음)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # ORM 베이스 클래스
 Base = declarative_base()
 
@@ -32,4 +90,27 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """
+    async def 라우터용 비동기 DB 세션 생성기
+    DB 대기 중에도 이벤트 루프가 다른 요청을 처리할 수 있습니다
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def pool_status() -> Dict[str, Any]:
+    """현재 워커 프로세스의 커넥션 풀 상태/통계"""
+    return {
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        },
+        "sync": pool_metrics["sync"].snapshot(engine.pool),
+        "async": pool_metrics["async"].snapshot(async_engine.sync_engine.pool),
+    }
@@ -0,0 +1,107 @@
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 사용 통계
+    체크아웃 대기 시간(풀이 가득 찼을 때 기다린 시간)과 타임아웃 횟수로 워커별 풀 크기를 조정합니다
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def attach(self, engine) -> None:
+        """엔진 풀에 메트릭 연결 (sync 엔진 / AsyncEngine.sync_engine)"""
+        engine.pool._metrics = self
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                self.checkouts += 1
+
+        @event.listens_for(engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            with self._lock:
+                self.checkins += 1
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            stats = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 4),
+                "wait_seconds_max": round(self.wait_seconds_max, 4),
+                "wait_seconds_avg": (
+                    round(self.wait_seconds_total / attempts, 6) if attempts else None
+                ),
+            }
+        # 현재 풀 상태 (QueuePool 계열만 제공)
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            })
+        return {"name": self.name, "pid": os.getpid(), **stats}
+
+
+class _InstrumentedPoolMixin:
+    """커넥션을 꺼낼 때 걸린 시간 측정 (풀이 비어 있으면 반납을 기다린 시간이 포함됨)"""
+
+    _metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.record_wait(time.perf_counter() - start, timed_out)
+
+    def recreate(self):
+        # engine.dispose() 후 새 풀에도 같은 메트릭을 유지
+        pool = super().recreate()
+        pool._metrics = self._metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
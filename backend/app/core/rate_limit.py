@@ -0,0 +1,169 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from .cache import redis_client
+
+
+def _sliding_count(previous: int, current: int, window: int, now: float) -> float:
+    """
+    슬라이딩 윈도우 카운터: 직전 고정 윈도우 요청 수를 지난 비율만큼 빼고 현재 윈도우 요청 수를 더함
+    요청 타임스탬프를 모두 보관하지 않고 키당 카운터 2개로 근사합니다
+    """
+    elapsed = (now % window) / window
+    return previous * (1 - elapsed) + current
+
+
+class InMemoryRateLimiter:
+    """
+    프로세스 내 슬라이딩 윈도우 카운터 (키당 O(1) 메모리/연산)
+    max_keys를 넘거나 2개 윈도우 이상 요청이 없던 키는 오래된 순서로 제거합니다
+    워커 프로세스마다 따로 세므로, 여러 워커에서 한도를 공유하려면 RedisRateLimiter를 사용합니다
+    """
+
+    blocking = False
+
+    def __init__(self, limit: int, window: int, max_keys: int = 10000, clock: Callable[[], float] = time.time):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key → [윈도우 번호, 현재 윈도우 요청 수, 직전 윈도우 요청 수] (최근 사용 순)
+        self._counters: "OrderedDict[str, list]" = OrderedDict()
+
+    def _counter(self, key: str, window_id: int) -> list:
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = [window_id, 0, 0]
+            self._counters[key] = counter
+        elif counter[0] != window_id:
+            # 한 윈도우만 지났으면 현재 → 직전으로 이동, 그 이상 지났으면 둘 다 0
+            previous = counter[1] if counter[0] == window_id - 1 else 0
+            counter[:] = [window_id, 0, previous]
+        self._counters.move_to_end(key)
+        return counter
+
+    def _evict(self, window_id: int) -> None:
+        while self._counters:
+            key, counter = next(iter(self._counters.items()))
+            if len(self._counters) <= self.max_keys and counter[0] >= window_id - 1:
+                break
+            del self._counters[key]
+
+    def hit(self, key: str) -> bool:
+        """요청 1건 기록, 한도 초과면 기록하지 않고 False"""
+        now = self._clock()
+        window_id = int(now // self.window)
+        with self._lock:
+            counter = self._counter(key, window_id)
+            allowed = _sliding_count(counter[2], counter[1], self.window, now) < self.limit
+            if allowed:
+                counter[1] += 1
+            self._evict(window_id)
+        return allowed
+
+    def status(self, key: str) -> Dict[str, Any]:
+        now = self._clock()
+        window_id = int(now // self.window)
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None or counter[0] < window_id - 1:
+                used = 0.0
+            elif counter[0] == window_id - 1:
+                used = _sliding_count(counter[1], 0, self.window, now)
+            else:
+                used = _sliding_count(counter[2], counter[1], self.window, now)
+        return _status(self, used)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "tracked_keys": len(self._counters), "max_keys": self.max_keys}
+
+
+class RedisRateLimiter:
+    """
+    Redis 공유 슬라이딩 윈도우 카운터 (모든 워커가 같은 한도를 사용)
+    get / incr / decr / expire와 MULTI 파이프라인만 사용하므로 같은 인터페이스의 클라이언트(fakeredis 등)로 대체할 수 있습니다
+    카운터 키는 2개 윈도우 후 만료되어 메모리가 한정됩니다
+    Redis 장애 시에는 요청을 허용합니다 (fail-open)
+    동기 클라이언트이므로 async 핸들러에서는 run_backend로 호출합니다 (이벤트 루프를 Redis 왕복 동안 막지 않도록)
+    """
+
+    blocking = True
+
+    def __init__(self, client, limit: int, window: int, prefix: str = "smartstock:ratelimit:",
+                 clock: Callable[[], float] = time.time):
+        self.client = client
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+        self._clock = clock
+        self.errors = 0
+
+    def _keys(self, key: str, window_id: int):
+        return f"{self.prefix}{key}:{window_id}", f"{self.prefix}{key}:{window_id - 1}"
+
+    def _used(self, key: str, now: float) -> float:
+        current_key, previous_key = self._keys(key, int(now // self.window))
+        current = int(self.client.get(current_key) or 0)
+        previous = int(self.client.get(previous_key) or 0)
+        return _sliding_count(previous, current, self.window, now)
+
+    def hit(self, key: str) -> bool:
+        """
+        요청 1건 기록, 한도 초과면 기록을 되돌리고 False
+        조회 후 증가(check-then-act)하면 여러 워커가 같은 값을 보고 동시에 통과하므로,
+        INCR/EXPIRE/직전 윈도우 조회를 MULTI로 한 번에 실행하고 증가된 값으로 판단합니다
+        (동시 요청마다 서로 다른 카운터 값을 받으므로 한도를 넘겨 통과하는 요청이 없음)
+        """
+        now = self._clock()
+        current_key, previous_key = self._keys(key, int(now // self.window))
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.incr(current_key)
+            pipe.expire(current_key, self.window * 2)
+            pipe.get(previous_key)
+            current, _, previous = pipe.execute()
+            # 이번 요청 이전까지의 사용량으로 판단 (InMemoryRateLimiter와 같은 기준)
+            if _sliding_count(int(previous or 0), int(current) - 1, self.window, now) < self.limit:
+                return True
+            self.client.decr(current_key)
+            return False
+        except Exception:
+            self.errors += 1
+            return True
+
+    def status(self, key: str) -> Dict[str, Any]:
+        try:
+            used = self._used(key, self._clock())
+        except Exception:
+            self.errors += 1
+            used = 0.0
+        return _status(self, used)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "errors": self.errors}
+
+
+def _status(limiter, used: float) -> Dict[str, Any]:
+    requests_made = math.ceil(used)
+    return {
+        "requests_made": requests_made,
+        "rate_limit": limiter.limit,
+        "remaining": max(0, limiter.limit - requests_made),
+        "time_window_seconds": limiter.window,
+    }
+
+
+def create_rate_limiter(limit: int, window: int, backend: str = "memory",
+                        max_keys: int = 10000, redis_url: Optional[str] = None):
+    """설정값(memory / redis)에 맞는 요청 제한기 생성"""
+    if backend == "memory":
+        return InMemoryRateLimiter(limit, window, max_keys=max_keys)
+    if backend == "redis":
+        if not redis_url:
+            raise RuntimeError("redis 요청 제한 백엔드를 사용하려면 REDIS_URL을 설정해야 합니다")
+        return RedisRateLimiter(redis_client(redis_url), limit, window)
+    raise ValueError(f"지원하지 않는 요청 제한 백엔드입니다: {backend} (허용: memory, redis)")
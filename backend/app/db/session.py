@@ -1,10 +1,2 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
-
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,  # 끊어진 커넥션 자동복구
-    future=True,
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+# 호환용: 엔진/세션은 app.core.database 하나만 사용합니다 (커넥션 풀 중복 방지)
+from app.core.database import SessionLocal, engine  # noqa: F401
@@ -3,10 +3,13 @@ from fastapi.middleware.cors import CORSMiddleware
 
 import app.models  # 모든 모델 매퍼를 미리 로드(중요)
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from app.core.database import get_db
-from app.routers import upload, analytics, prediction, chatbot_api
+from app.core.database import get_async_db, pool_status
+from app.routers import upload, analytics, prediction, chatbot_api, embed
+from app.services.prediction_service import fail_stale_prediction_jobs, prediction_pool
+from app.services.retrieval_service import retrieval_service
+from app.services.upload_service import fail_stale_upload_jobs, upload_pool
 from pathlib import Path
 from fastapi.staticfiles import StaticFiles
 
@@ -31,14 +34,36 @@ app.include_router(upload.router, prefix="/api/v1", tags=["upload"])
 app.include_router(analytics.router, prefix="/api/v1/analytics", tags=["analytics"])
 app.include_router(prediction.router, prefix="/api/v1/prediction", tags=["prediction"])
 app.include_router(chatbot_api.router, prefix="/api/v1/chatbot", tags=["chatbot"])
+app.include_router(embed.router, prefix="/api/v1", tags=["embed"])
 
 # ================================
 
+@app.on_event("startup")
+def recover_jobs():
+    """재시작/크래시로 중단된 업로드/예측 작업(pending/processing으로 남은 작업)을 실패로 정리"""
+    fail_stale_upload_jobs()
+    fail_stale_prediction_jobs()
+
+
+@app.on_event("shutdown")
+def shutdown_workers():
+    """예측 작업 프로세스 풀 / 업로드 작업 스레드 풀 / 검색 색인 스레드 종료"""
+    prediction_pool.shutdown()
+    upload_pool.shutdown()
+    retrieval_service.shutdown()
+
+
+@app.on_event("shutdown")
+async def close_openai_client():
+    """OpenAI HTTP 커넥션 풀 종료"""
+    await chatbot_api.close_client()
+
+
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """서버 및 DB 연결 상태 확인"""
     try:
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         db_status = "connected ✅"
     except Exception as e:
         db_status = f"error: {str(e)}"
@@ -50,6 +75,11 @@ async def health_check(db: Session = Depends(get_db)):
         "database": db_status
     }
 
+@app.get("/health/db-pool")
+async def db_pool_health():
+    """커넥션 풀 크기/사용량/대기 시간 (워커 프로세스별 값, pid로 구분)"""
+    return pool_status()
+
 @app.get("/")
 async def root():
     return {
@@ -4,3 +4,5 @@ from .user import User
 from .product import Product
 from .sales import Sales
 from .upload_job import UploadJob
+from .prediction_job import PredictionJob
+from .sales_monthly import SalesMonthly
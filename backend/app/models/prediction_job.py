@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from .base import BaseModel
+
+
+class PredictionJob(BaseModel):
+    """비동기 예측 작업"""
+    __tablename__ = "prediction_jobs"
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False, index=True, comment="소속 회사")
+    stored_filename = Column(String(255), nullable=False, comment="예측 대상 업로드 파일명")
+
+    # 작업 상태
+    status = Column(String(50), default="pending", nullable=False, comment="상태(pending/processing/completed/failed)")
+    progress = Column(Integer, default=0, nullable=False, comment="진행률(0~100)")
+    error_message = Column(Text, comment="에러 메시지")
+    started_at = Column(DateTime, comment="처리 시작 시각")
+    finished_at = Column(DateTime, comment="처리 종료 시각")
+
+    # 결과
+    total_products = Column(Integer, comment="예측 상품 수")
+    csv_path = Column(String(500), comment="결과 CSV 경로")
+    xlsx_path = Column(String(500), comment="결과 XLSX 경로")
+
+    # Relationship
+    tenant = relationship("Tenant", backref="prediction_jobs")
+
+    def __repr__(self):
+        return f"<PredictionJob(id={self.id}, filename='{self.stored_filename}', status='{self.status}')>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -6,6 +6,9 @@ from .base import BaseModel
 class Product(BaseModel):
     """제품/SKU 정보"""
     __tablename__ = "products"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "sku", name="uq_products_tenant_sku"),
+    )
     
     tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False, index=True, comment="소속 회사")
     sku = Column(String(100), nullable=False, index=True, comment="제품 코드")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, Date, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Date, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -6,8 +6,13 @@ from .base import BaseModel
 class Sales(BaseModel):
     """판매 데이터"""
     __tablename__ = "sales"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "product_id", "sale_date", name="uq_sales_tenant_product_date"),
+        # 월별 집계 갱신(회사 + 기간 필터, 제품별 수량/매출 합계)용 커버링 인덱스
+        Index("ix_sales_tenant_date_product_qty_rev", "tenant_id", "sale_date", "product_id", "quantity", "revenue"),
+    )
     
-    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False, index=True, comment="소속 회사")
+    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False, comment="소속 회사")
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True, comment="제품")
     sale_date = Column(Date, nullable=False, index=True, comment="판매일")
     quantity = Column(Float, nullable=False, comment="판매량")
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, Float, Date, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from .base import BaseModel
+
+
+class SalesMonthly(BaseModel):
+    """월별 판매 집계 (sales 적재 시 갱신되는 롤업 테이블)"""
+    __tablename__ = "sales_monthly"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "product_id", "period", name="uq_sales_monthly_tenant_product_period"),
+        # 분석 쿼리(회사 + 기간 필터, 제품별 수량 합계)용 커버링 인덱스
+        Index("ix_sales_monthly_tenant_period_product_qty", "tenant_id", "period", "product_id", "quantity"),
+    )
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id"), nullable=False, comment="소속 회사")
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True, comment="제품")
+    period = Column(Date, nullable=False, comment="집계 월(해당 월 1일)")
+    quantity = Column(Float, nullable=False, comment="월 판매량")
+    revenue = Column(Float, comment="월 매출액")
+
+    # Relationship
+    tenant = relationship("Tenant")
+    product = relationship("Product")
+
+    def __repr__(self):
+        return f"<SalesMonthly(tenant_id={self.tenant_id}, product_id={self.product_id}, period={self.period}, quantity={self.quantity})>"
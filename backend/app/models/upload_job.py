@@ -19,10 +19,13 @@ class UploadJob(BaseModel):
     file_size = Column(Integer, comment="파일 크기(bytes)")
     file_type = Column(String(50), comment="파일 타입(csv/xlsx)")
     encoding = Column(String(20), comment="파일 인코딩(utf-8/cp949)")
+    checksum = Column(String(32), index=True, comment="파일 체크섬(MD5)")
+    parquet_filename = Column(String(255), comment="파싱 결과 Parquet 사본 파일명")
     
     # 업로드 상태
     status = Column(String(50), default="pending", nullable=False, comment="상태(pending/processing/completed/failed)")
     error_message = Column(Text, comment="에러 메시지")
+    rows_processed = Column(Integer, default=0, comment="처리된 행 수(진행률)")
     
     # 데이터 프로파일
     total_rows = Column(Integer, comment="총 행 수")
@@ -1,35 +1,67 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
 from datetime import date, timedelta
-from app.core.database import get_db
-from app.models.sales import Sales
+from app.core.cache import analytics_cache
+from app.core.database import get_async_db
+from app.models.sales_monthly import SalesMonthly
 from app.models.product import Product
 
 router = APIRouter()
 
-@router.get("/summary")
-async def get_analytics_summary(tenant_id: int = 1, months: int = 6, db: Session = Depends(get_db)):
-    # 최근 months개월 기준
+
+def month_range(months: int):
+    """최근 months개월 [start, end) 범위 (이번 달 제외)"""
     end = date.today().replace(day=1)
     start = (end - timedelta(days=months*31)).replace(day=1)
+    return start, end
+
 
-    q = (
-        db.query(
-            extract('year', Sales.sale_date).label('y'),
-            extract('month', Sales.sale_date).label('m'),
-            func.sum(Sales.quantity).label('qty')
+def summary_query(tenant_id: int, start: date, end: date):
+    """월별 판매량 집계 쿼리 (sales_monthly 롤업, ix_sales_monthly_tenant_period_product_qty 커버링 인덱스 사용)"""
+    return (
+        select(
+            SalesMonthly.period.label('period'),
+            func.sum(SalesMonthly.quantity).label('qty')
         )
-        .filter(Sales.tenant_id == tenant_id, Sales.sale_date >= start, Sales.sale_date < end)
-        .group_by('y','m')
-        .order_by('y','m')
-    ).all()
+        .where(SalesMonthly.tenant_id == tenant_id, SalesMonthly.period >= start, SalesMonthly.period < end)
+        .group_by(SalesMonthly.period)
+        .order_by(SalesMonthly.period)
+    )
+
+
+def top_products_query(tenant_id: int, start: date, end: date, top_n: int):
+    """제품별 판매량 상위 N개 쿼리 (sales_monthly 롤업, ix_sales_monthly_tenant_period_product_qty 커버링 인덱스 사용)"""
+    return (
+        select(
+            Product.name.label("name"),
+            func.sum(SalesMonthly.quantity).label("qty")
+        )
+        .join(Product, Product.id == SalesMonthly.product_id)
+        .where(SalesMonthly.tenant_id == tenant_id, SalesMonthly.period >= start, SalesMonthly.period < end)
+        .group_by(Product.name)
+        .order_by(func.sum(SalesMonthly.quantity).desc())
+        .limit(top_n)
+    )
+
+
+@router.get("/summary")
+async def get_analytics_summary(tenant_id: int = 1, months: int = 6, db: AsyncSession = Depends(get_async_db)):
+    # 판매 데이터는 업로드 완료 시에만 바뀌므로 캐시 우선 (업로드 완료 시 무효화)
+    cache_key, cached = await analytics_cache.lookup("summary", tenant_id, months=months)
+    if cached is not None:
+        return cached
+
+    # 최근 months개월 기준
+    start, end = month_range(months)
+
+    q = (await db.execute(summary_query(tenant_id, start, end))).all()
 
     # 월 라벨 & 실제수요
     month_rows = []
-    for y, m, qty in q:
+    for period, qty in q:
         month_rows.append({
-            "month": f"{int(m)}월",
+            "month": f"{period.month}월",
             "실제수요": float(qty or 0.0)
         })
 
@@ -50,24 +82,19 @@ async def get_analytics_summary(tenant_id: int = 1, months: int = 6, db: Session
         "total_value": 0
     }
 
-    return {"chart_data": month_rows, "kpi": kpi}
+    result = {"chart_data": month_rows, "kpi": kpi}
+    await analytics_cache.store(cache_key, result)
+    return result
 
 @router.get("/products")
-async def get_top_products(tenant_id: int = 1, months: int = 3, top_n: int = 10, db: Session = Depends(get_db)):
-    end = date.today().replace(day=1)
-    start = (end - timedelta(days=months*31)).replace(day=1)
+async def get_top_products(tenant_id: int = 1, months: int = 3, top_n: int = 10, db: AsyncSession = Depends(get_async_db)):
+    cache_key, cached = await analytics_cache.lookup("products", tenant_id, months=months, top_n=top_n)
+    if cached is not None:
+        return cached
 
-    q = (
-        db.query(
-            Product.name.label("name"),
-            func.sum(Sales.quantity).label("qty")
-        )
-        .join(Product, Product.id == Sales.product_id)
-        .filter(Sales.tenant_id == tenant_id, Sales.sale_date >= start, Sales.sale_date < end)
-        .group_by(Product.name)
-        .order_by(func.sum(Sales.quantity).desc())
-        .limit(top_n)
-    ).all()
+    start, end = month_range(months)
+
+    q = (await db.execute(top_products_query(tenant_id, start, end, top_n))).all()
 
     rows = []
     for name, qty in q:
@@ -75,4 +102,12 @@ async def get_top_products(tenant_id: int = 1, months: int = 3, top_n: int = 10,
         stock = max(int(forecast * 0.6), 0)            # 간이
         status = "부족" if stock < forecast*0.8 else ("심각" if stock < forecast*0.5 else "적정")
         rows.append({"name": name, "forecast": forecast, "stock": stock, "status": status})
+
+    await analytics_cache.store(cache_key, rows)
     return rows
+
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """분석 응답 캐시 적중/미스 통계"""
+    return analytics_cache.stats()
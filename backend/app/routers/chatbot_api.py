@@ -1,10 +1,19 @@
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import os
-from openai import OpenAI
+import json
+import httpx
+from openai import AsyncOpenAI
 import time
-from collections import defaultdict
+from app.core.cache import run_backend
+from app.core.config import settings
+from app.core.rate_limit import create_rate_limiter
+from app.services.chat_cache import create_chat_cache
+from app.services.retrieval_service import retrieval_service
+from app.services.token_budget import TokenCounter, fit_to_budget, merge_usage
 
 router = APIRouter()
 
@@ -12,23 +21,67 @@ router = APIRouter()
 from dotenv import load_dotenv
 load_dotenv()
 
+# OpenAI 호출 설정
+CHAT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None  # 로컬 스텁/프록시 서버 사용 시
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))                  # 요청 전체 제한 시간(초)
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))   # 연결 제한 시간(초)
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))            # 429/5xx/연결 오류 재시도 (지수 백오프)
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))  # 워커당 동시 연결 수
+
 # OpenAI 클라이언트 초기화
+# AsyncOpenAI + 공유 httpx 커넥션 풀: LLM 응답을 기다리는 동안 이벤트 루프가 다른 요청을 처리하고,
+# 요청마다 TCP/TLS 연결을 새로 맺지 않습니다
 try:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     if not OPENAI_API_KEY:
         print("⚠️ 경고: OPENAI_API_KEY가 설정되지 않았습니다.")
         client = None
     else:
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            base_url=OPENAI_BASE_URL,
+            max_retries=OPENAI_MAX_RETRIES,
+            timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_CONNECTIONS
+                )
+            )
+        )
         print("✅ OpenAI 클라이언트 초기화 성공")
 except Exception as e:
     print(f"❌ OpenAI 클라이언트 초기화 실패: {e}")
     client = None
 
-# Rate Limiting
-rate_limit_store = defaultdict(list)
-RATE_LIMIT = 50
-TIME_WINDOW = 3600
+
+async def embed_text(text: str) -> List[float]:
+    """유사 질문 캐시용 임베딩"""
+    result = await client.embeddings.create(model=settings.CHAT_CACHE_EMBEDDING_MODEL, input=text)
+    return result.data[0].embedding
+
+
+# 프롬프트 토큰 계산 (tiktoken 인코딩이 없으면 추정치)
+token_counter = TokenCounter(CHAT_MODEL)
+
+# 응답 캐시 (같은 질문 반복 시 OpenAI 호출 생략)
+chat_cache = create_chat_cache(embed=embed_text)
+
+
+async def close_client():
+    """앱 종료 시 OpenAI HTTP 커넥션 풀 정리"""
+    if client is not None:
+        await client.close()
+
+# Rate Limiting (IP당 CHAT_RATE_WINDOW초 동안 CHAT_RATE_LIMIT회)
+rate_limiter = create_rate_limiter(
+    settings.CHAT_RATE_LIMIT,
+    settings.CHAT_RATE_WINDOW,
+    backend=settings.RATE_LIMIT_BACKEND,
+    max_keys=settings.RATE_LIMIT_MAX_KEYS,
+    redis_url=settings.REDIS_URL
+)
 
 
 # ========== Pydantic 모델 ==========
@@ -41,28 +94,155 @@ class ChatRequest(BaseModel):
     messages: List[Message]
     temperature: Optional[float] = 0.3
     max_tokens: Optional[int] = 1000
+    use_cache: bool = True  # False면 캐시를 무시하고 새로 생성
+    tenant_id: Optional[int] = None  # 지정 시 해당 회사 업로드 데이터에서 관련 행을 찾아 컨텍스트로 추가
+    use_retrieval: bool = True
 
 
 class ChatResponse(BaseModel):
     success: bool
     response: str
+    cached: bool = False
+    metadata: Optional[Dict[str, Any]] = None  # 프롬프트 토큰 수, 생략된 대화 수, OpenAI usage
 
 
 # ========== Rate Limiting ==========
-def check_rate_limit(client_ip: str) -> bool:
-    """시간당 요청 제한 체크"""
-    now = time.time()
+async def check_rate_limit(client_ip: str) -> bool:
+    """시간당 요청 제한 체크 (Redis 백엔드는 스레드풀에서 호출)"""
+    return await run_backend(rate_limiter, rate_limiter.hit, client_ip)
+
+
+# ========== 요청 처리 공통 ==========
+async def prepare_messages(request: ChatRequest, req: Request) -> List[dict]:
+    """클라이언트/요청 한도/메시지 검증 후 OpenAI 메시지 형식으로 변환"""
+    # OpenAI 클라이언트 확인
+    if not client or not OPENAI_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="OpenAI API 키가 설정되지 않았습니다. .env 파일을 확인해주세요."
+        )
     
-    rate_limit_store[client_ip] = [
-        timestamp for timestamp in rate_limit_store[client_ip]
-        if now - timestamp < TIME_WINDOW
-    ]
+    # 클라이언트 IP
+    client_ip = req.client.host if req.client else "unknown"
+    
+    # Rate Limiting
+    if not await check_rate_limit(client_ip):
+        raise HTTPException(
+            status_code=429,
+            detail="요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
+        )
+    
+    # 메시지 검증
+    if not request.messages:
+        raise HTTPException(
+            status_code=400,
+            detail="최소 하나 이상의 메시지가 필요합니다."
+        )
     
-    if len(rate_limit_store[client_ip]) >= RATE_LIMIT:
-        return False
+    # 메시지 형식 변환
+    return [
+        {"role": msg.role, "content": msg.content} 
+        for msg in request.messages
+    ]
+
+
+RETRIEVAL_PROMPT = (
+    "아래는 사용자 질문과 관련해 회사 업로드 데이터에서 검색한 행입니다. "
+    "숫자(판매량/재고/매출 등)가 있으면 근거로 명확히 언급하고, 데이터에 없는 내용은 추측하지 마세요.\n\n"
+    "=== 검색된 데이터 ===\n{context}"
+)
+
+
+async def add_retrieval_context(request: ChatRequest, messages: List[dict]) -> List[dict]:
+    """마지막 사용자 질문으로 업로드 데이터를 검색해 system 메시지로 추가 (검색 실패 시 원래 메시지 사용)"""
+    if not (settings.RETRIEVAL_ENABLED and request.use_retrieval and request.tenant_id is not None):
+        return messages
+    question = next((m["content"] for m in reversed(messages) if m["role"] == "user"), None)
+    if not question:
+        return messages
+
+    try:
+        matches = await run_in_threadpool(retrieval_service.search, request.tenant_id, question)
+    except Exception as e:
+        print(f"⚠️ 업로드 데이터 검색 실패: {e}")
+        return messages
+    if not matches:
+        return messages
+
+    context = "\n".join(f"- {m['text']}" for m in matches)
+    # 기존 system 메시지(역할 지시) 뒤에 삽입
+    position = 0
+    while position < len(messages) and messages[position]["role"] == "system":
+        position += 1
+    return messages[:position] + [{"role": "system", "content": RETRIEVAL_PROMPT.format(context=context)}] + messages[position:]
+
+
+def fit_context(messages: List[dict]) -> tuple:
+    """CHAT_CONTEXT_TOKEN_BUDGET에 맞게 오래된 대화 생략, (메시지, 토큰 메타데이터) 반환"""
+    return fit_to_budget(messages, token_counter, settings.CHAT_CONTEXT_TOKEN_BUDGET)
+
+
+def to_http_error(e: Exception) -> HTTPException:
+    """OpenAI 호출 오류 → HTTPException"""
+    error_message = str(e)
     
-    rate_limit_store[client_ip].append(now)
-    return True
+    if "rate_limit" in error_message.lower():
+        return HTTPException(
+            status_code=429, 
+            detail="OpenAI API 사용량 한도 초과"
+        )
+    elif "authentication" in error_message.lower() or "api_key" in error_message.lower():
+        return HTTPException(
+            status_code=500, 
+            detail="OpenAI API 인증 오류. API 키를 확인해주세요."
+        )
+    else:
+        return HTTPException(
+            status_code=500,
+            detail=f"AI 응답 생성 중 오류: {error_message}"
+        )
+
+
+async def get_cached_response(request: ChatRequest, messages: List[dict]) -> Optional[str]:
+    """캐시된 응답 조회 (use_cache=False면 조회하지 않음)"""
+    if not chat_cache:
+        return None
+    if not request.use_cache:
+        chat_cache.note_bypass()
+        return None
+    return await chat_cache.get(messages, CHAT_MODEL, request.temperature, request.max_tokens)
+
+
+def sse_event(data: str, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {data}\n\n"
+
+
+async def relay_stream(stream, req: Request, on_complete=None):
+    """
+    OpenAI 스트림 청크 → SSE 이벤트
+    클라이언트가 연결을 끊으면(또는 서버가 응답 태스크를 취소하면) finally에서 스트림을 닫아
+    OpenAI 쪽 생성도 중단되도록 합니다
+    on_complete: 스트림이 끝까지 전송된 경우 전체 응답 텍스트로 호출 (캐시 저장용)
+    """
+    parts = []
+    try:
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                parts.append(content)
+                yield sse_event(json.dumps({"content": content}, ensure_ascii=False))
+            # 다음 청크를 읽기 전에 확인 (끊긴 뒤에는 스트림에서 더 읽지 않음)
+            if await req.is_disconnected():
+                break
+        else:
+            if on_complete is not None and parts:
+                await on_complete("".join(parts))
+            yield sse_event("[DONE]")
+    except Exception as e:
+        yield sse_event(json.dumps({"detail": to_http_error(e).detail}, ensure_ascii=False), event="error")
+    finally:
+        await stream.close()
 
 
 # ========== API 엔드포인트 ==========
@@ -85,9 +265,10 @@ async def chatbot_health():
     return {
         "status": "ok",
         "message": "챗봇 서비스가 정상 작동 중입니다.",
-        "model": "gpt-4o-mini",
+        "model": CHAT_MODEL,
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "api_key_configured": "✅" if OPENAI_API_KEY else "❌"
+        "api_key_configured": "✅" if OPENAI_API_KEY else "❌",
+        "cache": chat_cache.stats() if chat_cache else None
     }
 
 
@@ -101,91 +282,100 @@ async def chat_completion(request: ChatRequest, req: Request):
     - **max_tokens**: 최대 토큰 수
     """
     try:
-        # OpenAI 클라이언트 확인
-        if not client or not OPENAI_API_KEY:
-            raise HTTPException(
-                status_code=500,
-                detail="OpenAI API 키가 설정되지 않았습니다. .env 파일을 확인해주세요."
-            )
+        messages = await prepare_messages(request, req)
+        messages = await add_retrieval_context(request, messages)
+        messages, metadata = fit_context(messages)
         
-        # 클라이언트 IP
-        client_ip = req.client.host if req.client else "unknown"
+        # 캐시 확인
+        cached = await get_cached_response(request, messages)
+        if cached is not None:
+            return ChatResponse(success=True, response=cached, cached=True, metadata=metadata)
         
-        # Rate Limiting
-        if not check_rate_limit(client_ip):
-            raise HTTPException(
-                status_code=429,
-                detail="요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
-            )
-        
-        # 메시지 검증
-        if not request.messages:
-            raise HTTPException(
-                status_code=400,
-                detail="최소 하나 이상의 메시지가 필요합니다."
-            )
-        
-        # 메시지 형식 변환
-        messages = [
-            {"role": msg.role, "content": msg.content} 
-            for msg in request.messages
-        ]
-        
-        # OpenAI API 호출
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
+        # OpenAI API 호출 (비동기, 재시도/타임아웃은 클라이언트 설정을 따름)
+        completion = await client.chat.completions.create(
+            model=CHAT_MODEL,
             messages=messages,
             temperature=request.temperature,
             max_tokens=request.max_tokens
         )
         
         response_content = completion.choices[0].message.content
+        if chat_cache and response_content:
+            await chat_cache.put(messages, CHAT_MODEL, request.temperature, request.max_tokens, response_content)
         
         return ChatResponse(
             success=True,
-            response=response_content
+            response=response_content,
+            metadata=merge_usage(metadata, completion.usage)
         )
     
     except HTTPException:
         raise
     
     except Exception as e:
-        error_message = str(e)
-        
-        if "rate_limit" in error_message.lower():
-            raise HTTPException(
-                status_code=429, 
-                detail="OpenAI API 사용량 한도 초과"
-            )
-        elif "authentication" in error_message.lower() or "api_key" in error_message.lower():
-            raise HTTPException(
-                status_code=500, 
-                detail="OpenAI API 인증 오류. API 키를 확인해주세요."
-            )
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail=f"AI 응답 생성 중 오류: {error_message}"
-            )
+        raise to_http_error(e)
+
+
+@router.post("/chat/stream")
+async def chat_completion_stream(request: ChatRequest, req: Request):
+    """
+    AI 챗봇 응답 스트리밍 (Server-Sent Events)
+    
+    - 첫 이벤트 `event: metadata`로 프롬프트 토큰 수/생략된 대화 수 전달
+    - 토큰이 생성되는 대로 `data: {"content": "..."}` 이벤트로 전달
+    - 정상 종료 시 `data: [DONE]`, 오류 시 `event: error`
+    - 클라이언트 연결이 끊기면 OpenAI 스트림을 닫아 생성을 중단합니다
+    """
+    messages = await prepare_messages(request, req)
+    messages = await add_retrieval_context(request, messages)
+    messages, metadata = fit_context(messages)
+    metadata_event = sse_event(json.dumps(metadata, ensure_ascii=False), event="metadata")
+
+    # 캐시 적중 시 전체 응답을 한 번에 전송
+    cached = await get_cached_response(request, messages)
+    if cached is not None:
+        async def replay():
+            yield metadata_event
+            yield sse_event(json.dumps({"content": cached, "cached": True}, ensure_ascii=False))
+            yield sse_event("[DONE]")
+        return StreamingResponse(replay(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+    # 끝까지 전송된 응답만 캐시에 저장
+    async def store(content: str):
+        if chat_cache:
+            await chat_cache.put(messages, CHAT_MODEL, request.temperature, request.max_tokens, content)
+
+    # 첫 요청 단계의 오류(인증, 한도 등)는 스트림 시작 전에 일반 HTTP 오류로 반환
+    try:
+        stream = await client.chat.completions.create(
+            model=CHAT_MODEL,
+            messages=messages,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            stream=True
+        )
+    except Exception as e:
+        raise to_http_error(e)
+
+    async def events():
+        yield metadata_event
+        async for event in relay_stream(stream, req, on_complete=store):
+            yield event
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/rate-limit-status")
 async def get_rate_limit_status(req: Request):
     """Rate limit 상태 확인"""
     client_ip = req.client.host if req.client else "unknown"
-    now = time.time()
-    
-    recent_requests = [
-        timestamp for timestamp in rate_limit_store.get(client_ip, [])
-        if now - timestamp < TIME_WINDOW
-    ]
-    
-    remaining = max(0, RATE_LIMIT - len(recent_requests))
     
     return {
         "client_ip": client_ip,
-        "requests_made": len(recent_requests),
-        "rate_limit": RATE_LIMIT,
-        "remaining": remaining,
-        "time_window_seconds": TIME_WINDOW
+        **(await run_backend(rate_limiter, rate_limiter.status, client_ip)),
+        "limiter": rate_limiter.stats()
     }
\ No newline at end of file
@@ -0,0 +1,86 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.upload_job import UploadJob
+from app.services.retrieval_service import retrieval_service
+from app.utils.file_handler import FileHandler
+
+
+router = APIRouter(prefix="/embed")
+
+
+class QueryRequest(BaseModel):
+    question: str
+    tenant_id: int = 1
+    top_k: Optional[int] = None
+
+
+@router.get("/status")
+async def get_index_status(tenant_id: Optional[int] = None):
+    """검색 인덱스 상태 (임베딩 모델, 인덱스 종류, 회사별 색인 행 수)"""
+    return await run_in_threadpool(retrieval_service.status, tenant_id)
+
+
+@router.post("/query")
+async def query_rows(request: QueryRequest):
+    """질문과 가장 가까운 업로드 행 검색"""
+    if not settings.RETRIEVAL_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="업로드 데이터 검색이 비활성화되어 있습니다."
+        )
+
+    matches = await run_in_threadpool(
+        retrieval_service.search, request.tenant_id, request.question, request.top_k
+    )
+    return {"question": request.question, "matches": matches}
+
+
+@router.post("/reindex", status_code=status.HTTP_202_ACCEPTED)
+def reindex_uploads(tenant_id: int = 1, db: Session = Depends(get_db)):
+    """
+    완료된 업로드 데이터를 다시 읽어 색인 (검색 기능 도입 전 업로드분 백필용, Parquet 사본 사용)
+    업로드 완료 시와 같은 백그라운드 색인 대기열에 넣고 바로 반환합니다 (진행 상황은 /embed/status)
+    대기열이 가득 차 넣지 못한 업로드는 skipped로 반환하며, 이미 색인된 행은 건너뛰므로 다시 실행하면 됩니다
+    """
+    if not settings.RETRIEVAL_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="업로드 데이터 검색이 비활성화되어 있습니다."
+        )
+
+    file_handler = FileHandler(upload_dir="uploads")
+    uploads = db.query(UploadJob).filter(
+        UploadJob.tenant_id == tenant_id,
+        UploadJob.status == "completed"
+    ).order_by(UploadJob.id).all()
+
+    queued, skipped, missing = [], [], []
+    for upload in uploads:
+        file_path = file_handler.upload_dir / upload.stored_filename
+        if not file_path.exists() and not file_handler.parquet_path(upload.stored_filename).exists():
+            missing.append(upload.stored_filename)
+            continue
+        stored_filename, encoding = upload.stored_filename, upload.encoding
+        future = retrieval_service.index_upload_async(
+            tenant_id,
+            upload.id,
+            lambda stored_filename=stored_filename, encoding=encoding: file_handler.load_upload(
+                stored_filename, encoding=encoding
+            ),
+        )
+        (queued if future is not None else skipped).append(upload.id)
+
+    return {
+        "tenant_id": tenant_id,
+        "uploads": len(uploads),
+        "queued": queued,
+        "skipped": skipped,
+        "missing_files": missing,
+    }
@@ -1,10 +1,21 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 from app.models.upload_job import UploadJob
-from app.core.database import get_db
-from app.services.upload_service import UploadService
+from app.core.database import get_async_db, get_db
+from app.services.upload_service import (
+    UploadService,
+    FileTooLargeError,
+    STALE_JOB_MESSAGE,
+    UploadQueueFull,
+    is_stale_upload_job,
+    INGEST_MODES,
+    DEFAULT_INGEST_MODE,
+)
 from app.schemas.upload import UploadJobResponse, UploadProfileResponse
+from app.utils.file_handler import FileHandler
 from pathlib import Path
 import os
 
@@ -16,13 +27,21 @@ MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 ALLOWED_EXTENSIONS = {'.csv', '.xlsx', '.xls'}
 
 
-@router.post("/", response_model=UploadJobResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=UploadJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def upload_file(
     file: UploadFile = File(...),
     tenant_id: int = 1,
+    mode: str = DEFAULT_INGEST_MODE,
     db: Session = Depends(get_db)
 ):
-    """파일 업로드 API"""
+    """
+    파일 업로드 API
+    
+    파일을 저장한 뒤 pending 상태의 업로드 작업을 바로 반환합니다 (202 Accepted)
+    처리 상태와 처리 행 수(rows_processed / total_rows)는 `GET /upload/{id}`로 확인합니다
+    
+    - **mode**: 판매 데이터 적재 방식 (append / replace-range / upsert-sum)
+    """
     
     # 파일명 검증
     if not file.filename:
@@ -39,21 +58,31 @@ async def upload_file(
             detail=f"지원하지 않는 파일 형식입니다. 허용: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # 파일 크기 검증
-    contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
+    # 적재 모드 검증
+    if mode not in INGEST_MODES:
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="파일 크기는 100MB를 초과할 수 없습니다"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 적재 모드입니다. 허용: {', '.join(INGEST_MODES)}"
         )
-    await file.seek(0)
     
-    # 파일 처리
+    # 파일 저장 (크기 검증은 청크 단위 저장 중에 수행, 파싱/적재는 업로드 작업 스레드에서 처리)
     service = UploadService(db)
     try:
-        upload_job = await service.process_upload(file, tenant_id)
+        upload_job = await service.process_upload(
+            file, tenant_id, max_file_size=MAX_FILE_SIZE, ingest_mode=mode
+        )
         return upload_job  # Pydantic 스키마를 직접 반환
         
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except UploadQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="대기 중인 업로드 작업이 너무 많습니다. 잠시 후 다시 시도해주세요."
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -67,41 +96,55 @@ async def upload_file(
 
 
 @router.get("/{upload_job_id}", response_model=UploadProfileResponse)
-def get_upload_profile(
+async def get_upload_profile(
     upload_job_id: int,
     tenant_id: int = 1,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """업로드된 파일의 프로파일 조회"""
-    service = UploadService(db)
-    result = service.get_upload_profile(upload_job_id, tenant_id)
+    """업로드된 파일의 처리 상태/진행률 및 프로파일 조회"""
+    upload_job = await db.scalar(
+        select(UploadJob).where(
+            UploadJob.id == upload_job_id,
+            UploadJob.tenant_id == tenant_id
+        )
+    )
     
-    if not result:
+    if not upload_job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="업로드 작업을 찾을 수 없습니다"
         )
+
+    # 시작 시 정리 이후 중단된 작업도 조회하는 쪽(진행률 폴링)에서 실패로 확인할 수 있도록 정리
+    if is_stale_upload_job(upload_job):
+        await db.execute(
+            update(UploadJob)
+            .where(UploadJob.id == upload_job.id, UploadJob.status.in_(("pending", "processing")))
+            .values(status="failed", error_message=STALE_JOB_MESSAGE)
+        )
+        await db.commit()
+        await db.refresh(upload_job)
     
-    return result  # Pydantic 스키마를 직접 반환
+    return UploadService.build_profile(upload_job)  # Pydantic 스키마를 직접 반환
 
 
 @router.get("/", response_model=List[UploadJobResponse])
-def list_uploads(
+async def list_uploads(
     tenant_id: int = 1,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """업로드 이력 목록 조회"""
-    from app.models.upload_job import UploadJob
-    
     limit = min(limit, 100)
     
-    uploads = db.query(UploadJob).filter(
-        UploadJob.tenant_id == tenant_id
-    ).order_by(
-        UploadJob.created_at.desc()
-    ).offset(skip).limit(limit).all()
+    uploads = (await db.scalars(
+        select(UploadJob).where(
+            UploadJob.tenant_id == tenant_id
+        ).order_by(
+            UploadJob.created_at.desc()
+        ).offset(skip).limit(limit)
+    )).all()
     
     # List comprehension으로 Pydantic 스키마 변환
     return [UploadJobResponse.model_validate(upload) for upload in uploads]
@@ -109,18 +152,20 @@ def list_uploads(
 
 UPLOAD_DIR = Path(__file__).resolve().parent.parent.parent / "uploads"
 @router.delete("/{stored_filename}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_upload(
+async def delete_upload(
     stored_filename: str,
     tenant_id: int = 1,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """stored_filename 기준으로 업로드 작업 및 실제 파일 삭제"""
 
     # DB에서 해당 항목 조회
-    upload = db.query(UploadJob).filter(
-        UploadJob.stored_filename == stored_filename,
-        UploadJob.tenant_id == tenant_id
-    ).first()
+    upload = await db.scalar(
+        select(UploadJob).where(
+            UploadJob.stored_filename == stored_filename,
+            UploadJob.tenant_id == tenant_id
+        ).limit(1)
+    )
 
     if not upload:
         raise HTTPException(
@@ -132,16 +177,17 @@ def delete_upload(
     file_path = UPLOAD_DIR / stored_filename
 
     try:
-        # 1️⃣ 실제 파일 삭제
+        # 1️⃣ 실제 파일 및 Parquet 사본 삭제
         if file_path.exists() and file_path.is_file():
             os.remove(file_path)
+        FileHandler(upload_dir=str(UPLOAD_DIR)).parquet_path(stored_filename).unlink(missing_ok=True)
 
         # 2️⃣ DB 레코드 삭제
-        db.delete(upload)
-        db.commit()
+        await db.delete(upload)
+        await db.commit()
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"삭제 중 오류 발생: {str(e)}"
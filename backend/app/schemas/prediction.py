@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class PredictionJobResponse(BaseModel):
+    """예측 작업 응답"""
+    id: int
+    tenant_id: int
+    stored_filename: str
+    status: str
+    progress: int
+    error_message: Optional[str]
+    total_products: Optional[int]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -9,10 +9,14 @@ class UploadJobResponse(BaseModel):
     tenant_id: int
     original_filename: str
     stored_filename: str
-    file_size: int
+    file_size: Optional[int] = None
     file_type: str
     encoding: Optional[str]
+    checksum: Optional[str] = None
+    parquet_filename: Optional[str] = None
     status: str
+    error_message: Optional[str] = None
+    rows_processed: Optional[int] = None
     total_rows: Optional[int]
     total_columns: Optional[int]
     null_count: Optional[int]
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.core.cache import create_backend, run_backend
+from app.core.config import settings
+
+
+def normalize_text(text: str) -> str:
+    """공백/대소문자 차이만 있는 질문을 같은 질문으로 취급"""
+    return " ".join(text.split()).casefold()
+
+
+class ChatResponseCache:
+    """
+    챗봇 응답 캐시
+    - 정확 일치: (정규화한 메시지 목록, 모델, temperature, max_tokens) 해시 → 응답 (LRU + TTL 백엔드)
+    - 유사 질문(선택): 이전 대화가 같고 마지막 질문의 임베딩 코사인 유사도가 threshold 이상이면
+      가장 가까운 질문의 캐시된 응답을 재사용 (임베딩 인덱스는 프로세스 내 LRU)
+      미스 시 get()에서 계산한 질문 임베딩은 이어지는 put()에서 재사용 (질문당 임베딩 API 호출 1회)
+    Redis 백엔드 호출은 run_backend로 스레드풀에서 실행합니다
+    """
+
+    def __init__(
+        self,
+        backend,
+        ttl: int,
+        embed: Optional[Callable[[str], Awaitable[List[float]]]] = None,
+        similarity_threshold: float = 0.95,
+        max_semantic_entries: int = 1024,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.embed = embed
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self._lock = threading.Lock()
+        # 정확 일치 키 → (문맥 키, 정규화된 임베딩)
+        self._vectors: "OrderedDict[str, tuple]" = OrderedDict()
+        # 미스 후 put() 대기 중인 정확 일치 키 → 정규화된 질문 임베딩 (put()에서 꺼내 씀)
+        self._pending: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._stats = {"hits": 0, "semantic_hits": 0, "misses": 0, "stores": 0, "bypassed": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _hash(payload: Any) -> str:
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def make_key(self, messages: List[Dict[str, str]], model: str, temperature: float, max_tokens: int) -> str:
+        normalized = [[m["role"], normalize_text(m["content"])] for m in messages]
+        return "chat:" + self._hash([model, temperature, max_tokens, normalized])
+
+    def _context_key(self, messages: List[Dict[str, str]], model: str, temperature: float, max_tokens: int) -> str:
+        """마지막 질문을 뺀 나머지(이전 대화 + 설정) 해시, 유사 질문 검색 범위"""
+        normalized = [[m["role"], normalize_text(m["content"])] for m in messages[:-1]]
+        return self._hash([model, temperature, max_tokens, normalized])
+
+    def note_bypass(self) -> None:
+        self._count("bypassed")
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        try:
+            vector = np.asarray(await self.embed(text), dtype=np.float32)
+        except Exception:
+            self._count("errors")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    async def _backend_get(self, key: str) -> Optional[str]:
+        try:
+            return await run_backend(self.backend, self.backend.get, key)
+        except Exception:
+            self._count("errors")
+            return None
+
+    def _remember_pending(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._pending[key] = vector
+            self._pending.move_to_end(key)
+            while len(self._pending) > self.max_semantic_entries:
+                self._pending.popitem(last=False)
+
+    async def get(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Optional[str]:
+        key = self.make_key(messages, model, temperature, max_tokens)
+        cached = await self._backend_get(key)
+        if cached is not None:
+            self._count("hits")
+            return cached
+
+        if self.embed is not None and messages and messages[-1]["role"] == "user":
+            similar_key, query = await self._find_similar(messages, model, temperature, max_tokens)
+            if similar_key is not None:
+                cached = await self._backend_get(similar_key)
+                if cached is not None:
+                    self._count("semantic_hits")
+                    return cached
+            if query is not None:
+                self._remember_pending(key, query)
+
+        self._count("misses")
+        return None
+
+    async def _find_similar(self, messages, model, temperature, max_tokens) -> tuple:
+        """(가장 가까운 질문의 키 또는 None, 질문 임베딩 또는 None)"""
+        with self._lock:
+            context = self._context_key(messages, model, temperature, max_tokens)
+            candidates = [(key, vec) for key, (ctx, vec) in self._vectors.items() if ctx == context]
+        if not candidates:
+            return None, None
+
+        query = await self._embed(messages[-1]["content"])
+        if query is None:
+            return None, None
+        scores = np.stack([vec for _, vec in candidates]) @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None, query
+        return candidates[best][0], query
+
+    async def put(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        response: str,
+    ) -> None:
+        key = self.make_key(messages, model, temperature, max_tokens)
+        with self._lock:
+            vector = self._pending.pop(key, None)
+        try:
+            await run_backend(self.backend, self.backend.set, key, response, self.ttl)
+            self._count("stores")
+        except Exception:
+            self._count("errors")
+            return
+
+        if self.embed is None or not messages or messages[-1]["role"] != "user":
+            return
+        if vector is None:
+            vector = await self._embed(messages[-1]["content"])
+        if vector is None:
+            return
+        with self._lock:
+            self._vectors[key] = (self._context_key(messages, model, temperature, max_tokens), vector)
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.max_semantic_entries:
+                self._vectors.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["semantic_entries"] = len(self._vectors)
+        lookups = stats["hits"] + stats["semantic_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["semantic_hits"]) / lookups, 4) if lookups else None
+        stats["backend"] = type(self.backend).__name__
+        stats["ttl"] = self.ttl
+        stats["semantic"] = self.embed is not None
+        return stats
+
+
+def create_chat_cache(embed: Optional[Callable[[str], Awaitable[List[float]]]] = None) -> Optional[ChatResponseCache]:
+    """설정에 따른 챗봇 응답 캐시 생성 (CHAT_CACHE_ENABLED=False면 None)"""
+    if not settings.CHAT_CACHE_ENABLED:
+        return None
+    backend = create_backend(settings.CHAT_CACHE_BACKEND, settings.CHAT_CACHE_MAX_ENTRIES, settings.REDIS_URL)
+    return ChatResponseCache(
+        backend,
+        ttl=settings.CHAT_CACHE_TTL,
+        embed=embed if settings.CHAT_CACHE_SEMANTIC else None,
+        similarity_threshold=settings.CHAT_CACHE_SIMILARITY,
+        max_semantic_entries=settings.CHAT_CACHE_MAX_ENTRIES,
+    )
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Sequence, Tuple
+
+
+def build_last_windows(
+    df: pd.DataFrame,
+    key_col: str,
+    feature_cols: Sequence[str],
+    seq_length: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    키(SKU)별 마지막 seq_length개 행을 한 번에 추출
+    df는 (key_col, 일자) 순으로 정렬되어 있어야 하며, 행 수가 seq_length 미만인 키는 제외합니다
+    반환: (키 배열, (n_key, seq_length, n_features) 배열)
+    """
+    keys = df[key_col].to_numpy()
+    if len(keys) == 0:
+        return keys, np.empty((0, seq_length, len(feature_cols)))
+
+    # 정렬된 데이터에서 키가 바뀌는 위치로 그룹 경계 계산
+    is_start = np.empty(len(keys), dtype=bool)
+    is_start[0] = True
+    is_start[1:] = keys[1:] != keys[:-1]
+    starts = np.flatnonzero(is_start)
+    ends = np.append(starts[1:], len(keys))
+
+    valid = (ends - starts) >= seq_length
+    row_idx = (ends[valid, None] - seq_length + np.arange(seq_length)).ravel()
+
+    windows = df[list(feature_cols)].iloc[row_idx].to_numpy(dtype=float)
+    return keys[starts[valid]], windows.reshape(-1, seq_length, len(feature_cols))
+
+
+class ForecastEngine:
+    """
+    다중 SKU 재귀 예측 엔진
+    모든 SKU의 시퀀스를 (n_sku, seq_length, n_features) 텐서로 쌓아
+    예측 일수만큼만 model.predict를 호출합니다
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        scaler_X: Any,
+        scaler_y: Any,
+        feedback_indices: Sequence[int],
+        horizon: int = 7,
+        batch_size: int = 512,
+    ):
+        self.model = model
+        self.scaler_X = scaler_X
+        self.scaler_y = scaler_y
+        # 예측값 i번째 → 다음 시퀀스의 feedback_indices[i] 피처로 반영
+        self.feedback_indices = list(feedback_indices)
+        self.horizon = horizon
+        self.batch_size = batch_size
+
+    def forecast(self, windows: np.ndarray) -> np.ndarray:
+        """
+        windows: (n_sku, seq_length, n_features) 원본 스케일 시퀀스
+        반환: (n_sku, horizon, n_targets) 원본 스케일 예측값 (소수점 2자리)
+        """
+        n_sku, seq_length, n_features = windows.shape
+        if n_sku == 0:
+            return np.empty((0, self.horizon, len(self.feedback_indices)))
+
+        # 스케일링은 행 단위이므로 SKU별로 따로 변환한 결과와 동일
+        current_seq = self.scaler_X.transform(
+            windows.reshape(-1, n_features)
+        ).reshape(n_sku, seq_length, n_features)
+
+        predictions_scaled = []
+        for _ in range(self.horizon):
+            pred_scaled = self.model.predict(current_seq, batch_size=self.batch_size, verbose=0)
+            predictions_scaled.append(pred_scaled)
+            # 다음 시퀀스 업데이트 (SKU별 루프와 동일한 순서로 반영 후 roll)
+            for target_idx, feature_idx in enumerate(self.feedback_indices):
+                current_seq[:, -1, feature_idx] = pred_scaled[:, target_idx]
+            current_seq = np.roll(current_seq, -1, axis=1)
+
+        # (horizon, n_sku, n_targets) → (n_sku, horizon, n_targets)
+        stacked = np.stack(predictions_scaled, axis=1)
+        n_targets = stacked.shape[-1]
+        predictions = self.scaler_y.inverse_transform(stacked.reshape(-1, n_targets))
+        predictions = np.round(predictions.astype(float), 2)
+        return predictions.reshape(n_sku, self.horizon, n_targets)
@@ -0,0 +1,158 @@
+import hashlib
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import joblib
+
+
+APP_DIR = Path(__file__).resolve().parent.parent
+MODEL_PATH = APP_DIR / "best_inventory_model.keras"
+SCALER_X_PATH = APP_DIR / "scaler_X.pkl"
+SCALER_Y_PATH = APP_DIR / "scaler_y.pkl"
+LE_PATH = APP_DIR / "label_encoders.pkl"
+
+
+class ModelBundle(NamedTuple):
+    """예측에 필요한 모델/스케일러/인코더 묶음"""
+    model: Any
+    scaler_X: Any
+    scaler_y: Any
+    le_dict: Dict[str, Any]
+    fingerprint: str
+
+
+def _current_rss() -> Optional[int]:
+    """현재 프로세스 RSS(bytes) 조회 (리눅스 외 환경에서는 None)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class ModelRegistry:
+    """
+    워커 프로세스당 한 번만 모델/스케일러/인코더를 로드하는 레지스트리
+    요청마다 파일의 mtime/크기를 확인하고, 변경된 경우에만 다시 로드합니다 (hot reload)
+    """
+
+    def __init__(
+        self,
+        model_path: Path = MODEL_PATH,
+        scaler_x_path: Path = SCALER_X_PATH,
+        scaler_y_path: Path = SCALER_Y_PATH,
+        le_path: Path = LE_PATH,
+    ):
+        self.paths = {
+            "model": Path(model_path),
+            "scaler_X": Path(scaler_x_path),
+            "scaler_y": Path(scaler_y_path),
+            "label_encoders": Path(le_path),
+        }
+        self._lock = threading.Lock()
+        self._bundle: Optional[ModelBundle] = None
+        self._signature = None
+        self._loaded_at: Optional[datetime] = None
+        self._load_seconds: Optional[float] = None
+        self._load_count = 0
+        self._memory: Dict[str, Any] = {}
+        self._fingerprints: Dict[Any, str] = {}
+
+    def _file_signature(self):
+        """아티팩트 파일들의 (mtime, size) 서명"""
+        signature = []
+        for name, path in self.paths.items():
+            stat = path.stat()
+            signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _fingerprint(self, signature) -> str:
+        """아티팩트 파일 내용 기반 해시 (모델 버전 식별용, 파일 서명별로 1회 계산)"""
+        if signature in self._fingerprints:
+            return self._fingerprints[signature]
+
+        sha = hashlib.sha256()
+        for name, path in self.paths.items():
+            sha.update(name.encode())
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+        self._fingerprints = {signature: sha.hexdigest()[:16]}
+        return self._fingerprints[signature]
+
+    def _load(self, signature) -> ModelBundle:
+        rss_before = _current_rss()
+        start = time.perf_counter()
+
+        # TensorFlow는 예측 워커 프로세스에서 모델을 처음 로드할 때만 import (API 프로세스/스크립트는 TF 없이 동작)
+        from tensorflow.keras.models import load_model
+
+        model = load_model(self.paths["model"])
+        scaler_X = joblib.load(self.paths["scaler_X"])
+        scaler_y = joblib.load(self.paths["scaler_y"])
+        le_dict = joblib.load(self.paths["label_encoders"])
+        fingerprint = self._fingerprint(signature)
+
+        self._load_seconds = round(time.perf_counter() - start, 3)
+        rss_after = _current_rss()
+
+        self._memory = {
+            "model_weights_bytes": int(sum(w.nbytes for w in model.get_weights())),
+            "artifact_file_bytes": {
+                name: path.stat().st_size for name, path in self.paths.items()
+            },
+            "rss_delta_bytes": (
+                rss_after - rss_before
+                if rss_before is not None and rss_after is not None else None
+            ),
+            "process_rss_bytes": rss_after,
+        }
+        self._signature = signature
+        self._loaded_at = datetime.utcnow()
+        self._load_count += 1
+        return ModelBundle(model, scaler_X, scaler_y, le_dict, fingerprint)
+
+    def get(self) -> ModelBundle:
+        """로드된 번들 반환 (최초 호출 또는 파일 변경 시에만 로드)"""
+        signature = self._file_signature()
+        if self._bundle is not None and signature == self._signature:
+            return self._bundle
+
+        with self._lock:
+            # 다른 스레드가 먼저 로드했을 수 있으므로 다시 확인
+            if self._bundle is None or signature != self._signature:
+                self._bundle = self._load(signature)
+            return self._bundle
+
+    def fingerprint(self) -> str:
+        """현재 디스크 상의 모델 버전 fingerprint (모델을 로드하지 않음)"""
+        return self._fingerprint(self._file_signature())
+
+    def status(self) -> Dict[str, Any]:
+        """로드 상태, 로드 시간, 메모리 사용량 정보"""
+        loaded = self._bundle is not None
+        try:
+            stale = loaded and self._file_signature() != self._signature
+        except OSError:
+            stale = None
+
+        return {
+            "loaded": loaded,
+            "stale": stale,
+            "fingerprint": self._bundle.fingerprint if loaded else None,
+            "loaded_at": self._loaded_at.isoformat() if self._loaded_at else None,
+            "load_seconds": self._load_seconds,
+            "load_count": self._load_count,
+            "memory": self._memory,
+            "paths": {name: str(path) for name, path in self.paths.items()},
+        }
+
+
+# 워커 프로세스 전역 레지스트리
+model_registry = ModelRegistry()
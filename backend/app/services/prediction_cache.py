@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.utils.file_handler import FileHandler
+
+
+class PredictionCache:
+    """
+    예측 결과 캐시
+    키 = 입력 파일 체크섬 + 모델/스케일러 fingerprint
+    엔트리마다 manifest(JSON)에 예측 결과와 CSV/XLSX 경로를 기록하고,
+    결과 디렉토리 전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 엔트리부터 삭제합니다 (LRU)
+    """
+
+    def __init__(self, result_dir: Path, max_bytes: int):
+        self.result_dir = Path(result_dir)
+        self.manifest_dir = self.result_dir / ".cache"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # (경로, mtime, 크기) → 체크섬 (같은 파일을 반복 해시하지 않도록)
+        self._checksums: Dict[Any, str] = {}
+
+    def file_checksum(self, file_path: Path) -> str:
+        stat = file_path.stat()
+        memo_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        if memo_key not in self._checksums:
+            handler = FileHandler(upload_dir=str(file_path.parent))
+            self._checksums[memo_key] = handler.calculate_checksum(file_path)
+        return self._checksums[memo_key]
+
+    def make_key(self, file_path: Path, model_fingerprint: str) -> str:
+        return f"{self.file_checksum(file_path)}_{model_fingerprint}"
+
+    def _manifest_path(self, key: str) -> Path:
+        return self.manifest_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 결과 반환 (결과 파일이 지워졌으면 None)"""
+        manifest_path = self._manifest_path(key)
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not all(Path(entry[k]).exists() for k in ("csv_path", "xlsx_path")):
+            self._remove_entry(manifest_path, entry)
+            return None
+
+        # LRU 갱신
+        os.utime(manifest_path)
+        return entry
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """결과 저장 후 용량 초과 시 오래된 엔트리 삭제"""
+        with self._lock:
+            self.manifest_dir.mkdir(parents=True, exist_ok=True)
+
+            # 같은 결과 파일을 가리키던 이전 엔트리(예: 모델 변경 전)는 더 이상 유효하지 않음
+            for manifest_path, entry in self._entries():
+                if entry.get("csv_path") == result["csv_path"] and manifest_path.stem != key:
+                    manifest_path.unlink(missing_ok=True)
+
+            manifest_path = self._manifest_path(key)
+            tmp_path = manifest_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, manifest_path)
+
+            self._evict()
+
+    def _entries(self):
+        for manifest_path in self.manifest_dir.glob("*.json"):
+            try:
+                with open(manifest_path, encoding="utf-8") as f:
+                    yield manifest_path, json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    def _entry_size(self, manifest_path: Path, entry: Dict[str, Any]) -> int:
+        size = 0
+        for path in (manifest_path, Path(entry["csv_path"]), Path(entry["xlsx_path"])):
+            try:
+                size += path.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def _remove_entry(self, manifest_path: Path, entry: Dict[str, Any]) -> None:
+        for path in (Path(entry["csv_path"]), Path(entry["xlsx_path"]), manifest_path):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries = []
+        for manifest_path, entry in self._entries():
+            try:
+                last_used = manifest_path.stat().st_mtime
+            except OSError:
+                continue
+            entries.append((last_used, manifest_path, entry, self._entry_size(manifest_path, entry)))
+
+        total = sum(size for *_, size in entries)
+        for _, manifest_path, entry, size in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            self._remove_entry(manifest_path, entry)
+            total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        entries = list(self._entries()) if self.manifest_dir.exists() else []
+        return {
+            "entries": len(entries),
+            "total_bytes": sum(self._entry_size(p, e) for p, e in entries),
+            "max_bytes": self.max_bytes,
+        }
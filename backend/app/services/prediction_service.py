@@ -0,0 +1,401 @@
+import multiprocessing
+import threading
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.core.constants import CATEGORY_COLS, FEEDBACK_COLS, INPUT_COLS, OUTPUT_COLS, feature_cols
+from app.services.forecast_engine import ForecastEngine, build_last_windows
+from app.services.model_registry import model_registry
+from app.services.prediction_cache import PredictionCache
+from app.utils.file_handler import FileHandler
+
+
+UPLOAD_DIR = Path(__file__).resolve().parent.parent.parent / "uploads"
+DOWNLOAD_PATH = Path(__file__).resolve().parent.parent.parent / "download_prediction"
+
+SEQ_LENGTH = 7
+FORECAST_DAYS = 7
+
+ProgressCallback = Callable[[int], None]
+
+prediction_cache = PredictionCache(
+    DOWNLOAD_PATH,
+    max_bytes=settings.PREDICTION_CACHE_MAX_MB * 1024 * 1024,
+)
+
+
+def run_prediction(
+    stored_filename: str,
+    progress: Optional[ProgressCallback] = None,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    업로드 파일로 SKU별 7일 예측을 수행하고 CSV/XLSX로 저장
+    progress: 진행률(0~100)을 전달받는 콜백
+    use_cache: 같은 입력 파일 + 같은 모델 버전의 이전 결과가 있으면 재사용
+    """
+    def report(percent: int):
+        if progress:
+            progress(percent)
+
+    file_path = UPLOAD_DIR / stored_filename
+    if not file_path.exists():
+        raise FileNotFoundError(stored_filename)
+
+    # ======================
+    # 0️⃣ 결과 캐시 조회 (입력 파일 체크섬 + 모델 fingerprint)
+    cache_key = prediction_cache.make_key(file_path, model_registry.fingerprint())
+    if use_cache:
+        cached = prediction_cache.get(cache_key)
+        if cached is not None:
+            report(100)
+            return {**cached, "cached": True}
+
+    # ======================
+    # 1️⃣ 모델/스케일러/인코더 (워커당 1회 로드, 파일 변경 시 재로드)
+    bundle = model_registry.get()
+    report(10)
+
+    # ======================
+    # 2️⃣ 데이터 로드
+    # 업로드 시 만든 Parquet 사본에서 필요한 컬럼만 읽음 (없으면 원본을 한 번 변환)
+    df = FileHandler(upload_dir=str(UPLOAD_DIR)).load_upload(stored_filename, columns=INPUT_COLS)
+    df['_일자'] = pd.to_datetime(df['_일자'])
+    df = df.sort_values(['SKU', '_일자']).reset_index(drop=True)
+    report(30)
+
+    # ======================
+    # 3️⃣ 카테고리 인코딩
+    for col in CATEGORY_COLS:
+        le = bundle.le_dict[col]
+        df[col + '_encoded'] = le.transform(df[col].astype(str))
+
+    # ======================
+    # 4️⃣ 시계열 특성 생성
+    df['요일'] = df['_일자'].dt.dayofweek
+    df['일'] = df['_일자'].dt.day
+    df['월_sin'] = np.sin(2 * np.pi * df['_월'] / 12)
+    df['월_cos'] = np.cos(2 * np.pi * df['_월'] / 12)
+    df['요일_sin'] = np.sin(2 * np.pi * df['요일'] / 7)
+    df['요일_cos'] = np.cos(2 * np.pi * df['요일'] / 7)
+
+    # ======================
+    # 5️⃣ 마지막 시퀀스 생성 (SKU별 마지막 SEQ_LENGTH행을 한 번에 추출)
+    skus, windows = build_last_windows(df, 'SKU', feature_cols, SEQ_LENGTH)
+
+    # ======================
+    # 6️⃣ SKU → 상품명 매핑
+    sku_name_map = df.drop_duplicates('SKU')[['SKU', '상품명 (한글)']].set_index('SKU')['상품명 (한글)'].to_dict()
+    report(50)
+
+    # ======================
+    # 7️⃣ 미래 예측 (전체 SKU를 한 번에 배치 예측)
+    engine = ForecastEngine(
+        bundle.model, bundle.scaler_X, bundle.scaler_y,
+        feedback_indices=[feature_cols.index(col) for col in FEEDBACK_COLS],
+        horizon=FORECAST_DAYS,
+        batch_size=settings.PREDICTION_BATCH_SIZE,
+    )
+    forecasts = engine.forecast(windows)
+
+    results = {}
+    for sku, predictions in zip(skus, forecasts):
+        results[sku_name_map[sku]] = [[float(v) for v in row] for row in predictions]  # JSON 직렬화 위해 리스트로 변환
+    report(85)
+
+    # ======================
+    # 8️⃣ 결과 테이블 변환
+    output_rows = []
+    for product_name, preds in results.items():
+        for day_idx, pred in enumerate(preds, 1):
+            output_rows.append({
+                "상품명": product_name,
+                "Day": day_idx,
+                "재고": pred[0],
+                "가용재고": pred[1],
+                "재고예정": pred[2]
+            })
+
+    output_df = pd.DataFrame(output_rows)
+    output_df[OUTPUT_COLS] = output_df[OUTPUT_COLS].round(2)
+
+    # ======================
+    # 9️⃣ CSV / XLSX 저장
+    csv_path = DOWNLOAD_PATH / f"{stored_filename}_prediction.csv"
+    xlsx_path = DOWNLOAD_PATH / f"{stored_filename}_prediction.xlsx"
+
+    output_df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    output_df.to_excel(xlsx_path, index=False)
+
+    result = {
+        "predictions": results,
+        "csv_path": str(csv_path),
+        "xlsx_path": str(xlsx_path)
+    }
+    prediction_cache.put(cache_key, result)
+    report(100)
+
+    return {**result, "cached": False}
+
+
+def load_predictions_csv(csv_path: Path) -> Dict[str, List[List[float]]]:
+    """저장된 예측 CSV를 /predict 응답과 같은 {상품명: [[재고, 가용재고, 재고예정], ...]} 형태로 변환"""
+    output_df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    results = {}
+    for product_name, group in output_df.groupby("상품명", sort=False):
+        rows = group.sort_values("Day")[OUTPUT_COLS].to_numpy(dtype=float)
+        results[product_name] = [[float(v) for v in row] for row in rows]
+    return results
+
+
+# ========== 비동기 예측 작업 ==========
+def run_prediction_job(job_id: int, use_cache: bool = True) -> None:
+    """
+    워커 프로세스에서 예측 작업 실행
+    상태/진행률은 prediction_jobs 테이블에 기록합니다
+    """
+    import app.models  # noqa: F401  워커 프로세스에서 모든 모델 매퍼 로드
+    from app.core.database import SessionLocal
+    from app.models.prediction_job import PredictionJob
+
+    db = SessionLocal()
+    try:
+        # pending인 작업만 가져감 (중단된 작업으로 정리되어 실패 처리된 경우 등은 건너뜀)
+        claimed = db.execute(
+            update(PredictionJob)
+            .where(PredictionJob.id == job_id, PredictionJob.status == "pending")
+            .values(status="processing", started_at=datetime.utcnow())
+        ).rowcount
+        db.commit()
+        if not claimed:
+            return
+        job = db.get(PredictionJob, job_id)
+
+        def update_progress(percent: int):
+            job.progress = percent
+            db.commit()
+
+        try:
+            result = run_prediction(job.stored_filename, update_progress, use_cache=use_cache)
+            values = {
+                "csv_path": result["csv_path"],
+                "xlsx_path": result["xlsx_path"],
+                "total_products": len(result["predictions"]),
+                "progress": 100,
+                "status": "completed",
+            }
+        except Exception as e:
+            db.rollback()
+            values = {"status": "failed", "error_message": str(e)}
+            print(f"Prediction job error: {traceback.format_exc()}")
+
+        # 처리 중에 다른 쪽에서 실패로 정리된 작업은 덮어쓰지 않음
+        db.execute(
+            update(PredictionJob)
+            .where(PredictionJob.id == job_id, PredictionJob.status == "processing")
+            .values(finished_at=datetime.utcnow(), **values)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def mark_prediction_job_failed(job_id: int, message: str) -> None:
+    """워커가 작업 상태를 기록하지 못하고 종료된 경우 (프로세스 비정상 종료 등) 작업을 실패로 기록"""
+    import app.models  # noqa: F401
+    from app.core.database import SessionLocal
+    from app.models.prediction_job import PredictionJob
+
+    db = SessionLocal()
+    try:
+        job = db.get(PredictionJob, job_id)
+        if job is None or job.status not in ("pending", "processing"):
+            return
+        job.status = "failed"
+        job.error_message = message
+        job.finished_at = datetime.utcnow()
+        db.commit()
+    except Exception:
+        db.rollback()
+        print(f"Prediction job status error: {traceback.format_exc()}")
+    finally:
+        db.close()
+
+
+STALE_JOB_MESSAGE = "서버 재시작 등으로 예측이 중단되었습니다. 다시 요청해주세요."
+
+
+def fail_stale_prediction_jobs() -> int:
+    """
+    중단된 예측 작업을 실패로 정리 (서버 시작 시 호출), 정리한 작업 수 반환
+    작업은 API 프로세스의 프로세스 풀에만 있으므로 재시작/크래시 시 이어서 처리되지 않습니다
+    이 프로세스의 풀이 맡은 작업과, 다른 워커 프로세스가 맡아 하트비트로 최근에 갱신된 작업은 건드리지 않습니다
+    """
+    import app.models  # noqa: F401
+    from app.core.database import SessionLocal
+    from app.models.prediction_job import PredictionJob
+
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.PREDICTION_STALE_SECONDS)
+    stale = update(PredictionJob).where(
+        PredictionJob.status.in_(("pending", "processing")), PredictionJob.updated_at < cutoff
+    )
+    in_flight = prediction_pool.in_flight()
+    if in_flight:
+        stale = stale.where(PredictionJob.id.notin_(in_flight))
+    db = SessionLocal()
+    try:
+        count = db.execute(
+            stale.values(status="failed", error_message=STALE_JOB_MESSAGE, finished_at=datetime.utcnow())
+        ).rowcount
+        db.commit()
+        if count:
+            print(f"⚠️ 중단된 예측 작업 {count}건을 실패로 정리했습니다.")
+        return count
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ 중단된 예측 작업 정리 실패: {e}")
+        return 0
+    finally:
+        db.close()
+
+
+def touch_prediction_jobs(job_ids: List[int]) -> None:
+    """대기/처리 중인 작업의 updated_at 갱신 (하트비트)"""
+    import app.models  # noqa: F401
+    from app.core.database import SessionLocal
+    from app.models.prediction_job import PredictionJob
+
+    if not job_ids:
+        return
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(PredictionJob)
+            .where(PredictionJob.id.in_(job_ids), PredictionJob.status.in_(("pending", "processing")))
+            .values(updated_at=datetime.utcnow())
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ 예측 작업 하트비트 기록 실패: {e}")
+    finally:
+        db.close()
+
+
+class PredictionJobQueueFull(Exception):
+    """대기 중인 예측 작업이 한도를 초과한 경우"""
+
+
+class PredictionWorkerPool:
+    """
+    예측 작업용 프로세스 풀
+    TensorFlow 연산이 API 서버의 이벤트 루프/스레드풀을 점유하지 않도록 별도 프로세스에서 실행하고,
+    동시에 대기할 수 있는 작업 수를 제한합니다
+    맡은 작업(대기 + 실행 중)은 주기적으로 updated_at을 갱신해 중단된 작업으로 정리되지 않게 합니다
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._in_flight: Set[int] = set()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # fork 시 TensorFlow 상태가 복제되지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            if self._heartbeat is None:
+                self._stop = threading.Event()
+                self._heartbeat = threading.Thread(
+                    target=self._heartbeat_loop, args=(self._stop,), name="prediction-heartbeat", daemon=True
+                )
+                self._heartbeat.start()
+            return self._executor
+
+    def _heartbeat_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(settings.PREDICTION_HEARTBEAT_SECONDS):
+            touch_prediction_jobs(self.in_flight())
+
+    def in_flight(self) -> List[int]:
+        """이 프로세스에서 대기/처리 중인 작업 ID"""
+        with self._lock:
+            return sorted(self._in_flight)
+
+    def _finish(self, job_id: int) -> None:
+        with self._lock:
+            self._in_flight.discard(job_id)
+        self._slots.release()
+
+    def _reset_executor(self, executor: ProcessPoolExecutor) -> None:
+        """
+        워커 프로세스가 죽으면(OOM 등) 풀 전체가 BrokenProcessPool 상태가 되어 이후 제출이 모두 실패하므로
+        버리고 다음 제출 때 새로 생성
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, job_id: int, use_cache: bool = True) -> Future:
+        """BrokenProcessPool: 풀이 깨진 경우 (풀은 재생성되므로 다시 제출하면 됨)"""
+        if not self._slots.acquire(blocking=False):
+            raise PredictionJobQueueFull()
+        executor = self._get_executor()
+        with self._lock:
+            self._in_flight.add(job_id)
+        try:
+            future = executor.submit(run_prediction_job, job_id, use_cache)
+        except BrokenProcessPool:
+            self._finish(job_id)
+            self._reset_executor(executor)
+            raise
+        except Exception:
+            self._finish(job_id)
+            raise
+
+        def on_done(done: Future):
+            self._finish(job_id)
+            if done.cancelled():
+                mark_prediction_job_failed(job_id, "예측 작업이 취소되었습니다.")
+                return
+            error = done.exception()
+            if error is None:
+                return
+            if isinstance(error, BrokenProcessPool):
+                self._reset_executor(executor)
+            print(f"Prediction worker error: job={job_id} {error!r}")
+            mark_prediction_job_failed(job_id, f"예측 워커가 비정상 종료되었습니다: {error}")
+
+        future.add_done_callback(on_done)
+        return future
+
+    def shutdown(self):
+        with self._lock:
+            self._stop.set()
+            self._heartbeat = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+prediction_pool = PredictionWorkerPool(
+    max_workers=settings.PREDICTION_WORKERS,
+    max_pending=settings.PREDICTION_MAX_PENDING,
+)
@@ -0,0 +1,412 @@
+import hashlib
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+
+try:
+    import faiss
+except ImportError:  # faiss-cpu 미설치 시 numpy 전수 검색으로 동작
+    faiss = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 파일 잠금 없이 동작 (단일 워커 전제)
+    fcntl = None
+
+
+APP_DIR = Path(__file__).resolve().parent.parent
+VECTOR_DIR = APP_DIR.parent / "vector_store"
+
+
+def row_to_text(row: Dict[str, Any]) -> str:
+    """
+    업로드 파일의 한 행을 검색용 텍스트로 변환합니다.
+    컬럼명:값 | 컬럼명:값 ... 형태로 만들면 검색 컨텍스트로 유용합니다.
+    """
+    parts = []
+    for col, val in row.items():
+        if val is None or (isinstance(val, float) and np.isnan(val)):
+            val = ""
+        parts.append(f"{col}: {val}")
+    return " | ".join(parts)
+
+
+# ========== 임베딩 모델 ==========
+class HashingEmbedder:
+    """
+    외부 모델 없이 동작하는 문자 n-gram 해싱 임베딩 (오프라인/테스트용)
+    SKU, 날짜, 제품명처럼 표면 문자열이 겹치는 행 검색에 충분합니다
+    """
+
+    name = "hashing"
+
+    def __init__(self, dim: int = 384, ngrams=(2, 3)):
+        self.dim = dim
+        self.ngrams = ngrams
+
+    def _bucket(self, gram: str) -> int:
+        return int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little") % self.dim
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            text = " ".join(text.casefold().split())
+            for n in self.ngrams:
+                for j in range(max(len(text) - n + 1, 0)):
+                    vectors[i, self._bucket(text[j:j + n])] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+class SentenceTransformerEmbedder:
+    """로컬 sentence-transformers 모델 (모델 파일이 있으면 오프라인 동작)"""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self.name = model_name
+        self.model = SentenceTransformer(model_name)
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(
+            texts, batch_size=256, show_progress_bar=False,
+            convert_to_numpy=True, normalize_embeddings=True
+        ).astype(np.float32)
+
+
+def load_embedder(model_name: str):
+    """
+    EMBED_MODEL_NAME에 맞는 임베딩 모델 로드
+    sentence-transformers 미설치, 또는 모델을 받을 수 없는 경우(오프라인/첫 실행 다운로드 실패 등) 해싱 임베딩
+    """
+    if model_name == "hashing":
+        return HashingEmbedder()
+    try:
+        return SentenceTransformerEmbedder(model_name)
+    except ImportError:
+        print("⚠️ sentence-transformers가 설치되지 않아 해싱 임베딩으로 검색합니다.")
+    except Exception as e:
+        print(f"⚠️ 임베딩 모델({model_name})을 불러오지 못해 해싱 임베딩으로 검색합니다: {e}")
+    return HashingEmbedder()
+
+
+# ========== 회사별 벡터 인덱스 ==========
+class TenantVectorIndex:
+    """
+    회사 하나의 검색 인덱스
+    디스크: vectors.f32(float32 원시 벡터, 추가 전용) + rows.jsonl(행 메타데이터, 추가 전용)
+    메모리: 한 번 로드한 뒤 새로 추가된 부분만 이어서 읽음 (다른 워커가 추가한 벡터 포함)
+    행 수가 hnsw_threshold 이상이면 근사 검색(HNSW)으로 전환합니다 (faiss 설치 시)
+    두 파일의 i번째 행/벡터가 항상 짝이 되도록 추가는 index.lock 배타 잠금, 읽기는 공유 잠금 안에서 합니다
+    (여러 uvicorn 워커, 업로드 색인과 /embed/reindex 동시 실행)
+    """
+
+    def __init__(self, directory: Path, dim: int, hnsw_threshold: int, hnsw_m: int = 32, ef_search: int = 64):
+        self.directory = Path(directory)
+        self.vectors_path = self.directory / "vectors.f32"
+        self.rows_path = self.directory / "rows.jsonl"
+        self.lock_path = self.directory / "index.lock"
+        self.dim = dim
+        self.hnsw_threshold = hnsw_threshold
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self._lock = threading.RLock()
+        self._index = None            # faiss 인덱스
+        self._matrix = None           # faiss 미설치 시 검색용 행렬 (np.memmap)
+        self._rows: List[Dict[str, Any]] = []
+        self._hashes = set()          # 중복 행 색인 방지
+        self._loaded = 0              # 메모리에 올라온 벡터 수
+        self._rows_offset = 0         # rows.jsonl에서 이미 읽은 위치(bytes)
+        self.misaligned = False       # 행/벡터 파일 길이가 어긋남 (다음 추가 시 재생성)
+
+    @property
+    def kind(self) -> str:
+        if faiss is None:
+            return "numpy-flat"
+        return "hnsw" if isinstance(self._index, faiss.IndexHNSWFlat) else "flat"
+
+    def __len__(self) -> int:
+        return self._loaded
+
+    def _new_index(self, size: int):
+        if size >= self.hnsw_threshold:
+            index = faiss.IndexHNSWFlat(self.dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efSearch = self.ef_search
+            return index
+        return faiss.IndexFlatIP(self.dim)
+
+    def _disk_count(self) -> int:
+        try:
+            return self.vectors_path.stat().st_size // (4 * self.dim)
+        except OSError:
+            return 0
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """프로세스 간 잠금 (추가: 배타, 읽기: 공유)"""
+        if fcntl is None:
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _reset_memory(self) -> None:
+        self._index = None
+        self._matrix = None
+        self._rows = []
+        self._hashes = set()
+        self._loaded = 0
+        self._rows_offset = 0
+
+    def refresh(self) -> None:
+        """디스크에 새로 추가된 벡터/행만 메모리 인덱스에 반영"""
+        with self._lock:
+            if not self.vectors_path.exists() and not self._loaded:
+                return
+            with self._file_lock(exclusive=False):
+                self._refresh()
+
+    def _refresh(self) -> None:
+        """refresh 본체 (파일 잠금을 잡은 상태에서 호출)"""
+        total = self._disk_count()
+        if total < self._loaded:
+            # 다른 워커가 어긋난 인덱스를 재생성함 → 처음부터 다시 로드
+            self._reset_memory()
+        if total <= self._loaded:
+            return
+
+        vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(total, self.dim))
+        rows, offset = [], self._rows_offset
+        if self.rows_path.exists():
+            with open(self.rows_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if len(self._rows) + len(rows) >= total:
+                        break
+                    if not line.endswith(b"\n"):
+                        break
+                    rows.append(json.loads(line))
+                    offset += len(line)
+        if len(self._rows) + len(rows) < total:
+            # 행보다 벡터가 많음: 행/벡터 짝이 맞지 않아 검색 결과를 신뢰할 수 없으므로 로드하지 않음
+            if not self.misaligned:
+                print(f"❌ 검색 인덱스 파일이 어긋났습니다 ({self.directory}), 다음 색인 때 재생성합니다 (/embed/reindex)")
+            self.misaligned = True
+            return
+        self.misaligned = False
+        self._rows.extend(rows)
+        self._rows_offset = offset
+
+        if faiss is None:
+            self._matrix = vectors
+        elif self._index is None or (
+            total >= self.hnsw_threshold and not isinstance(self._index, faiss.IndexHNSWFlat)
+        ):
+            # 최초 로드 또는 HNSW 전환 시점에는 전체를 한 번에 색인
+            self._index = self._new_index(total)
+            self._index.add(np.ascontiguousarray(vectors))
+        else:
+            self._index.add(np.ascontiguousarray(vectors[self._loaded:total]))
+
+        for row in self._rows[self._loaded:total]:
+            self._hashes.add(row["hash"])
+        self._loaded = total
+
+    def _repair(self) -> None:
+        """
+        추가 전 파일 정리 (배타 잠금 안에서 호출)
+        - 행/벡터가 어긋났으면 두 파일을 비우고 새로 색인 (이후 추가/재색인으로 다시 채워짐)
+        - 이전 추가가 중간에 실패해 남은 꼬리(벡터 없는 행, 잘린 벡터)를 잘라냄
+        """
+        if self.misaligned:
+            self.rows_path.unlink(missing_ok=True)
+            self.vectors_path.unlink(missing_ok=True)
+            self._reset_memory()
+            self.misaligned = False
+            return
+        if self.rows_path.exists() and self.rows_path.stat().st_size > self._rows_offset:
+            with open(self.rows_path, "r+b") as f:
+                f.truncate(self._rows_offset)
+        if self.vectors_path.exists() and self.vectors_path.stat().st_size > self._loaded * 4 * self.dim:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(self._loaded * 4 * self.dim)
+
+    def add(self, texts: List[str], rows: List[Dict[str, Any]], embedder, source: Dict[str, Any]) -> int:
+        """새 행만 임베딩해서 파일 끝에 추가하고 인덱스에 반영, 추가한 행 수 반환"""
+        with self._lock:
+            self.refresh()
+            new_items = []
+            seen = set()
+            for text, row in zip(texts, rows):
+                digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+                if digest in self._hashes or digest in seen:
+                    continue
+                seen.add(digest)
+                new_items.append((digest, text, row))
+        if not new_items:
+            return 0
+
+        # 임베딩은 어떤 잠금도 잡지 않고 계산 (오래 걸려도 같은 회사의 검색/다른 워커의 추가를 막지 않음)
+        vectors = embedder.encode([text for _, text, _ in new_items]).astype(np.float32)
+
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh()
+            self._repair()
+            # 임베딩하는 동안 다른 스레드/워커가 추가한 행은 제외
+            keep = [i for i, (digest, _, _) in enumerate(new_items) if digest not in self._hashes]
+            if not keep:
+                return 0
+            new_items = [new_items[i] for i in keep]
+            vectors = vectors[keep]
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 행 메타데이터를 먼저 쓰고 벡터를 씀 (벡터 수 기준으로 로드하므로 중간 실패 시 안전)
+            with open(self.rows_path, "a", encoding="utf-8") as f:
+                for digest, text, row in new_items:
+                    f.write(json.dumps({"hash": digest, "text": text, "row": row, **source}, ensure_ascii=False, default=str) + "\n")
+            with open(self.vectors_path, "ab") as f:
+                f.write(vectors.tobytes())
+
+            self._refresh()
+        return len(new_items)
+
+    def search(self, query: np.ndarray, top_k: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.refresh()
+            if not self._loaded:
+                return []
+            top_k = min(top_k, self._loaded)
+            query = np.ascontiguousarray(query.reshape(1, -1), dtype=np.float32)
+
+            if faiss is None:
+                scores = np.asarray(self._matrix @ query[0])
+                ids = np.argpartition(-scores, top_k - 1)[:top_k]
+                ids = ids[np.argsort(-scores[ids])]
+                hits = [(int(i), float(scores[i])) for i in ids]
+            else:
+                scores, ids = self._index.search(query, top_k)
+                hits = [(int(i), float(s)) for i, s in zip(ids[0], scores[0]) if i >= 0]
+
+            return [
+                {"score": round(score, 4), "text": self._rows[i]["text"], "row": self._rows[i]["row"],
+                 "upload_job_id": self._rows[i].get("upload_job_id")}
+                for i, score in hits
+            ]
+
+
+class RetrievalService:
+    """
+    회사별 업로드 데이터 검색 (챗봇 컨텍스트용)
+    인덱스는 회사별로 프로세스 메모리에 유지하고, 업로드 완료 시 새 행만 백그라운드에서 추가 색인합니다
+    """
+
+    def __init__(self, vector_dir: Path = VECTOR_DIR, max_pending: int = settings.RETRIEVAL_MAX_PENDING):
+        self.vector_dir = Path(vector_dir)
+        self._lock = threading.Lock()
+        self._embedder = None
+        self._indexes: Dict[int, TenantVectorIndex] = {}
+        # 업로드 응답을 늦추지 않도록 색인은 별도 스레드 하나에서 순서대로 처리
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="retrieval-index")
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    @property
+    def embedder(self):
+        with self._lock:
+            if self._embedder is None:
+                self._embedder = load_embedder(settings.EMBED_MODEL_NAME)
+            return self._embedder
+
+    def _tenant_index(self, tenant_id: int) -> TenantVectorIndex:
+        embedder = self.embedder
+        with self._lock:
+            if tenant_id not in self._indexes:
+                # 임베딩 모델이 바뀌면 차원/공간이 달라지므로 모델별 디렉토리 사용
+                model_dir = embedder.name.replace("/", "_")
+                self._indexes[tenant_id] = TenantVectorIndex(
+                    self.vector_dir / model_dir / f"tenant_{tenant_id}",
+                    dim=embedder.dim,
+                    hnsw_threshold=settings.RETRIEVAL_HNSW_THRESHOLD,
+                )
+            return self._indexes[tenant_id]
+
+    def index_dataframe(self, tenant_id: int, df: pd.DataFrame, upload_job_id: Optional[int] = None) -> int:
+        """DataFrame 행을 색인 (이미 색인된 행은 건너뜀), 새로 색인한 행 수 반환"""
+        records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+        texts = [row_to_text(row) for row in records]
+        return self._tenant_index(tenant_id).add(
+            texts, records, self.embedder, source={"upload_job_id": upload_job_id}
+        )
+
+    def index_upload_async(
+        self,
+        tenant_id: int,
+        upload_job_id: Optional[int],
+        load_rows: Callable[[], pd.DataFrame],
+    ) -> Optional[Future]:
+        """
+        업로드 완료 후 백그라운드 색인 예약
+        대기열에는 DataFrame 대신 읽기 함수(load_rows, 보통 Parquet 사본 읽기)만 두고 색인 시점에 읽으며,
+        대기 작업 수를 RETRIEVAL_MAX_PENDING으로 제한합니다
+        한도를 넘거나 검색이 비활성화되어 있으면 건너뛰고 None 반환 (/embed/reindex로 나중에 색인)
+        """
+        if not settings.RETRIEVAL_ENABLED:
+            return None
+        if not self._slots.acquire(blocking=False):
+            print(f"⚠️ 검색 색인 대기 작업이 많아 건너뜁니다: tenant={tenant_id}, upload_job={upload_job_id} (/embed/reindex로 색인)")
+            return None
+
+        def run():
+            try:
+                added = self.index_dataframe(tenant_id, load_rows(), upload_job_id)
+                print(f"✅ 검색 인덱스 갱신: tenant={tenant_id}, upload_job={upload_job_id}, 추가 {added}행")
+            except Exception as e:
+                print(f"❌ 검색 인덱스 갱신 실패: tenant={tenant_id}, upload_job={upload_job_id}: {e}")
+
+        try:
+            future = self._executor.submit(run)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def search(self, tenant_id: int, question: str, top_k: int = None) -> List[Dict[str, Any]]:
+        """질문과 가장 가까운 업로드 행 top_k개"""
+        query = self.embedder.encode([question])[0]
+        return self._tenant_index(tenant_id).search(query, top_k or settings.RETRIEVAL_TOP_K)
+
+    def status(self, tenant_id: Optional[int] = None) -> Dict[str, Any]:
+        status = {
+            "enabled": settings.RETRIEVAL_ENABLED,
+            "embed_model": self._embedder.name if self._embedder else settings.EMBED_MODEL_NAME,
+            "faiss": faiss is not None,
+            "hnsw_threshold": settings.RETRIEVAL_HNSW_THRESHOLD,
+        }
+        if tenant_id is not None:
+            index = self._tenant_index(tenant_id)
+            index.refresh()
+            status.update({
+                "tenant_id": tenant_id, "rows": len(index), "index": index.kind, "misaligned": index.misaligned
+            })
+        return status
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 프로세스 전역 검색 서비스
+retrieval_service = RetrievalService()
@@ -0,0 +1,100 @@
+from datetime import date, datetime
+from typing import List, Optional
+
+from sqlalchemy import Date, cast, delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.sales import Sales
+from app.models.sales_monthly import SalesMonthly
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def next_month(value: date) -> date:
+    value = month_start(value)
+    return value.replace(year=value.year + 1, month=1) if value.month == 12 else value.replace(month=value.month + 1)
+
+
+def _period_expr(db: Session):
+    """sale_date → 해당 월 1일 (DB 방언별)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return func.date(Sales.sale_date, "start of month")
+    return cast(func.date_format(Sales.sale_date, "%Y-%m-01"), Date)
+
+
+def refresh_monthly(db: Session, tenant_id: int, start: date, end: date) -> None:
+    """
+    start~end가 걸친 월의 월별 집계를 sales에서 다시 계산 (집합 단위 DELETE + INSERT ... SELECT)
+    커밋은 호출한 쪽에서 합니다 (sales 적재와 같은 트랜잭션)
+    """
+    period_start, period_end = month_start(start), next_month(end)
+
+    db.execute(
+        delete(SalesMonthly).where(
+            SalesMonthly.tenant_id == tenant_id,
+            SalesMonthly.period >= period_start,
+            SalesMonthly.period < period_end
+        )
+    )
+
+    db.execute(
+        insert(SalesMonthly).from_select(
+            ["tenant_id", "product_id", "period", "quantity", "revenue", "created_at", "updated_at"],
+            monthly_aggregate_query(db, tenant_id, period_start, period_end)
+        )
+    )
+
+
+def monthly_aggregate_query(db: Session, tenant_id: int, period_start: date, period_end: date):
+    """
+    [period_start, period_end) 기간 sales의 (제품, 월)별 수량/매출 합계 쿼리
+    ix_sales_tenant_date_product_qty_rev 커버링 인덱스만 읽음 (테이블 본문 조회 없음)
+    """
+    period = _period_expr(db)
+    now = datetime.utcnow()
+    return (
+        select(
+            Sales.tenant_id,
+            Sales.product_id,
+            period.label("period"),
+            func.sum(Sales.quantity),
+            func.sum(func.coalesce(Sales.revenue, 0)),
+            literal(now),
+            literal(now),
+        )
+        .where(
+            Sales.tenant_id == tenant_id,
+            Sales.sale_date >= period_start,
+            Sales.sale_date < period_end
+        )
+        .group_by(Sales.tenant_id, Sales.product_id, period)
+    )
+
+
+def rebuild_monthly(db: Session, tenant_id: Optional[int] = None) -> List[int]:
+    """
+    월별 집계 전체 재생성 (백필/복구용)
+    tenant_id가 없으면 sales가 있는 모든 회사를 재생성합니다
+    집계가 바뀐 회사 ID 목록을 반환합니다 (sales가 없어져 집계만 삭제된 회사 포함, 응답 캐시 무효화용)
+    """
+    query = select(Sales.tenant_id, func.min(Sales.sale_date), func.max(Sales.sale_date)).group_by(Sales.tenant_id)
+    previous = select(SalesMonthly.tenant_id).distinct()
+    if tenant_id is not None:
+        query = query.where(Sales.tenant_id == tenant_id)
+        previous = previous.where(SalesMonthly.tenant_id == tenant_id)
+    affected = set(db.execute(previous).scalars())
+
+    if tenant_id is not None:
+        db.execute(delete(SalesMonthly).where(SalesMonthly.tenant_id == tenant_id))
+    else:
+        db.execute(delete(SalesMonthly))
+
+    tenants = db.execute(query).all()
+    for tid, first_date, last_date in tenants:
+        refresh_monthly(db, tid, first_date, last_date)
+        affected.add(tid)
+    db.commit()
+    return sorted(affected)
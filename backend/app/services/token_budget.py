@@ -0,0 +1,161 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# 메시지 1개당 역할/구분자 토큰, 응답 시작 토큰 (OpenAI chat 형식 기준)
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+SUMMARY_QUESTION_CHARS = 60  # 생략된 질문 요약 시 질문당 최대 글자 수
+SUMMARY_MAX_QUESTIONS = 10   # 요약에 남길 최근 생략 질문 수
+
+
+class TokenCounter:
+    """
+    로컬 토큰 계산기
+    tiktoken(인코딩 파일 포함)이 있으면 정확히 세고, 없거나 인코딩을 받을 수 없는 환경(오프라인)에서는
+    글자 종류별 추정치를 사용합니다 (영문/숫자 약 4자당 1토큰, 한글 등 비ASCII 문자 1자당 1토큰)
+    """
+
+    def __init__(self, model: str):
+        self.model = model
+        self._lock = threading.Lock()
+        self._encoding = None
+        self._loaded = False
+
+    def _get_encoding(self):
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                try:
+                    import tiktoken
+
+                    try:
+                        self._encoding = tiktoken.encoding_for_model(self.model)
+                    except KeyError:
+                        self._encoding = tiktoken.get_encoding("o200k_base")
+                except Exception:
+                    self._encoding = None
+            return self._encoding
+
+    @property
+    def exact(self) -> bool:
+        return self._get_encoding() is not None
+
+    def count_text(self, text: str) -> int:
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text))
+        ascii_chars = sum(1 for ch in text if ch.isascii())
+        return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+    def count_message(self, message: Dict[str, str]) -> int:
+        return TOKENS_PER_MESSAGE + self.count_text(message["role"]) + self.count_text(message["content"])
+
+    def count_messages(self, messages: List[Dict[str, str]]) -> int:
+        return sum(self.count_message(m) for m in messages) + TOKENS_PER_REPLY
+
+
+def _summary_message(dropped: List[Dict[str, str]]) -> Dict[str, str]:
+    """생략된 이전 대화를 최근 사용자 질문 목록으로 요약 (추가 API 호출 없음)"""
+    questions = []
+    user_messages = [m for m in dropped if m["role"] == "user"]
+    for message in user_messages[-SUMMARY_MAX_QUESTIONS:]:
+        text = " ".join(message["content"].split())
+        if len(text) > SUMMARY_QUESTION_CHARS:
+            text = text[:SUMMARY_QUESTION_CHARS] + "…"
+        questions.append(f"- {text}")
+    content = f"(이전 대화 {len(dropped)}개 메시지는 길이 제한으로 생략되었습니다."
+    if questions:
+        content += " 생략된 사용자 질문:\n" + "\n".join(questions) + ")"
+    else:
+        content += ")"
+    return {"role": "system", "content": content}
+
+
+def fit_to_budget(
+    messages: List[Dict[str, str]],
+    counter: TokenCounter,
+    budget: int,
+) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+    """
+    프롬프트가 budget 토큰 안에 들어오도록 오래된 대화부터 제외
+    - 맨 앞 system 메시지(역할 지시, 검색 컨텍스트)와 마지막 메시지는 항상 유지
+    - 제외한 대화가 있으면 생략 요약 메시지를 추가 (자리가 부족하면 가장 오래된 남은 대화를 더 제외)
+    반환: (보낼 메시지, 메타데이터)
+    """
+    original_tokens = counter.count_messages(messages)
+    metadata: Dict[str, Any] = {
+        "prompt_tokens": original_tokens,
+        "original_prompt_tokens": original_tokens,
+        "token_budget": budget,
+        "dropped_messages": 0,
+        "summarized": False,
+        "exact_count": counter.exact,
+    }
+    if original_tokens <= budget or len(messages) <= 1:
+        metadata["over_budget"] = original_tokens > budget
+        return messages, metadata
+
+    head = 0
+    while head < len(messages) - 1 and messages[head]["role"] == "system":
+        head += 1
+    system, history, last = messages[:head], messages[head:-1], messages[-1]
+
+    used = counter.count_messages(system + [last])
+    kept: List[Dict[str, str]] = []
+    # 최근 대화부터 예산 안에서 유지
+    for index in range(len(history) - 1, -1, -1):
+        cost = counter.count_message(history[index])
+        if used + cost > budget:
+            break
+        kept.insert(0, history[index])
+        used += cost
+    dropped = history[:len(history) - len(kept)]
+
+    # 대화 중간(assistant 답변)부터 시작하지 않도록 정리
+    while kept and kept[0]["role"] == "assistant":
+        dropped.append(kept.pop(0))
+        used -= counter.count_message(dropped[-1])
+
+    # 요약을 넣을 자리가 끝내 없으면 요약 없이 최근 대화를 유지하도록 원래 상태 보관
+    without_summary = (list(kept), list(dropped), used)
+    summary = None
+    while dropped:
+        candidate = _summary_message(dropped)
+        summary_cost = counter.count_message(candidate)
+        if used + summary_cost <= budget:
+            summary = candidate
+            used += summary_cost
+            break
+        if not kept:
+            break
+        # 가장 오래된 대화 한 턴(질문 + 답변)을 요약 쪽으로 이동
+        dropped.append(kept.pop(0))
+        used -= counter.count_message(dropped[-1])
+        while kept and kept[0]["role"] == "assistant":
+            dropped.append(kept.pop(0))
+            used -= counter.count_message(dropped[-1])
+
+    if summary is None:
+        kept, dropped, used = without_summary
+        result = system + kept + [last]
+    else:
+        result = system + [summary] + kept + [last]
+        metadata["summarized"] = True
+
+    metadata.update({
+        "prompt_tokens": used,
+        "dropped_messages": len(dropped),
+        "over_budget": used > budget,
+    })
+    return result, metadata
+
+
+def merge_usage(metadata: Dict[str, Any], usage: Optional[Any]) -> Dict[str, Any]:
+    """OpenAI 응답의 실제 usage가 있으면 메타데이터에 추가"""
+    if usage is not None:
+        metadata["usage"] = {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens,
+        }
+    return metadata
@@ -1,15 +1,50 @@
 import json
+import hashlib
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+import aiofiles
 import pandas as pd  # 추가!!!
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime, date
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
+from datetime import datetime, date, timedelta
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 
+from app.core.cache import analytics_cache
+from app.core.config import settings
 from app.models.upload_job import UploadJob
+from app.services.retrieval_service import retrieval_service
+from app.services.rollup_service import refresh_monthly
 from app.utils.file_handler import FileHandler
 
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+SKU_QUERY_CHUNK = 1000  # IN 절 하나에 넣을 SKU 수
+SALES_INSERT_CHUNK = 10000  # executemany 한 번에 넣을 판매 행 수
+SALES_KEY = ["tenant_id", "product_id", "sale_date"]  # sales 자연키
+
+# 판매 데이터 적재 모드
+INGEST_MODES = ("append", "replace-range", "upsert-sum")
+DEFAULT_INGEST_MODE = "replace-range"
+
+# 업로드 파일에서 판매 데이터로 적재하는 컬럼 (대소문자 무시)
+SALES_REQUIRED_COLUMNS = {"sale_date", "sku", "quantity"}
+SALES_COLUMNS = SALES_REQUIRED_COLUMNS | {"revenue"}
+
+
+class FileTooLargeError(ValueError):
+    """업로드 파일이 허용 크기를 초과한 경우"""
+
+
+class UploadQueueFull(Exception):
+    """대기 중인 업로드 작업이 한도를 초과한 경우"""
+
+
 class UploadService:
     """파일 업로드 서비스"""
     
@@ -17,125 +52,398 @@ class UploadService:
         self.db = db
         self.file_handler = FileHandler(upload_dir="uploads")
     
-    async def save_uploaded_file(self, file: UploadFile, upload_path: Path) -> int:
-        """업로드된 파일을 저장"""
-        with open(upload_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        return len(content)
+    async def save_uploaded_file(
+        self,
+        file: UploadFile,
+        upload_path: Path,
+        max_size: Optional[int] = None
+    ) -> Tuple[int, str]:
+        """
+        업로드된 파일을 고정 크기 청크 단위로 저장
+        저장하면서 크기 제한 확인과 체크섬(MD5) 계산을 함께 하므로 파일 크기와 무관하게 메모리 사용량이 일정합니다
+        반환: (파일 크기, 체크섬)
+        """
+        md5 = hashlib.md5()
+        size = 0
+        try:
+            async with aiofiles.open(upload_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise FileTooLargeError(
+                            f"파일 크기는 {max_size // (1024 * 1024)}MB를 초과할 수 없습니다"
+                        )
+                    md5.update(chunk)
+                    await buffer.write(chunk)
+        except Exception:
+            # 일부만 저장된 파일 정리
+            upload_path.unlink(missing_ok=True)
+            raise
+        return size, md5.hexdigest()
     
     async def process_upload(
         self, 
         file: UploadFile, 
         tenant_id: int,
-        user_id: int = None
+        user_id: int = None,
+        max_file_size: Optional[int] = None,
+        ingest_mode: str = DEFAULT_INGEST_MODE
     ) -> UploadJob:
-        """파일 업로드 처리"""
+        """
+        파일 업로드 접수
+        파일 저장(비동기)까지만 요청 안에서 처리하고 pending 상태의 작업을 바로 반환합니다
+        인코딩 감지/파싱/프로파일링/DB 적재는 업로드 작업 스레드 풀에서 처리되며,
+        상태(pending → processing → completed/failed)와 처리 행 수는 upload_jobs에 기록됩니다
+        """
         
-        from app.models.product import Product
-        from app.models.sales import Sales
-
         # 1. 고유 파일명 생성
         stored_filename = self.file_handler.generate_unique_filename(file.filename)
         upload_path = self.file_handler.upload_dir / stored_filename
         
-        # 2. DB에 업로드 작업 생성 (pending 상태)
-        upload_job = UploadJob(
-            tenant_id=tenant_id,
-            user_id=user_id,
-            original_filename=file.filename,
-            stored_filename=stored_filename,
-            file_type=Path(file.filename).suffix.lower().replace('.', ''),
-            status="pending"
+        # 2. DB에 업로드 작업 생성
+        upload_job = await run_in_threadpool(
+            self._create_upload_job, tenant_id, user_id, file.filename, stored_filename
         )
-        self.db.add(upload_job)
-        self.db.commit()
-        self.db.refresh(upload_job)
         
         try:
             # 3. 파일 저장
-            upload_job.status = "processing"
-            self.db.commit()
-            
-            file_size = await self.save_uploaded_file(file, upload_path)
-            upload_job.file_size = file_size
-            
-            # 4. 파일 읽기 및 프로파일링
-            encoding = self.file_handler.detect_encoding(upload_path)
-            upload_job.encoding = encoding
-            
-            df = self.file_handler.read_file(upload_path, encoding)
-            profile = self.file_handler.profile_data(df)
-            
-            required = {"sale_date", "sku", "quantity"}
-            if required.issubset(set(map(str.lower, df.columns))):
-                df.columns = [c.lower() for c in df.columns]
-                sku_to_id = {}
-                for sku in df["sku"].unique():
-                    p = self.db.query(Product).filter_by(tenant_id=tenant_id, sku=sku).first()
-                    if not p:
-                        p = Product(tenant_id=tenant_id, sku=sku, name=sku)
-                        self.db.add(p)
-                        self.db.flush()
-                    sku_to_id[sku] = p.id
-
-                sales_rows = []
-                for _, row in df.iterrows():
-                    # Timestamp를 Python date 객체로 변환 (핵심 수정!)
-                    sale_date_value = row["sale_date"]
-                    if isinstance(sale_date_value, pd.Timestamp):
-                        sale_date_value = sale_date_value.date()
-                    elif isinstance(sale_date_value, str):
-                        sale_date_value = pd.to_datetime(sale_date_value).date()
-                    elif not isinstance(sale_date_value, date):
-                        sale_date_value = pd.to_datetime(sale_date_value).date()
-                    
-                    # revenue 안전하게 처리
-                    revenue_value = row.get("revenue")
-                    if revenue_value is None or pd.isna(revenue_value):
-                        revenue_value = 0.0
-                    else:
-                        revenue_value = float(revenue_value)
-                    
-                    sales_rows.append(Sales(
-                        tenant_id=tenant_id,
-                        product_id=sku_to_id[row["sku"]],
-                        sale_date=sale_date_value,  # Python date 객체
-                        quantity=float(row["quantity"]),
-                        revenue=revenue_value
-                    ))
-                
-                self.db.bulk_save_objects(sales_rows)
-                self.db.commit()
-
-            # 5. 프로파일 정보 저장
-            upload_job.total_rows = profile["total_rows"]
-            upload_job.total_columns = profile["total_columns"]
-            upload_job.null_count = profile["null_count"]
-            upload_job.duplicate_count = profile["duplicate_count"]
-            
-            # profile 데이터에 Timestamp가 있을 수 있으므로 변환
-            profile_json = self._serialize_profile(profile)
-            upload_job.profile_data = json.dumps(profile_json, ensure_ascii=False)
-            upload_job.status = "completed"
-            
-            self.db.commit()
-            self.db.refresh(upload_job)
-            
+            file_size, checksum = await self.save_uploaded_file(file, upload_path, max_file_size)
+            await run_in_threadpool(self._record_file_info, upload_job, file_size, checksum)
+
+            # 4. 파싱/적재 작업 등록
+            upload_pool.submit(upload_job.id, ingest_mode)
             return upload_job
             
         except Exception as e:
-            # 에러 발생 시 상태 업데이트
-            upload_job.status = "failed"
-            upload_job.error_message = str(e)
-            self.db.commit()
+            # 에러 발생 시 상태 업데이트 (실패한 작업의 파일은 다시 처리되지 않으므로 삭제)
+            upload_path.unlink(missing_ok=True)
+            await run_in_threadpool(self._mark_failed, upload_job, str(e))
             
             # 디버깅을 위한 로그
-            import traceback
             print(f"Upload error: {traceback.format_exc()}")
             
             raise e
+
+    def _create_upload_job(
+        self,
+        tenant_id: int,
+        user_id: Optional[int],
+        original_filename: str,
+        stored_filename: str
+    ) -> UploadJob:
+        """업로드 작업 생성 (pending)"""
+        upload_job = UploadJob(
+            tenant_id=tenant_id,
+            user_id=user_id,
+            original_filename=original_filename,
+            stored_filename=stored_filename,
+            file_type=Path(original_filename).suffix.lower().replace('.', ''),
+            status="pending",
+            rows_processed=0
+        )
+        self.db.add(upload_job)
+        self.db.commit()
+        self.db.refresh(upload_job)
+        return upload_job
+
+    def _record_file_info(self, upload_job: UploadJob, file_size: int, checksum: str) -> None:
+        """저장된 파일 크기/체크섬 기록"""
+        upload_job.file_size = file_size
+        upload_job.checksum = checksum
+        self.db.commit()
+        self.db.refresh(upload_job)
+
+    def _report_progress(self, upload_job_id: int, rows_processed: int) -> None:
+        """
+        처리 행 수 기록
+        적재 트랜잭션은 끝날 때 한 번에 커밋되므로, 진행률은 별도 세션으로 바로 커밋합니다
+        (SQLite는 DB 단위 잠금이라 적재 중 다른 연결에서 갱신할 수 없어 생략)
+        """
+        from app.core.database import SessionLocal
+
+        if self.db.get_bind().dialect.name == "sqlite":
+            return
+        progress_db = SessionLocal()
+        try:
+            progress_db.execute(
+                update(UploadJob)
+                .where(UploadJob.id == upload_job_id)
+                .values(rows_processed=rows_processed)
+            )
+            progress_db.commit()
+        except Exception as e:
+            progress_db.rollback()
+            print(f"⚠️ 업로드 진행률 기록 실패: upload_job={upload_job_id}: {e}")
+        finally:
+            progress_db.close()
+
+    def _ingest_file(
+        self,
+        upload_job: UploadJob,
+        upload_path: Path,
+        ingest_mode: str
+    ) -> UploadJob:
+        """저장된 파일 읽기 → 프로파일링 → 판매 데이터 적재 (블로킹 작업, 업로드 작업 스레드에서 실행)"""
+        # CSV는 앞부분 표본 한 번으로 인코딩/구분자/헤더/컬럼 타입을 추정해 재시도 없이 한 번에 읽음
+        csv_format = self.file_handler.sniff(upload_path)
+        encoding = csv_format.encoding if csv_format else None
+        df = self.file_handler.read_file(upload_path, csv_format=csv_format)
+        # 이후 프로파일링/예측/재색인은 원본 대신 타입이 유지되는 Parquet 사본을 읽음
+        parquet_filename = self.file_handler.write_parquet(df, upload_job.stored_filename)
+
+        # 판매 데이터 적재에 필요한 컬럼만 남기고 전체 DataFrame은 바로 해제
+        total_rows = len(df)
+        sales_df = None
+        if SALES_REQUIRED_COLUMNS.issubset(set(map(str.lower, df.columns))):
+            sales_df = df[[c for c in df.columns if c.lower() in SALES_COLUMNS]]
+            sales_df.columns = [c.lower() for c in sales_df.columns]
+        del df
+
+        # 파싱 결과를 먼저 커밋해 조회 API에서 전체 행 수를 볼 수 있게 함
+        upload_job.encoding = encoding
+        upload_job.parquet_filename = parquet_filename
+        upload_job.total_rows = total_rows
+        upload_job.rows_processed = 0
+        self.db.commit()
+
+        # 파일을 청크 단위로 다시 읽으며 프로파일링 (메모리 사용량이 파일 크기에 비례하지 않음)
+        profile_path = (
+            self.file_handler.parquet_path(upload_job.stored_filename) if parquet_filename else upload_path
+        )
+        profile = self.file_handler.profile_file(profile_path, encoding)
+
+        if sales_df is not None:
+            def report(done: int, total: int):
+                # 적재는 (제품, 판매일) 단위로 합산된 행 기준이므로 파일 행 수 비율로 환산
+                self._report_progress(upload_job.id, total_rows * done // total)
+
+            self.load_sales(upload_job.tenant_id, sales_df, ingest_mode, on_progress=report)
+
+        # 프로파일 정보 저장 (profile 데이터에 Timestamp가 있을 수 있으므로 변환)
+        profile_json = self._serialize_profile(profile)
+        # 처리 중에 다른 쪽에서 실패로 정리된 작업은 completed로 덮어쓰지 않음
+        completed = self.db.execute(
+            update(UploadJob)
+            .where(UploadJob.id == upload_job.id, UploadJob.status == "processing")
+            .values(
+                total_rows=profile["total_rows"],
+                total_columns=profile["total_columns"],
+                null_count=profile["null_count"],
+                duplicate_count=profile["duplicate_count"],
+                rows_processed=profile["total_rows"],
+                profile_data=json.dumps(profile_json, ensure_ascii=False),
+                status="completed",
+            )
+        ).rowcount
+        self.db.commit()
+        self.db.refresh(upload_job)
+        if not completed:
+            print(f"⚠️ 처리 중 상태가 바뀐 업로드 작업입니다: upload_job={upload_job.id} status={upload_job.status}")
+            return upload_job
+
+        # 챗봇 검색 인덱스에 새 행 추가 (백그라운드, 색인 시점에 Parquet 사본을 다시 읽음)
+        file_handler, stored_filename = self.file_handler, upload_job.stored_filename
+        retrieval_service.index_upload_async(
+            upload_job.tenant_id,
+            upload_job.id,
+            lambda: file_handler.load_upload(stored_filename, encoding=encoding),
+        )
+        return upload_job
+
+    def _mark_failed(self, upload_job: UploadJob, error_message: str) -> None:
+        """실패 상태 기록 (적재 중이던 트랜잭션은 되돌리고, 이미 확인된 파일 정보는 남김)"""
+        file_info = {
+            "file_size": upload_job.file_size,
+            "checksum": upload_job.checksum,
+            "encoding": upload_job.encoding,
+        }
+        self.db.rollback()
+        # 이미 완료/실패로 기록된 작업은 덮어쓰지 않음
+        self.db.execute(
+            update(UploadJob)
+            .where(UploadJob.id == upload_job.id, UploadJob.status.in_(("pending", "processing")))
+            .values(status="failed", error_message=error_message, **file_info)
+        )
+        self.db.commit()
+        self.db.refresh(upload_job)
     
+    def _fetch_product_ids(self, tenant_id: int, skus: List[str]) -> Dict[str, int]:
+        """SKU 목록에 해당하는 기존 제품 ID 조회 (IN 절을 청크로 나눠 조회)"""
+        from app.models.product import Product
+
+        sku_to_id = {}
+        for i in range(0, len(skus), SKU_QUERY_CHUNK):
+            chunk = skus[i:i + SKU_QUERY_CHUNK]
+            rows = self.db.execute(
+                select(Product.sku, Product.id).where(
+                    Product.tenant_id == tenant_id,
+                    Product.sku.in_(chunk)
+                )
+            ).all()
+            sku_to_id.update({sku: product_id for sku, product_id in rows})
+        return sku_to_id
+
+    def resolve_product_ids(self, tenant_id: int, skus: Iterable[str]) -> Dict[str, int]:
+        """
+        SKU → 제품 ID 매핑 일괄 생성
+        기존 제품은 한 번에 조회하고, 없는 SKU는 다중 행 INSERT로 한 번에 생성합니다
+        (tenant_id, sku) 유니크 제약이 있으므로 동시 업로드로 이미 생성된 SKU는 무시 후 다시 조회합니다
+        """
+        from app.models.product import Product
+
+        skus = list(dict.fromkeys(str(sku) for sku in skus))
+        sku_to_id = self._fetch_product_ids(tenant_id, skus)
+
+        missing = [sku for sku in skus if sku not in sku_to_id]
+        if missing:
+            stmt = (
+                insert(Product)
+                .prefix_with("IGNORE", dialect="mysql")
+                .prefix_with("OR IGNORE", dialect="sqlite")
+            )
+            self.db.execute(stmt, [
+                {"tenant_id": tenant_id, "sku": sku, "name": sku}
+                for sku in missing
+            ])
+            sku_to_id.update(self._fetch_product_ids(tenant_id, missing))
+
+        return sku_to_id
+
+    def build_sales_frame(
+        self,
+        tenant_id: int,
+        df: pd.DataFrame,
+        sku_to_id: Dict[str, int]
+    ) -> pd.DataFrame:
+        """
+        업로드 DataFrame을 sales 테이블 컬럼 형태로 변환 (컬럼 단위 벡터 연산)
+        df 컬럼은 소문자(sale_date, sku, quantity, revenue)로 정규화되어 있어야 합니다
+        """
+        try:
+            sale_dates = pd.to_datetime(df["sale_date"])
+        except ValueError:
+            # 행마다 날짜 형식이 다른 파일
+            sale_dates = pd.to_datetime(df["sale_date"], format="mixed")
+
+        if "revenue" in df.columns:
+            revenue = pd.to_numeric(df["revenue"], errors="coerce").fillna(0.0).astype(float)
+        else:
+            revenue = 0.0
+
+        sales = pd.DataFrame({
+            "tenant_id": tenant_id,
+            "product_id": df["sku"].astype(str).map(sku_to_id),
+            "sale_date": sale_dates.dt.date,  # Python date 객체
+            "quantity": df["quantity"].astype(float),
+            "revenue": revenue,
+        })
+
+        # 자연키(tenant_id, product_id, sale_date)당 한 행으로 합산
+        sales = sales.groupby(SALES_KEY, as_index=False, sort=False)[["quantity", "revenue"]].sum()
+
+        now = datetime.utcnow()
+        sales["created_at"] = now
+        sales["updated_at"] = now
+        return sales
+
+    def _sales_insert(self, mode: str):
+        """적재 모드에 맞는 INSERT 문 (MySQL / SQLite)"""
+        from app.models.sales import Sales
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "mysql":
+            stmt = mysql_insert(Sales)
+            if mode == "append":
+                return stmt.prefix_with("IGNORE")
+            if mode == "upsert-sum":
+                return stmt.on_duplicate_key_update(
+                    quantity=Sales.quantity + stmt.inserted.quantity,
+                    revenue=func.coalesce(Sales.revenue, 0) + stmt.inserted.revenue,
+                    updated_at=stmt.inserted.updated_at,
+                )
+            return stmt
+
+        if dialect == "sqlite":
+            stmt = sqlite_insert(Sales)
+            if mode == "append":
+                return stmt.on_conflict_do_nothing(index_elements=SALES_KEY)
+            if mode == "upsert-sum":
+                return stmt.on_conflict_do_update(
+                    index_elements=SALES_KEY,
+                    set_={
+                        "quantity": Sales.quantity + stmt.excluded.quantity,
+                        "revenue": func.coalesce(Sales.revenue, 0) + stmt.excluded.revenue,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+            return stmt
+
+        raise ValueError(f"지원하지 않는 데이터베이스입니다: {dialect}")
+
+    def _delete_sales_range(self, tenant_id: int, sales: pd.DataFrame) -> None:
+        """업로드 파일의 기간(최소~최대 판매일) 안에서 파일에 포함된 제품의 기존 판매 데이터 삭제"""
+        from app.models.sales import Sales
+
+        start, end = min(sales["sale_date"]), max(sales["sale_date"])
+        product_ids = [int(pid) for pid in sales["product_id"].unique()]
+        for i in range(0, len(product_ids), SKU_QUERY_CHUNK):
+            self.db.execute(
+                delete(Sales).where(
+                    Sales.tenant_id == tenant_id,
+                    Sales.sale_date >= start,
+                    Sales.sale_date <= end,
+                    Sales.product_id.in_(product_ids[i:i + SKU_QUERY_CHUNK])
+                )
+            )
+
+    def insert_sales(
+        self,
+        sales: pd.DataFrame,
+        mode: str = "append",
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        판매 행을 청크 단위 Core executemany로 적재
+        on_progress: 청크마다 (적재한 행 수, 전체 행 수)로 호출
+        """
+        stmt = self._sales_insert(mode)
+        for start in range(0, len(sales), SALES_INSERT_CHUNK):
+            chunk = sales.iloc[start:start + SALES_INSERT_CHUNK]
+            self.db.execute(stmt, chunk.to_dict("records"))
+            if on_progress is not None:
+                on_progress(start + len(chunk), len(sales))
+        return len(sales)
+
+    def load_sales(
+        self,
+        tenant_id: int,
+        df: pd.DataFrame,
+        mode: str = DEFAULT_INGEST_MODE,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        업로드 DataFrame의 판매 데이터를 sales 테이블에 적재하고 적재 행 수를 반환
+        mode:
+          - append: 이미 있는 (제품, 판매일) 행은 유지하고 새 행만 추가
+          - replace-range: 파일 기간 안의 해당 제품 데이터를 파일 내용으로 교체 (재업로드 시 멱등)
+          - upsert-sum: 이미 있는 행에는 수량/매출을 더하고 새 행은 추가 (증분 파일용)
+        """
+        if mode not in INGEST_MODES:
+            raise ValueError(f"지원하지 않는 적재 모드입니다: {mode} (허용: {', '.join(INGEST_MODES)})")
+
+        sku_to_id = self.resolve_product_ids(tenant_id, df["sku"].astype(str).unique())
+        sales = self.build_sales_frame(tenant_id, df, sku_to_id)
+        if sales.empty:
+            return 0
+
+        if mode == "replace-range":
+            self._delete_sales_range(tenant_id, sales)
+        inserted = self.insert_sales(sales, mode, on_progress)
+        # 적재한 기간의 월별 집계를 같은 트랜잭션에서 갱신
+        refresh_monthly(self.db, tenant_id, min(sales["sale_date"]), max(sales["sale_date"]))
+        self.db.commit()
+        return inserted
+
     def _serialize_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         """
         프로파일 데이터를 JSON 직렬화 가능하도록 변환
@@ -170,10 +478,193 @@ class UploadService:
         upload_job = self.get_upload_job(upload_job_id, tenant_id)
         if not upload_job:
             return None
-        
+        return self.build_profile(upload_job)
+
+    @staticmethod
+    def build_profile(upload_job: UploadJob) -> Dict[str, Any]:
+        """업로드 작업 + 프로파일(JSON 파싱) 응답 구성"""
         profile = json.loads(upload_job.profile_data) if upload_job.profile_data else {}
         
         return {
             "upload_job": upload_job,
             "profile": profile
-        }
\ No newline at end of file
+        }
+
+
+# ========== 백그라운드 업로드 처리 ==========
+def run_upload_job(upload_job_id: int, ingest_mode: str = DEFAULT_INGEST_MODE) -> None:
+    """
+    업로드 작업 스레드에서 저장된 파일 처리 (processing → completed/failed)
+    요청 세션과 분리된 새 세션을 사용합니다
+    """
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        # pending인 작업만 가져감 (중단된 작업으로 정리되어 실패 처리된 경우 등은 건너뜀)
+        claimed = db.execute(
+            update(UploadJob)
+            .where(UploadJob.id == upload_job_id, UploadJob.status == "pending")
+            .values(status="processing")
+        ).rowcount
+        db.commit()
+        if not claimed:
+            return
+        upload_job = db.get(UploadJob, upload_job_id)
+
+        service = UploadService(db)
+        upload_path = service.file_handler.upload_dir / upload_job.stored_filename
+        try:
+            service._ingest_file(upload_job, upload_path, ingest_mode)
+            # 판매 데이터가 바뀌었으므로 해당 회사의 분석 응답 캐시 무효화
+            analytics_cache.invalidate(upload_job.tenant_id)
+        except Exception as e:
+            service._mark_failed(upload_job, str(e))
+            print(f"Upload error: {traceback.format_exc()}")
+    finally:
+        db.close()
+
+
+STALE_JOB_MESSAGE = "서버 재시작 등으로 처리가 중단되었습니다. 파일을 다시 업로드해주세요."
+
+
+def is_stale_upload_job(upload_job: UploadJob, now: Optional[datetime] = None) -> bool:
+    """
+    처리 중단 여부: pending/processing인데 UPLOAD_STALE_SECONDS 동안 갱신이 없음
+    (작업은 프로세스 메모리의 스레드 풀에만 있으므로 재시작/크래시 시 이어서 처리되지 않음)
+    이 프로세스의 풀이 맡고 있는 작업은 제외하고, 다른 워커 프로세스가 맡은 작업은 하트비트로 updated_at이 갱신됩니다
+    """
+    if upload_job.status not in ("pending", "processing") or upload_pool.owns(upload_job.id):
+        return False
+    cutoff = (now or datetime.utcnow()) - timedelta(seconds=settings.UPLOAD_STALE_SECONDS)
+    return upload_job.updated_at is not None and upload_job.updated_at < cutoff
+
+
+def fail_stale_upload_jobs() -> int:
+    """
+    중단된 업로드 작업을 실패로 정리 (서버 시작 시 호출), 정리한 작업 수 반환
+    여러 워커 프로세스가 떠 있을 수 있으므로 다른 워커가 처리 중일 수 있는 최근 작업은 건드리지 않습니다
+    """
+    from app.core.database import SessionLocal
+
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.UPLOAD_STALE_SECONDS)
+    stale = update(UploadJob).where(
+        UploadJob.status.in_(("pending", "processing")), UploadJob.updated_at < cutoff
+    )
+    in_flight = upload_pool.in_flight()
+    if in_flight:
+        stale = stale.where(UploadJob.id.notin_(in_flight))
+    db = SessionLocal()
+    try:
+        count = db.execute(stale.values(status="failed", error_message=STALE_JOB_MESSAGE)).rowcount
+        db.commit()
+        if count:
+            print(f"⚠️ 중단된 업로드 작업 {count}건을 실패로 정리했습니다.")
+        return count
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ 중단된 업로드 작업 정리 실패: {e}")
+        return 0
+    finally:
+        db.close()
+
+
+def touch_upload_jobs(upload_job_ids: List[int]) -> None:
+    """대기/처리 중인 작업의 updated_at 갱신 (하트비트)"""
+    from app.core.database import SessionLocal
+
+    if not upload_job_ids:
+        return
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(UploadJob)
+            .where(UploadJob.id.in_(upload_job_ids), UploadJob.status.in_(("pending", "processing")))
+            .values(updated_at=datetime.utcnow())
+        )
+        db.commit()
+    except Exception as e:
+        # SQLite는 적재 트랜잭션 중 잠겨 있을 수 있음 (이 프로세스의 작업은 owns()로도 보호됨)
+        db.rollback()
+        print(f"⚠️ 업로드 작업 하트비트 기록 실패: {e}")
+    finally:
+        db.close()
+
+
+class UploadWorkerPool:
+    """
+    업로드 처리용 스레드 풀
+    큰 파일 파싱/적재가 HTTP 요청을 붙잡지 않도록 백그라운드에서 처리하고,
+    DataFrame이 동시에 너무 많이 메모리에 올라오지 않도록 대기 작업 수를 제한합니다
+    맡은 작업(대기 + 실행 중)은 주기적으로 updated_at을 갱신해 중단된 작업으로 정리되지 않게 합니다
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._in_flight: Set[int] = set()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="upload-worker"
+                )
+            if self._heartbeat is None:
+                self._stop = threading.Event()
+                self._heartbeat = threading.Thread(
+                    target=self._heartbeat_loop, args=(self._stop,), name="upload-heartbeat", daemon=True
+                )
+                self._heartbeat.start()
+            return self._executor
+
+    def _heartbeat_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(settings.UPLOAD_HEARTBEAT_SECONDS):
+            touch_upload_jobs(self.in_flight())
+
+    def owns(self, upload_job_id: int) -> bool:
+        """이 프로세스에서 대기/처리 중인 작업인지"""
+        with self._lock:
+            return upload_job_id in self._in_flight
+
+    def in_flight(self) -> List[int]:
+        with self._lock:
+            return sorted(self._in_flight)
+
+    def _finish(self, upload_job_id: int) -> None:
+        with self._lock:
+            self._in_flight.discard(upload_job_id)
+        self._slots.release()
+
+    def submit(self, upload_job_id: int, ingest_mode: str = DEFAULT_INGEST_MODE) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise UploadQueueFull("대기 중인 업로드 작업이 너무 많습니다.")
+        executor = self._get_executor()
+        with self._lock:
+            self._in_flight.add(upload_job_id)
+        try:
+            future = executor.submit(run_upload_job, upload_job_id, ingest_mode)
+        except Exception:
+            self._finish(upload_job_id)
+            raise
+        future.add_done_callback(lambda _: self._finish(upload_job_id))
+        return future
+
+    def shutdown(self):
+        with self._lock:
+            self._stop.set()
+            self._heartbeat = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+upload_pool = UploadWorkerPool(
+    max_workers=settings.UPLOAD_WORKERS,
+    max_pending=settings.UPLOAD_MAX_PENDING,
+)
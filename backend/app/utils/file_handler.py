@@ -3,7 +3,14 @@ import hashlib
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Sequence
+
+from app.utils import readers
+from app.utils.profiler import DEFAULT_CHUNK_SIZE, profile_chunks
+from app.utils.sniffer import CsvFormat, sniff_csv
+
+
+PARQUET_DIR_NAME = "parquet_store"
 
 
 class FileHandler:
@@ -12,6 +19,8 @@ class FileHandler:
     def __init__(self, upload_dir: str = "uploads"):
         self.upload_dir = Path(upload_dir)
         self.upload_dir.mkdir(exist_ok=True)
+        # 업로드 파일을 한 번 파싱해 저장해 두는 Parquet 사본 (업로드 폴더 옆)
+        self.parquet_dir = self.upload_dir.parent / PARQUET_DIR_NAME
     
     def generate_unique_filename(self, original_filename: str) -> str:
         """고유한 파일명 생성"""
@@ -27,54 +36,131 @@ class FileHandler:
                 md5.update(chunk)
         return md5.hexdigest()
     
+    def sniff(self, file_path: Path) -> Optional[CsvFormat]:
+        """CSV 형식(인코딩/구분자/헤더/컬럼 타입) 추정, CSV가 아니면 None"""
+        if file_path.suffix.lower() != '.csv':
+            return None
+        return sniff_csv(file_path)
+
     def detect_encoding(self, file_path: Path) -> str:
-        """파일 인코딩 감지"""
-        encodings = ['utf-8', 'cp949', 'euc-kr', 'latin1']
-        
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    f.read(1024)  # 일부만 읽어서 테스트
-                return encoding
-            except UnicodeDecodeError:
-                continue
-        
-        return 'utf-8'  # 기본값
+        """파일 인코딩 감지 (앞부분 표본을 한 번 읽어 판별)"""
+        return sniff_csv(file_path).encoding
     
-    def read_file(self, file_path: Path, encoding: Optional[str] = None) -> pd.DataFrame:
-        """파일 읽기 (CSV/Excel)"""
+    def read_file(
+        self,
+        file_path: Path,
+        encoding: Optional[str] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        usecols: Optional[Sequence[str]] = None,
+        csv_format: Optional[CsvFormat] = None
+    ) -> pd.DataFrame:
+        """
+        파일 읽기 (CSV/Excel)
+        CSV는 pyarrow, Excel은 calamine 엔진을 우선 사용하고 없으면 기본 엔진으로 읽습니다
+        (CSV_READER_ENGINE / EXCEL_READER_ENGINE 설정)
+        CSV는 추정한 형식(csv_format, 없으면 여기서 추정)으로 한 번에 읽습니다
+        """
         file_ext = file_path.suffix.lower()
         
         if file_ext == '.csv':
-            if encoding is None:
-                encoding = self.detect_encoding(file_path)
-            return pd.read_csv(file_path, encoding=encoding)
+            csv_format = csv_format or self.sniff(file_path)
+            if encoding is not None:
+                csv_format = csv_format._replace(encoding=encoding)
+            return readers.read_csv(file_path, dtype=dtype, usecols=usecols, csv_format=csv_format)
         
         elif file_ext in ['.xlsx', '.xls']:
-            return pd.read_excel(file_path)
+            return readers.read_excel(file_path, dtype=dtype, usecols=usecols)
         
         else:
             raise ValueError(f"Unsupported file type: {file_ext}")
     
-    def profile_data(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """데이터 프로파일링"""
-        profile = {
-            "shape": df.shape,
-            "total_rows": len(df),
-            "total_columns": len(df.columns),
-            "columns": df.columns.tolist(),
-            "dtypes": df.dtypes.astype(str).to_dict(),
-            "null_count": int(df.isnull().sum().sum()),
-            "null_by_column": df.isnull().sum().to_dict(),
-            "duplicate_count": int(df.duplicated().sum()),
-            "memory_usage": int(df.memory_usage(deep=True).sum()),
-            "head": df.head(5).to_dict(orient='records'),
-            "statistics": {}
-        }
-        
-        # 숫자 컬럼 통계
-        numeric_cols = df.select_dtypes(include=['number']).columns
-        if len(numeric_cols) > 0:
-            profile["statistics"]["numeric"] = df[numeric_cols].describe().to_dict()
-        
-        return profile
\ No newline at end of file
+    def iter_chunks(
+        self,
+        file_path: Path,
+        encoding: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        파일을 청크 단위로 읽기 (CSV는 chunksize 스트리밍, Parquet은 배치 단위, Excel은 전체를 읽어 나눔)
+        pyarrow 엔진은 chunksize를 지원하지 않으므로 CSV는 기본(c) 엔진으로 읽습니다
+        """
+        if file_path.suffix.lower() == '.parquet':
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        elif file_path.suffix.lower() == '.csv':
+            csv_format = self.sniff(file_path)
+            options = csv_format.read_csv_kwargs()
+            with pd.read_csv(
+                file_path, encoding=encoding or csv_format.encoding, chunksize=chunk_size, **options
+            ) as reader:
+                yield from reader
+        else:
+            df = self.read_file(file_path, encoding)
+            for start in range(0, len(df), chunk_size):
+                yield df.iloc[start:start + chunk_size]
+
+    def profile_file(
+        self,
+        file_path: Path,
+        encoding: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """파일 전체를 메모리에 올리지 않고 청크 단위로 프로파일링 (Parquet 사본도 지원)"""
+        expected_rows = None
+        if file_path.suffix.lower() == '.parquet':
+            import pyarrow.parquet as pq
+
+            expected_rows = pq.ParquetFile(file_path).metadata.num_rows
+        return profile_chunks(self.iter_chunks(file_path, encoding, chunk_size), expected_rows=expected_rows)
+
+    def parquet_path(self, stored_filename: str) -> Path:
+        return self.parquet_dir / f"{stored_filename}.parquet"
+
+    def write_parquet(self, df: pd.DataFrame, stored_filename: str) -> Optional[str]:
+        """
+        파싱한 업로드 데이터를 타입이 유지되는 Parquet 사본으로 저장하고 파일명 반환
+        Parquet으로 표현할 수 없는 데이터(한 컬럼에 숫자/문자 혼합 등)면 None (원본 파일을 계속 사용)
+        """
+        path = self.parquet_path(stored_filename)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.parquet_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)  # 읽는 쪽에서 쓰다 만 파일을 보지 않도록 이름 변경으로 교체
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"⚠️ Parquet 변환 실패, 원본 파일을 사용합니다: {stored_filename}: {e}")
+            return None
+        return path.name
+
+    def load_upload(
+        self,
+        stored_filename: str,
+        columns: Optional[Sequence[str]] = None,
+        encoding: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        업로드 데이터 읽기
+        Parquet 사본이 있으면 필요한 컬럼만 읽고, 없으면(변환 기능 도입 전 업로드 등)
+        원본을 한 번 파싱해 사본을 만든 뒤 반환합니다
+        """
+        path = self.parquet_path(stored_filename)
+        if path.exists():
+            return readers.read_parquet(path, columns)
+
+        df = self.read_file(self.upload_dir / stored_filename, encoding)
+        self.write_parquet(df, stored_filename)
+        return df[list(columns)] if columns is not None else df
+
+    def profile_data(self, df: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        데이터 프로파일링
+        이미 읽은 DataFrame도 청크 단위로 훑어서 duplicated()/deep memory_usage 같은
+        전체 크기의 임시 배열을 만들지 않습니다
+        """
+        return profile_chunks(
+            (df.iloc[start:start + chunk_size] for start in range(0, max(len(df), 1), chunk_size)),
+            expected_rows=len(df),
+        )
@@ -0,0 +1,313 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNK_SIZE = 100_000  # 청크당 행 수
+RESERVOIR_SIZE = 10_000       # 분위수 계산용 컬럼별 표본 수 (이하 행 수면 정확값)
+HLL_PRECISION = 12            # HyperLogLog 레지스터 2^12개 (오차 약 1.6%)
+BLOOM_BITS_PER_ROW = 24       # 중복 행 판별 Bloom 필터 행당 비트 수 (해시 12개 기준 오탐 약 0.001%)
+BLOOM_MIN_BITS = 1 << 13      # 필터 최소 크기 (1KB)
+BLOOM_HASHES = 12
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """uint64 배열의 비트 길이 (정확한 정수 연산)"""
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.uint64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        length[mask] += np.uint64(shift)
+        values[mask] >>= np.uint64(shift)
+    return length + (values > 0).astype(np.uint64)
+
+
+def _hash_values(series: pd.Series) -> np.ndarray:
+    """값 해시 (청크마다 int/float로 다르게 읽힌 같은 숫자가 같은 해시가 되도록 float로 통일)"""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        series = series.astype("float64")
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _merge_dtype(current, new):
+    """청크별 dtype을 전체 파일을 한 번에 읽었을 때의 dtype으로 합침"""
+    if current is None or current == new:
+        return new
+    if _is_numeric(current) and _is_numeric(new):
+        return np.result_type(current, new)
+    return np.dtype(object)
+
+
+class HyperLogLog:
+    """근사 고유값 개수 (메모리: 2^precision 바이트)"""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rank = (np.uint64(64 - self.precision) - _bit_length(rest) + np.uint64(1)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # 작은 개수 보정 (linear counting)
+        return int(round(estimate))
+
+
+class BloomFilter:
+    """이미 본 행 해시 판별 (오탐 가능, 미탐 없음)"""
+
+    def __init__(self, bits: int, hashes: int = BLOOM_HASHES):
+        self.bits = max(BLOOM_MIN_BITS, -(-bits // 8) * 8)
+        self.hashes = hashes
+        self.array = np.zeros(self.bits // 8, dtype=np.uint8)
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        # 64비트 해시 하나를 두 개로 나눠 k개 위치 생성 (double hashing)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.hashes, dtype=np.uint64)
+        return (h1[:, None] + steps[None, :] * h2[:, None]) % np.uint64(self.bits)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        if not len(hashes):
+            return np.zeros(0, dtype=bool)
+        positions = self._positions(hashes)
+        bytes_index = (positions >> np.uint64(3)).astype(np.intp)
+        masks = (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+        return np.all(self.array[bytes_index] & masks, axis=1)
+
+    def add(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        # 같은 바이트에 여러 비트를 세팅하는 경우를 합쳐서 기록 (정렬 후 바이트별 OR)
+        flat = np.sort(self._positions(hashes).ravel())
+        flat_bytes = (flat >> np.uint64(3)).astype(np.intp)
+        flat_masks = (np.uint8(1) << (flat & np.uint64(7)).astype(np.uint8))
+        starts = np.flatnonzero(np.r_[True, flat_bytes[1:] != flat_bytes[:-1]])
+        self.array[flat_bytes[starts]] |= np.bitwise_or.reduceat(flat_masks, starts)
+
+    def add_and_check(self, hashes: np.ndarray) -> np.ndarray:
+        """각 해시가 이미 추가되어 있었는지 반환하고 모두 추가 (hashes 안에는 중복이 없어야 함)"""
+        seen = self.contains(hashes)
+        self.add(hashes)
+        return seen
+
+
+class ScalableBloomFilter:
+    """
+    행 수에 맞춰 커지는 Bloom 필터 (필터가 용량만큼 차면 2배 용량의 필터를 추가)
+    예상 행 수를 알면 한 번에 그 크기로, 모르면(CSV 스트리밍) 첫 청크 크기부터 시작합니다
+    메모리: 최종 행 수 × BLOOM_BITS_PER_ROW 비트의 약 2배 이하 (10행 파일은 1KB)
+    """
+
+    def __init__(self, initial_capacity: int, bits_per_row: int = BLOOM_BITS_PER_ROW):
+        self.bits_per_row = bits_per_row
+        self.filters: List[BloomFilter] = []
+        self._next_capacity = max(int(initial_capacity), 1)
+        self._room = 0  # 마지막 필터에 남은 용량
+
+    @property
+    def nbytes(self) -> int:
+        return sum(f.array.nbytes for f in self.filters)
+
+    def _grow(self) -> None:
+        capacity = self._next_capacity
+        self.filters.append(BloomFilter(capacity * self.bits_per_row))
+        self._room = capacity
+        self._next_capacity = capacity * 2
+
+    def add_and_check(self, hashes: np.ndarray) -> np.ndarray:
+        """각 해시가 이미 추가되어 있었는지 반환하고 새 해시를 추가 (hashes 안에는 중복이 없어야 함)"""
+        seen = np.zeros(len(hashes), dtype=bool)
+        for bloom in self.filters:
+            seen |= bloom.contains(hashes)
+        new = hashes[~seen]
+        while len(new):
+            if self._room <= 0:
+                self._grow()
+            take = new[:self._room]
+            self.filters[-1].add(take)
+            self._room -= len(take)
+            new = new[len(take):]
+        return seen
+
+
+class _NumericStats:
+    """숫자 컬럼 하나의 통계 (청크 단위 Welford 병합 + 분위수용 표본)"""
+
+    def __init__(self, reservoir_size: int, rng: np.random.Generator):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.reservoir_size = reservoir_size
+        self.rng = rng
+        self.keys = np.empty(0)
+        self.sample = np.empty(0)
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if not n:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        # 무작위 키가 가장 작은 reservoir_size개를 유지 (균등 표본)
+        keys = np.concatenate([self.keys, self.rng.random(n)])
+        sample = np.concatenate([self.sample, values])
+        if len(keys) > self.reservoir_size:
+            keep = np.argpartition(keys, self.reservoir_size)[:self.reservoir_size]
+            keys, sample = keys[keep], sample[keep]
+        self.keys, self.sample = keys, sample
+
+    def describe(self) -> Dict[str, float]:
+        """DataFrame.describe()와 같은 키 (count/mean/std/min/25%/50%/75%/max)"""
+        if not self.count:
+            return {"count": 0.0, "mean": np.nan, "std": np.nan, "min": np.nan,
+                    "25%": np.nan, "50%": np.nan, "75%": np.nan, "max": np.nan}
+        q25, q50, q75 = np.quantile(self.sample, [0.25, 0.5, 0.75])
+        return {
+            "count": float(self.count),
+            "mean": self.mean,
+            "std": float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan,
+            "min": self.min,
+            "25%": float(q25),
+            "50%": float(q50),
+            "75%": float(q75),
+            "max": self.max,
+        }
+
+
+class StreamingProfiler:
+    """
+    청크 단위 데이터 프로파일링 (파일을 한 번만 훑음)
+    메모리는 청크 하나 + 컬럼별 고정 크기 요약에 중복 판별 필터(행당 3~6바이트)만 더해집니다
+    - 결측치/행 수/메모리: 정확
+    - 평균/표준편차/최소/최대: 정확 (청크 통계 병합)
+    - 분위수: 표본 기반 근사 (행 수가 reservoir_size 이하이면 정확)
+    - 고유값 개수: HyperLogLog 근사
+    - 중복 행 수: Bloom 필터 기반 근사 (오탐으로 약간 많게 셀 수 있음)
+    """
+
+    def __init__(
+        self,
+        reservoir_size: int = RESERVOIR_SIZE,
+        hll_precision: int = HLL_PRECISION,
+        expected_rows: Optional[int] = None,
+        seed: int = 0,
+    ):
+        """expected_rows: 전체 행 수 (알면 중복 판별 필터를 한 번에 그 크기로 생성)"""
+        self.reservoir_size = reservoir_size
+        self.hll_precision = hll_precision
+        self.rng = np.random.default_rng(seed)
+        self.expected_rows = expected_rows
+        self.bloom: Optional[ScalableBloomFilter] = None
+        self.columns: Optional[List[str]] = None
+        self.dtypes: Dict[str, Any] = {}
+        self.null_by_column: Dict[str, int] = {}
+        self.numeric: Dict[str, _NumericStats] = {}
+        self.distinct: Dict[str, HyperLogLog] = {}
+        self.head: List[Dict[str, Any]] = []
+        self.total_rows = 0
+        self.duplicate_count = 0
+        self.memory_usage = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.columns is None:
+            self.columns = chunk.columns.tolist()
+            for col in self.columns:
+                self.null_by_column[col] = 0
+                self.distinct[col] = HyperLogLog(self.hll_precision)
+        elif chunk.columns.tolist() != self.columns:
+            raise ValueError("청크의 컬럼 구성이 첫 청크와 다릅니다")
+
+        if len(self.head) < 5:
+            self.head.extend(chunk.head(5 - len(self.head)).to_dict(orient="records"))
+        self.total_rows += len(chunk)
+        self.memory_usage += int(chunk.memory_usage(deep=True).sum())
+
+        row_hashes = np.zeros(len(chunk), dtype=np.uint64)
+        for position, col in enumerate(self.columns):
+            series = chunk.iloc[:, position]
+            self.dtypes[col] = _merge_dtype(self.dtypes.get(col), series.dtype)
+
+            notna = series.notna()
+            self.null_by_column[col] += int(len(series) - notna.sum())
+
+            hashes = _hash_values(series)
+            # 행 해시: 컬럼 위치를 반영해 컬럼 값 해시를 섞음 (a,b)와 (b,a)를 구분
+            row_hashes = row_hashes * np.uint64(0x100000001B3) ^ hashes
+            self.distinct[col].add_hashes(hashes[notna.to_numpy()])
+
+            if _is_numeric(self.dtypes[col]):
+                if col not in self.numeric:
+                    self.numeric[col] = _NumericStats(self.reservoir_size, self.rng)
+                self.numeric[col].update(series.to_numpy(dtype=np.float64, na_value=np.nan))
+
+        # 청크 안의 중복은 정확히, 이전 청크와의 중복은 Bloom 필터로 판별
+        if self.bloom is None:
+            self.bloom = ScalableBloomFilter(self.expected_rows or len(chunk))
+        first = ~pd.Series(row_hashes).duplicated().to_numpy()
+        self.duplicate_count += int(len(row_hashes) - first.sum())
+        self.duplicate_count += int(self.bloom.add_and_check(row_hashes[first]).sum())
+
+    def result(self) -> Dict[str, Any]:
+        """FileHandler.profile_data와 같은 형태의 프로파일 (+ 컬럼별 근사 고유값 개수)"""
+        columns = self.columns or []
+        profile = {
+            "shape": (self.total_rows, len(columns)),
+            "total_rows": self.total_rows,
+            "total_columns": len(columns),
+            "columns": columns,
+            "dtypes": {col: str(self.dtypes[col]) for col in columns},
+            "null_count": int(sum(self.null_by_column.values())),
+            "null_by_column": dict(self.null_by_column),
+            "duplicate_count": self.duplicate_count,
+            "memory_usage": self.memory_usage,
+            "head": self.head,
+            "distinct_by_column": {col: self.distinct[col].count() for col in columns},
+            "statistics": {}
+        }
+
+        # 숫자 컬럼 통계 (중간에 문자열이 섞여 object가 된 컬럼은 제외)
+        numeric = {
+            col: self.numeric[col].describe()
+            for col in columns
+            if col in self.numeric and _is_numeric(self.dtypes[col])
+        }
+        if numeric:
+            profile["statistics"]["numeric"] = numeric
+        return profile
+
+
+def profile_chunks(chunks: Iterable[pd.DataFrame], **kwargs) -> Dict[str, Any]:
+    """DataFrame 청크 스트림 프로파일링"""
+    profiler = StreamingProfiler(**kwargs)
+    for chunk in chunks:
+        profiler.update(chunk)
+    return profiler.result()
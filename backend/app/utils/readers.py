@@ -0,0 +1,141 @@
+import datetime
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.utils.sniffer import CsvFormat
+
+
+# 우선순위 순서 (앞쪽 엔진이 설치되어 있지 않거나 실패하면 다음 엔진으로 재시도)
+CSV_ENGINES = ("pyarrow", "c")
+EXCEL_ENGINES = ("calamine", "openpyxl")
+
+# 엔진별 필요한 패키지
+ENGINE_MODULES = {
+    "pyarrow": "pyarrow",
+    "c": None,
+    "calamine": "python_calamine",
+    "openpyxl": "openpyxl",
+}
+
+
+def engine_installed(engine: str) -> bool:
+    module = ENGINE_MODULES.get(engine)
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+def available_engines() -> Dict[str, List[str]]:
+    """설치된 CSV/Excel 읽기 엔진 (우선순위 순서)"""
+    return {
+        "csv": [e for e in CSV_ENGINES if engine_installed(e)],
+        "excel": [e for e in EXCEL_ENGINES if engine_installed(e)],
+    }
+
+
+def _candidates(engine: str, engines: Sequence[str]) -> List[str]:
+    """auto면 설치된 엔진 전체(우선순위 순), 지정 시 해당 엔진 후 나머지를 대체 엔진으로 사용"""
+    if engine == "auto":
+        order = list(engines)
+    elif engine in engines:
+        order = [engine] + [e for e in engines if e != engine]
+    else:
+        raise ValueError(f"지원하지 않는 읽기 엔진입니다: {engine} (허용: auto, {', '.join(engines)})")
+    return [e for e in order if engine_installed(e)]
+
+
+def _date_text(value: Any) -> Any:
+    if value is None or value is pd.NaT:
+        return np.nan
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return np.nan
+
+
+def _normalize_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    pyarrow 엔진은 YYYY-MM-DD 형식 컬럼을 date 객체로, YYYY-MM-DD HH:MM:SS 형식 컬럼을 datetime64로 읽으므로
+    기본(c) 엔진과 결과(문자열 컬럼, 결측치 NaN)가 같도록 ISO 문자열로 되돌림
+    (어느 엔진으로 읽혔는지에 따라 컬럼 타입이 달라지지 않도록 함,
+    T 구분자/소수점 초가 있는 시각은 YYYY-MM-DD HH:MM:SS[.ffffff] 형태로 통일됨)
+    """
+    for col in df.columns:
+        series = df[col]
+        if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if series.dtype != object:
+                continue
+            first = series.first_valid_index()
+            if first is None or type(series.at[first]) is not datetime.date:
+                continue
+        # 리스트에서 다시 만들어 c 엔진과 같은 문자열 타입으로 추론되게 함 (pandas 버전별 object/str)
+        df[col] = pd.Series([_date_text(v) for v in series], index=df.index, name=col)
+    return df
+
+
+def read_csv(
+    file_path: Path,
+    encoding: str = "utf-8",
+    engine: Optional[str] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    usecols: Optional[Sequence[str]] = None,
+    csv_format: Optional[CsvFormat] = None,
+) -> pd.DataFrame:
+    """
+    CSV 읽기
+    pyarrow가 설치되어 있으면 멀티스레드 pyarrow 엔진을 사용하고, 설치되어 있지 않거나
+    pyarrow가 읽지 못하는 파일이면 기본(c) 엔진으로 다시 읽습니다
+    dtype/usecols: 컬럼 타입 지정 / 필요한 컬럼만 읽기 (두 엔진 공통)
+    csv_format: sniff_csv 결과 (인코딩/구분자/헤더 위치/문자열 컬럼 타입을 그대로 사용)
+    """
+    options: Dict[str, Any] = {}
+    if csv_format is not None:
+        options = csv_format.read_csv_kwargs()
+        encoding = csv_format.encoding
+        dtype = {**(options.pop("dtype") or {}), **(dtype or {})} or None
+        if csv_format.skiprows and engine is None:
+            # pyarrow 엔진은 헤더 앞 제목 줄 건너뛰기를 c 엔진과 다르게 처리하므로 바로 c 엔진 사용
+            engine = "c"
+
+    last_error: Optional[Exception] = None
+    for candidate in _candidates(engine or settings.CSV_READER_ENGINE, CSV_ENGINES):
+        try:
+            df = pd.read_csv(
+                file_path, encoding=encoding, engine=candidate, dtype=dtype, usecols=usecols, **options
+            )
+        except (ImportError, ValueError) as e:
+            last_error = e
+            continue
+        return _normalize_dates(df) if candidate == "pyarrow" else df
+    raise last_error
+
+
+def read_excel(
+    file_path: Path,
+    engine: Optional[str] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    usecols: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Excel 읽기
+    python-calamine이 설치되어 있으면 calamine(Rust) 엔진을 사용하고 (.xls도 지원),
+    없거나 실패하면 openpyxl로 다시 읽습니다
+    """
+    last_error: Optional[Exception] = None
+    for candidate in _candidates(engine or settings.EXCEL_READER_ENGINE, EXCEL_ENGINES):
+        try:
+            return pd.read_excel(file_path, engine=candidate, dtype=dtype, usecols=usecols)
+        except (ImportError, ValueError) as e:
+            last_error = e
+    if last_error is None:
+        raise ImportError("Excel 파일을 읽으려면 python-calamine 또는 openpyxl이 필요합니다")
+    raise last_error
+
+
+def read_parquet(file_path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Parquet 읽기 (columns 지정 시 해당 컬럼만 디스크에서 읽음)"""
+    return pd.read_parquet(file_path, columns=list(columns) if columns is not None else None)
@@ -0,0 +1,184 @@
+import codecs
+import csv
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+SAMPLE_SIZE = 1024 * 1024   # 형식 추정에 쓰는 앞부분 크기
+SCAN_BLOCK_SIZE = 1024 * 1024
+SCAN_LIMIT = 4 * 1024 * 1024  # 표본이 모두 ASCII일 때 인코딩 판별용으로 더 훑는 최대 크기
+SAMPLE_ROWS = 1000          # 컬럼 타입 추정에 쓰는 최대 행 수
+DELIMITERS = ",\t;|"
+
+# 시도 순서 (cp949는 euc-kr의 상위 집합이므로 euc-kr 파일도 cp949로 읽힘)
+ENCODINGS = ("utf-8", "cp949")
+FALLBACK_ENCODING = "latin1"
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+INT_RE = re.compile(r"^[+-]?\d+$")
+DATE_RE = re.compile(r"^\d{4}[-/.]\d{1,2}[-/.]\d{1,2}")
+BOOL_VALUES = {"true", "false"}
+# pandas read_csv가 기본으로 결측치로 처리하는 값
+NA_VALUES = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
+
+class CsvFormat(NamedTuple):
+    """sniff_csv 결과 (read_csv 인자로 그대로 사용)"""
+    encoding: str
+    delimiter: str
+    skiprows: int                 # 헤더 앞의 제목/빈 줄 수
+    has_header: bool
+    columns: List[str]
+    dtypes: Dict[str, str]        # 표본 기준 추정 타입 (int64/float64/bool/date/str)
+
+    def read_csv_kwargs(self) -> Dict[str, Any]:
+        """
+        pd.read_csv 인자
+        숫자 컬럼은 뒤쪽 행에 다른 값이 있을 수 있어 타입을 강제하지 않고,
+        표본에서 이미 문자열인 컬럼(전체도 문자열일 수밖에 없음)만 str로 지정해 타입 추론을 생략합니다
+        """
+        kwargs: Dict[str, Any] = {
+            "sep": self.delimiter,
+            "skiprows": self.skiprows or None,
+            "header": 0 if self.has_header else None,
+            "dtype": {col: str for col, dtype in self.dtypes.items() if dtype == "str"} or None,
+        }
+        if not self.has_header:
+            kwargs["names"] = self.columns
+        return kwargs
+
+
+def _read_sample(file_path: Path, sample_size: int) -> Tuple[bytes, bytes]:
+    """
+    (앞부분 sample_size 바이트, 인코딩 판별용 블록)
+    표본이 모두 ASCII이고 파일이 더 길면, 한글 등 멀티바이트 문자가 처음 나오는 블록을 찾아 따로 반환
+    (최대 SCAN_LIMIT까지만 순차로 읽고, 없으면 빈 블록)
+    """
+    with open(file_path, "rb") as f:
+        sample = f.read(sample_size)
+        if len(sample) < sample_size or not sample.isascii():
+            return sample, b""
+        scanned = 0
+        while scanned < SCAN_LIMIT and (block := f.read(SCAN_BLOCK_SIZE)):
+            if not block.isascii():
+                return sample, block
+            scanned += len(block)
+        return sample, b""
+
+
+def _decode(sample: bytes, encoding: str, complete: bool) -> Optional[str]:
+    """표본 디코딩 (표본 끝에서 잘린 멀티바이트 문자는 허용)"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    try:
+        return decoder.decode(sample, final=complete)
+    except UnicodeDecodeError:
+        return None
+
+
+def detect_encoding(sample: bytes, complete: bool = True) -> Tuple[str, str]:
+    """(인코딩, 디코딩된 표본)"""
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            text = _decode(sample, encoding, complete)
+            if text is not None:
+                return encoding, text
+    for encoding in ENCODINGS:
+        text = _decode(sample, encoding, complete)
+        if text is not None:
+            return encoding, text
+    return FALLBACK_ENCODING, sample.decode(FALLBACK_ENCODING)
+
+
+def _detect_delimiter(lines: List[str]) -> str:
+    try:
+        return csv.Sniffer().sniff("\n".join(lines[:50]), delimiters=DELIMITERS).delimiter
+    except csv.Error:
+        # 컬럼이 하나뿐이거나 판별이 애매한 경우: 가장 많이 나오는 구분자
+        counts = {d: sum(line.count(d) for line in lines[:50]) for d in DELIMITERS}
+        best = max(counts, key=counts.get)
+        return best if counts[best] else ","
+
+
+def _value_type(value: str) -> str:
+    if INT_RE.match(value):
+        return "int"
+    try:
+        float(value)
+        return "float"
+    except ValueError:
+        pass
+    if value.lower() in BOOL_VALUES:
+        return "bool"
+    if DATE_RE.match(value):
+        return "date"
+    return "str"
+
+
+def _column_dtype(values: List[str]) -> str:
+    types = {_value_type(v) for v in values if v not in NA_VALUES}
+    has_missing = any(v in NA_VALUES for v in values)
+    if not types:
+        return "float64"  # 표본에서 모두 비어 있음
+    if types == {"int"}:
+        return "float64" if has_missing else "int64"
+    if types <= {"int", "float"}:
+        return "float64"
+    if types == {"bool"}:
+        return "bool"
+    if types == {"date"}:
+        return "date"
+    return "str"
+
+
+def sniff_csv(file_path: Path, sample_size: int = SAMPLE_SIZE) -> CsvFormat:
+    """
+    CSV 앞부분을 한 번 읽어 인코딩, 구분자, 헤더 위치/유무, 컬럼별 타입을 함께 추정
+    """
+    sample, block = _read_sample(file_path, sample_size)
+    complete = len(sample) < sample_size
+    encoding, text = detect_encoding(sample, complete)
+    if block:
+        # 표본은 모두 ASCII라 어느 인코딩으로도 같게 읽힘: 인코딩은 뒤쪽 블록으로만 판별하고
+        # 구분자/헤더/타입 추정은 이어진 표본으로만 함 (블록 앞은 ASCII라 문자 경계에서 시작)
+        encoding, _ = detect_encoding(block, complete=False)
+
+    lines = text.splitlines()
+    if not complete and lines:
+        lines = lines[:-1]  # 표본 끝에서 잘린 줄 제외
+    lines = lines[:SAMPLE_ROWS + 100]
+    non_blank = [line for line in lines if line.strip()]
+    if not non_blank:
+        return CsvFormat(encoding, ",", 0, True, [], {})
+
+    delimiter = _detect_delimiter(non_blank)
+    rows = []
+    reader = csv.reader(lines, delimiter=delimiter)
+    for row in reader:
+        rows.append((reader.line_num, row))
+
+    # 헤더 행: 가장 흔한 필드 수를 처음 갖는 행 (앞쪽 제목 줄/빈 줄 건너뜀)
+    widths = Counter(len(row) for _, row in rows if any(field.strip() for field in row))
+    width = widths.most_common(1)[0][0]
+    header_index = next(i for i, (_, row) in enumerate(rows) if len(row) == width)
+    skiprows = rows[header_index][0] - 1
+    first = rows[header_index][1]
+    data = [row for _, row in rows[header_index + 1:header_index + 1 + SAMPLE_ROWS] if len(row) == width]
+
+    # 첫 행이 전부 숫자/날짜면 헤더 없는 파일로 판단
+    has_header = not all(field.strip() and _value_type(field.strip()) != "str" for field in first)
+    if has_header:
+        columns = first  # pandas와 같은 컬럼명 (공백 유지)
+    else:
+        columns = [f"column_{i + 1}" for i in range(width)]
+        data.insert(0, first)
+
+    dtypes = {col: _column_dtype([row[i].strip() for row in data]) for i, col in enumerate(columns)}
+    return CsvFormat(encoding, delimiter, skiprows, has_header, columns, dtypes)
@@ -0,0 +1,193 @@
+"""
+챗봇 동시 요청 부하 테스트 (로컬 OpenAI 스텁 서버 사용, 실제 API 비용 없음)
+
+응답까지 --delay초 걸리는 /v1/chat/completions 스텁 서버를 띄우고,
+/api/v1/chatbot/chat에 --chats개의 요청을 동시에 보내 전체 소요 시간을 측정합니다
+요청이 이벤트 루프를 막지 않으면 전체 시간 ≈ delay, 막으면 ≈ delay × chats (직렬 처리)
+
+--stream: /api/v1/chatbot/chat/stream으로 첫 토큰까지 걸린 시간(TTFT)을 측정하고,
+절반의 요청은 첫 토큰만 받고 연결을 끊어 스텁 서버 쪽 생성이 중단되는지(aborted) 확인합니다
+사용법: python scripts/bench_chat_concurrency.py [--chats 20] [--delay 1.0] [--stream] [--port 8799]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+STUB_TOKENS = 20
+PAYLOAD = {"messages": [{"role": "user", "content": "재고가 부족한 제품은?"}]}
+
+# 스텁 서버의 스트림 종료 통계 (끝까지 전송 / 중간에 끊김)
+stub_stats = {"completed": 0, "aborted": 0}
+
+
+def make_stub(delay: float) -> FastAPI:
+    stub = FastAPI()
+
+    async def stream_tokens(model: str):
+        # delay 동안 STUB_TOKENS개 토큰을 나눠서 전송 (OpenAI 스트림 형식)
+        completed = False
+        try:
+            for i in range(STUB_TOKENS):
+                await asyncio.sleep(delay / STUB_TOKENS)
+                chunk = {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": f"토큰{i} "}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+            yield "data: [DONE]\n\n"
+            completed = True
+        finally:
+            stub_stats["completed" if completed else "aborted"] += 1
+
+    @stub.post("/v1/chat/completions")
+    async def chat_completions(body: dict):
+        if body.get("stream"):
+            return StreamingResponse(stream_tokens(body.get("model", "stub")), media_type="text/event-stream")
+
+        await asyncio.sleep(delay)
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "stub 응답"},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+    return stub
+
+
+def make_chat_app() -> FastAPI:
+    """
+    챗봇 라우터만 올린 앱 (app.main은 예측 라우터를 통해 TensorFlow를 import하므로
+    TensorFlow가 없는 환경에서도 실행할 수 있도록 챗봇 경로만 사용)
+    """
+    from app.routers import chatbot_api
+
+    chat_app = FastAPI()
+    chat_app.include_router(chatbot_api.router, prefix="/api/v1/chatbot", tags=["chatbot"])
+    return chat_app
+
+
+def start_server(asgi_app, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(asgi_app, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def count_statuses(responses):
+    statuses = {}
+    for response in responses:
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+    return statuses
+
+
+async def run_chat(app, chats: int):
+    """일반 응답: 인프로세스(ASGI)로 동시 요청"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(
+            client.post("/api/v1/chatbot/chat", json=PAYLOAD) for _ in range(chats)
+        ))
+        elapsed = time.perf_counter() - start
+    return elapsed, count_statuses(responses)
+
+
+async def run_stream(base_url: str, chats: int):
+    """
+    스트리밍: 짝수 요청은 끝까지 읽고, 홀수 요청은 첫 토큰 후 연결 종료
+    (연결 종료가 서버에 전달되도록 실제 HTTP 서버로 요청)
+    """
+    ttfts, totals = [], []
+
+    async def consume(client: httpx.AsyncClient, abandon: bool):
+        start = time.perf_counter()
+        first_token = True
+        async with client.stream("POST", "/api/v1/chatbot/chat/stream", json=PAYLOAD) as response:
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                if line == "data: [DONE]":
+                    totals.append(time.perf_counter() - start)
+                    return
+                if first_token:
+                    ttfts.append(time.perf_counter() - start)
+                    first_token = False
+                if abandon:
+                    return  # 첫 토큰만 받고 연결 종료
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(consume(client, abandon=i % 2 == 1) for i in range(chats)))
+        elapsed = time.perf_counter() - start
+    return elapsed, ttfts, totals
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chats", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=1.0, help="스텁 서버 전체 응답 시간(초)")
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument("--port", type=int, default=8799, help="스텁 서버 포트 (--stream 시 앱 서버는 port+1)")
+    args = parser.parse_args()
+
+    stub_server = start_server(make_stub(args.delay), args.port)
+
+    # 챗봇 라우터가 import 시점에 환경변수를 읽으므로 앱 import 전에 설정
+    os.environ["OPENAI_API_KEY"] = "sk-stub"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.port}/v1"
+    os.environ["CHAT_RATE_LIMIT"] = str(args.chats * 10)
+    app = make_chat_app()
+
+    if args.stream:
+        app_server = start_server(app, args.port + 1)
+        elapsed, ttfts, totals = asyncio.run(run_stream(f"http://127.0.0.1:{args.port + 1}", args.chats))
+        time.sleep(args.delay)  # 끊긴 스트림이 스텁 서버에서 정리될 시간
+        app_server.should_exit = True
+        print(
+            f"chats={args.chats}  delay={args.delay}s  elapsed={elapsed:.2f}s  "
+            f"ttft_p50={statistics.median(ttfts) * 1000:.0f}ms  full_p50={statistics.median(totals) * 1000:.0f}ms"
+        )
+        print(f"스텁 서버 스트림: 완료 {stub_stats['completed']}  중단 {stub_stats['aborted']} (연결 끊은 요청 {args.chats // 2})")
+    else:
+        from app.routers import chatbot_api
+
+        async def run():
+            try:
+                return await run_chat(app, args.chats)
+            finally:
+                await chatbot_api.close_client()
+
+        elapsed, statuses = asyncio.run(run())
+        print(f"chats={args.chats}  delay={args.delay}s  elapsed={elapsed:.2f}s  statuses={statuses}")
+        print(f"직렬 처리 시 예상: {args.chats * args.delay:.2f}s / 완전 병렬 시 예상: {args.delay:.2f}s")
+
+    stub_server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
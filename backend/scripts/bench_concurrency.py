@@ -0,0 +1,67 @@
+"""
+API 동시성 벤치마크
+
+실행 중인 서버에 동시 요청을 보내 동시 접속 수별 처리량(req/s)과 지연 시간(p50/p95)을 측정합니다
+async 라우터가 동기 DB 호출로 이벤트 루프를 막으면 동시 접속 수를 늘려도 처리량이 늘지 않습니다
+사용법:
+  uvicorn app.main:app --port 8000   # 다른 터미널에서 (워커 1개로 비교)
+  python scripts/bench_concurrency.py --url http://localhost:8000 \\
+      --path /health --path "/api/v1/analytics/summary?tenant_id=1" --concurrency 1 8 32 --requests 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run_level(client: httpx.AsyncClient, paths, concurrency: int, total: int):
+    latencies = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            path = paths[i % len(paths)]
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"concurrency={concurrency:4d}  {total / elapsed:9.1f} req/s  "
+        f"p50={statistics.median(latencies) * 1000:8.1f}ms  p95={p95 * 1000:8.1f}ms  errors={errors}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", help="요청 경로 (여러 번 지정 시 번갈아 호출)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=500, help="동시 접속 수별 총 요청 수")
+    args = parser.parse_args()
+
+    paths = args.path or ["/health"]
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        # 연결/커넥션 풀 워밍업
+        await client.get(paths[0])
+        for concurrency in args.concurrency:
+            await run_level(client, paths, concurrency, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
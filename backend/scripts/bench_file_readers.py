@@ -0,0 +1,104 @@
+"""
+CSV/Excel 읽기 엔진 벤치마크
+
+재고 내보내기 파일과 같은 형태(예측 입력 컬럼 + 부가 컬럼)의 CSV/XLSX를 만들거나 --file로 실제 파일을 지정해,
+설치된 엔진(CSV: pyarrow / c, Excel: calamine / openpyxl)별 전체 읽기와 usecols(예측 입력 컬럼만) 읽기 시간을 비교합니다
+사용법: python scripts/bench_file_readers.py [--rows 1000000] [--excel-rows 100000] [--file 경로 ...] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from app.core.constants import INPUT_COLS  # noqa: E402
+from app.utils import readers  # noqa: E402
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """예측 입력 컬럼 + 예측에 쓰지 않는 부가 컬럼(문자열)으로 구성된 재고 데이터"""
+    rng = np.random.default_rng(0)
+    skus = max(rows // 365, 1)
+    df = pd.DataFrame({
+        "_일자": np.resize(pd.date_range("2024-01-01", periods=365).strftime("%Y-%m-%d"), rows),
+        "SKU": np.repeat([f"SKU{i:06d}" for i in range(skus + 1)], 365)[:rows],
+    })
+    for col in INPUT_COLS:
+        if col in df.columns:
+            continue
+        if col in ("상품명 (한글)", "고객사 코드", "공급업체 코드", "랙번호", "브랜드명"):
+            df[col] = rng.choice([f"{col}-{i}" for i in range(200)], rows)
+        else:
+            df[col] = rng.integers(0, 500, rows)
+    for i in range(8):
+        df[f"비고{i}"] = rng.choice(["정상", "입고 지연", "재고 확인 필요", ""], rows)
+    return df
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_file(path: Path, repeat: int) -> None:
+    is_csv = path.suffix.lower() == ".csv"
+    engines = readers.available_engines()["csv" if is_csv else "excel"]
+    header = pd.read_csv(path, nrows=0) if is_csv else pd.read_excel(path, nrows=0)
+    usecols = [col for col in INPUT_COLS if col in header.columns] or None
+
+    print(f"\n{path.name} ({path.stat().st_size / 1024 / 1024:.1f}MB)")
+    for engine in engines:
+        for label, cols in (("all columns", None), ("usecols", usecols)):
+            if label == "usecols" and cols is None:
+                continue
+            if is_csv:
+                fn = lambda: readers.read_csv(path, engine=engine, usecols=cols)  # noqa: E731
+            else:
+                fn = lambda: readers.read_excel(path, engine=engine, usecols=cols)  # noqa: E731
+            try:
+                elapsed = timed(fn, repeat)
+            except Exception as e:
+                print(f"  {engine:9s} {label:12s} 실패: {e}")
+                continue
+            print(f"  {engine:9s} {label:12s} {elapsed:8.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000, help="생성할 CSV 행 수")
+    parser.add_argument("--excel-rows", type=int, default=100_000, help="생성할 XLSX 행 수 (0이면 생략)")
+    parser.add_argument("--file", nargs="*", default=[], help="생성 대신 벤치마크할 실제 파일")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"설치된 엔진: {readers.available_engines()}")
+    if args.file:
+        for path in args.file:
+            bench_file(Path(path), args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "inventory.csv"
+        make_frame(args.rows).to_csv(csv_path, index=False)
+        bench_file(csv_path, args.repeat)
+
+        if args.excel_rows:
+            xlsx_path = Path(tmp) / "inventory.xlsx"
+            make_frame(args.excel_rows).to_excel(xlsx_path, index=False)
+            bench_file(xlsx_path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+판매 데이터 적재 벤치마크
+
+기존 방식(iterrows + ORM 객체 + bulk_save_objects)과 UploadService.load_sales(컬럼 단위 변환 + Core executemany)를
+같은 DataFrame으로 비교합니다. 기본은 로컬 SQLite이며 --db-url로 MySQL 등을 지정할 수 있습니다
+사용법: python scripts/bench_sales_load.py [--rows 1000000] [--skus 2000] [--db-url sqlite://]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import app.models  # noqa: E402,F401
+from app.core.database import Base  # noqa: E402
+from app.models.sales import Sales  # noqa: E402
+from app.models.tenant import Tenant  # noqa: E402
+from app.services.upload_service import UploadService  # noqa: E402
+
+
+def make_frame(rows: int, skus: int) -> pd.DataFrame:
+    """(SKU, 판매일)이 겹치지 않는 판매 데이터 생성 (sales 자연키 유니크 제약)"""
+    rng = np.random.default_rng(0)
+    days = -(-rows // skus)
+    dates = pd.date_range("2020-01-01", periods=days).strftime("%Y-%m-%d")
+    df = pd.DataFrame({
+        "sale_date": np.tile(dates, skus)[:rows],
+        "sku": np.repeat([f"SKU{i:05d}" for i in range(skus)], days)[:rows],
+        "quantity": rng.integers(1, 100, rows),
+        "revenue": rng.random(rows) * 1000,
+    })
+    df.loc[df.sample(frac=0.1, random_state=0).index, "revenue"] = np.nan
+    return df
+
+
+def legacy_load(db: Session, tenant_id: int, df: pd.DataFrame, sku_to_id):
+    sales_rows = []
+    for _, row in df.iterrows():
+        sale_date_value = pd.to_datetime(row["sale_date"]).date()
+        revenue_value = row.get("revenue")
+        if revenue_value is None or pd.isna(revenue_value):
+            revenue_value = 0.0
+        else:
+            revenue_value = float(revenue_value)
+        sales_rows.append(Sales(
+            tenant_id=tenant_id,
+            product_id=sku_to_id[row["sku"]],
+            sale_date=sale_date_value,
+            quantity=float(row["quantity"]),
+            revenue=revenue_value
+        ))
+    db.bulk_save_objects(sales_rows)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--skus", type=int, default=2_000)
+    parser.add_argument("--db-url", default="sqlite://")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    Base.metadata.create_all(engine)
+    df = make_frame(args.rows, args.skus)
+
+    with Session(engine) as db:
+        tenant = Tenant(name="bench", code=f"bench-{time.time_ns()}")
+        db.add(tenant)
+        db.commit()
+        service = UploadService(db)
+        sku_to_id = service.resolve_product_ids(tenant.id, df["sku"].unique())
+        db.commit()
+
+        start = time.perf_counter()
+        service.load_sales(tenant.id, df)
+        elapsed = time.perf_counter() - start
+        print(f"vectorized: {elapsed:8.2f}s  {args.rows / elapsed:12,.0f} rows/s")
+
+        if not args.skip_legacy:
+            db.execute(delete(Sales).where(Sales.tenant_id == tenant.id))
+            db.commit()
+            start = time.perf_counter()
+            legacy_load(db, tenant.id, df, sku_to_id)
+            elapsed = time.perf_counter() - start
+            print(f"legacy:     {elapsed:8.2f}s  {args.rows / elapsed:12,.0f} rows/s")
+
+        db.execute(delete(Sales).where(Sales.tenant_id == tenant.id))
+        db.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+SKU별 마지막 시퀀스 추출 벤치마크
+
+기존 방식(SKU마다 DataFrame 필터링)과 build_last_windows를 비교합니다
+사용법: python scripts/bench_window_builder.py [--days 30]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from app.services.forecast_engine import build_last_windows  # noqa: E402
+
+SEQ_LENGTH = 7
+N_FEATURES = 22
+# 기존 방식은 O(n_sku × n_rows)라 이 이상은 측정하지 않음
+LEGACY_MAX_SKUS = 10_000
+
+
+def make_frame(n_sku: int, days: int):
+    rng = np.random.default_rng(0)
+    feature_cols = [f"f{i}" for i in range(N_FEATURES)]
+    df = pd.DataFrame(rng.random((n_sku * days, N_FEATURES)), columns=feature_cols)
+    df["SKU"] = np.repeat([f"SKU{i:06d}" for i in range(n_sku)], days)
+    df["_일자"] = np.tile(pd.date_range("2025-01-01", periods=days).values, n_sku)
+    return df.sort_values(["SKU", "_일자"]).reset_index(drop=True), feature_cols
+
+
+def legacy(df: pd.DataFrame, feature_cols):
+    X_seq_dict = {}
+    for sku in df["SKU"].unique():
+        sku_data = df[df["SKU"] == sku].sort_values("_일자")
+        if len(sku_data) >= SEQ_LENGTH:
+            X_seq_dict[sku] = sku_data.iloc[-SEQ_LENGTH:][feature_cols].values
+    return X_seq_dict
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'n_sku':>8} {'rows':>10} {'vectorized(s)':>14} {'legacy(s)':>10}")
+    for n_sku in (1_000, 10_000, 100_000):
+        df, feature_cols = make_frame(n_sku, args.days)
+
+        start = time.perf_counter()
+        skus, windows = build_last_windows(df, "SKU", feature_cols, SEQ_LENGTH)
+        vectorized = time.perf_counter() - start
+
+        legacy_time = "-"
+        if n_sku <= LEGACY_MAX_SKUS:
+            start = time.perf_counter()
+            expected = legacy(df, feature_cols)
+            legacy_time = f"{time.perf_counter() - start:.3f}"
+            assert list(expected) == list(skus)
+            assert np.array_equal(np.stack(list(expected.values())), windows)
+
+        print(f"{n_sku:>8} {len(df):>10} {vectorized:>14.3f} {legacy_time:>10}")
+
+
+if __name__ == "__main__":
+    main()
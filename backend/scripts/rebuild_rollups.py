@@ -0,0 +1,45 @@
+"""
+월별 판매 집계(sales_monthly) 재생성
+
+sales 테이블을 직접 수정했거나(수동 보정, 백필) 롤업이 어긋난 경우 sales 기준으로 다시 계산합니다
+업로드 적재 시에는 UploadService.load_sales가 해당 월만 자동으로 갱신합니다
+재생성한 회사의 분석 응답 캐시(analytics_cache)도 무효화합니다 (redis 백엔드면 모든 워커에 반영)
+사용법:
+  python scripts/rebuild_rollups.py                  # 전체 회사
+  python scripts/rebuild_rollups.py --tenant-id 1    # 특정 회사만
+"""
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import app.models  # noqa: E402,F401
+from app.core.cache import analytics_cache  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.services.rollup_service import rebuild_monthly  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tenant-id", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        tenants = rebuild_monthly(db, args.tenant_id)
+    finally:
+        db.close()
+
+    # 재생성 전 집계로 만든 캐시 응답이 TTL까지 남지 않도록 회사별 세대 번호 증가
+    for tenant_id in tenants:
+        analytics_cache.invalidate(tenant_id)
+    print(f"sales_monthly 재생성 완료: 회사 {len(tenants)}개, {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import os
+
+# 앱 모듈 import 시 생성되는 엔진이 운영 DB 대신 메모리 SQLite를 가리키도록 설정
+os.environ.setdefault("DB_URL", "sqlite://")
+os.environ.setdefault("ANALYTICS_CACHE_BACKEND", "memory")
+os.environ.setdefault("CHAT_CACHE_BACKEND", "memory")
+
+# 환경 변수 설정 이후에 import (app.core.cache가 설정을 읽음)
+import fakeredis  # noqa: E402
+import pytest  # noqa: E402
+
+from app.core.cache import InMemoryCache, RedisCache  # noqa: E402
+
+
+class FakeClock:
+    """TTL/윈도우 테스트용 시계 (now를 직접 옮겨 시간 경과를 흉내냄)"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend_kind(request):
+    """메모리 / Redis(fakeredis) 백엔드 양쪽으로 같은 테스트를 실행"""
+    return request.param
+
+
+@pytest.fixture
+def redis_server():
+    # 같은 서버를 쓰는 클라이언트 = 같은 Redis를 공유하는 워커
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def backend(backend_kind, redis_server):
+    if backend_kind == "memory":
+        return InMemoryCache(max_entries=16)
+    return RedisCache(fakeredis.FakeRedis(server=redis_server))
@@ -0,0 +1,48 @@
+"""분석/월별 집계 쿼리가 커버링 인덱스만으로 처리되는지 확인 (SQLite EXPLAIN QUERY PLAN)"""
+from datetime import date
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.routers.analytics import month_range, summary_query, top_products_query
+from app.services.rollup_service import monthly_aggregate_query
+
+ROLLUP_INDEX = "ix_sales_monthly_tenant_period_product_qty"
+SALES_INDEX = "ix_sales_tenant_date_product_qty_rev"
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def query_plan(db: Session, query) -> List[str]:
+    sql = str(query.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+    return [row["detail"] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).mappings()]
+
+
+def assert_covered(plan: List[str], table: str, index: str):
+    table_steps = [detail for detail in plan if f" {table} " in f" {detail} "]
+    assert table_steps, plan
+    assert all(f"COVERING INDEX {index}" in detail for detail in table_steps), plan
+
+
+@pytest.mark.parametrize("name", ["summary", "products"])
+def test_analytics_queries_read_only_the_rollup_covering_index(db, name):
+    start, end = month_range(6)
+    query = summary_query(1, start, end) if name == "summary" else top_products_query(1, start, end, 10)
+
+    assert_covered(query_plan(db, query), "sales_monthly", ROLLUP_INDEX)
+
+
+def test_monthly_refresh_reads_only_the_sales_covering_index(db):
+    query = monthly_aggregate_query(db, 1, date(2024, 1, 1), date(2024, 4, 1))
+
+    assert_covered(query_plan(db, query), "sales", SALES_INDEX)
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+
+import fakeredis
+import pytest
+
+from app.core.cache import InMemoryCache, RedisCache, TenantResponseCache
+
+
+def test_get_after_set_hits(backend):
+    cache = TenantResponseCache(backend, namespace="analytics", ttl=60)
+    assert cache.get("summary", 1, months=6) is None
+    cache.set("summary", 1, {"total": 10}, months=6)
+
+    assert cache.get("summary", 1, months=6) == {"total": 10}
+    assert cache.get("summary", 1, months=3) is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_invalidate_bumps_generation_for_one_tenant_only(backend):
+    cache = TenantResponseCache(backend, namespace="analytics", ttl=60)
+    cache.set("summary", 1, {"total": 10}, months=6)
+    cache.set("summary", 2, {"total": 20}, months=6)
+
+    cache.invalidate(1)
+
+    assert cache.get("summary", 1, months=6) is None
+    assert cache.get("summary", 2, months=6) == {"total": 20}
+    cache.set("summary", 1, {"total": 11}, months=6)
+    assert cache.get("summary", 1, months=6) == {"total": 11}
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_invalidation_is_shared_between_workers():
+    # 같은 Redis를 쓰는 두 워커: 한쪽의 무효화가 다른 쪽 캐시에도 적용됨
+    server = fakeredis.FakeServer()
+    worker_a = TenantResponseCache(RedisCache(fakeredis.FakeRedis(server=server)), "analytics", ttl=60)
+    worker_b = TenantResponseCache(RedisCache(fakeredis.FakeRedis(server=server)), "analytics", ttl=60)
+    worker_a.set("products", 1, [{"sku": "A"}], months=6, top_n=10)
+    assert worker_b.get("products", 1, months=6, top_n=10) == [{"sku": "A"}]
+
+    worker_b.invalidate(1)
+
+    assert worker_a.get("products", 1, months=6, top_n=10) is None
+
+
+def test_generation_counter_survives_lru_eviction():
+    cache = TenantResponseCache(InMemoryCache(max_entries=2), "analytics", ttl=60)
+    cache.set("summary", 1, {"total": 10}, months=6)
+    cache.invalidate(1)
+    for months in range(5):
+        cache.set("summary", 2, {}, months=months)
+
+    # 세대 번호가 LRU로 지워졌다면 무효화 이전 엔트리 키로 되돌아감
+    assert cache._generation(1) == 1
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TenantResponseCache(InMemoryCache(clock=clock), "analytics", ttl=60)
+    cache.set("summary", 1, {"total": 10}, months=6)
+    clock.now = 61
+
+    assert cache.get("summary", 1, months=6) is None
+
+
+def test_backend_errors_are_cache_misses():
+    class BrokenBackend:
+        def _fail(self, *args):
+            raise ConnectionError("redis down")
+
+        get = set = incr = _fail
+
+    cache = TenantResponseCache(BrokenBackend(), "analytics", ttl=60)
+    cache.set("summary", 1, {"total": 10}, months=6)
+    cache.invalidate(1)
+
+    assert cache.get("summary", 1, months=6) is None
+    assert cache.stats()["errors"] == 3
+
+
+def test_async_lookup_offloads_blocking_backend_and_reuses_key():
+    class RecordingRedis(fakeredis.FakeRedis):
+        def get(self, name):
+            calls.append(("get", threading.get_ident()))
+            return super().get(name)
+
+        def set(self, name, value, ex=None):
+            calls.append(("set", threading.get_ident()))
+            return super().set(name, value, ex=ex)
+
+    async def miss_then_hit():
+        key, value = await cache.lookup("summary", 1, months=6)
+        assert value is None
+        await cache.store(key, {"total": 10})
+        return threading.get_ident(), await cache.lookup("summary", 1, months=6)
+
+    calls = []
+    cache = TenantResponseCache(RedisCache(RecordingRedis()), "analytics", ttl=60)
+    loop_thread, (_, value) = asyncio.run(miss_then_hit())
+
+    assert value == {"total": 10}
+    # 미스: 세대 번호 + 값 조회, 저장 (세대 번호 재조회 없음) / 적중: 세대 번호 + 값 조회
+    assert [name for name, _ in calls] == ["get", "get", "set", "get", "get"]
+    assert all(thread != loop_thread for _, thread in calls)
+    assert cache.stats()["hits"] == 1
+
+
+def test_store_after_invalidation_is_not_served():
+    # DB 조회 중 무효화되면 이전 세대 키에 저장되어 다시 읽히지 않음
+    cache = TenantResponseCache(InMemoryCache(), "analytics", ttl=60)
+
+    async def run():
+        key, _ = await cache.lookup("summary", 1, months=6)
+        cache.invalidate(1)
+        await cache.store(key, {"total": "stale"})
+        return await cache.lookup("summary", 1, months=6)
+
+    assert asyncio.run(run())[1] is None
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+
+import fakeredis
+import pytest
+
+from app.core.cache import InMemoryCache, RedisCache
+from app.services.chat_cache import ChatResponseCache
+
+MODEL = "gpt-4o-mini"
+
+# 질문별 고정 임베딩 ("재고 알려줘"와 유사도 0.98 / 0.6)
+VECTORS = {
+    "재고 알려줘": [1.0, 0.0],
+    "재고 좀 알려줘": [0.98, 0.199],
+    "매출 알려줘": [0.6, 0.8],
+}
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, text):
+        self.calls.append(text)
+        return VECTORS[text]
+
+
+def ask(question):
+    return [{"role": "system", "content": "재고 도우미"}, {"role": "user", "content": question}]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def get_or_put(cache, question, response):
+    """라우터와 같은 순서: 조회 후 미스면 저장"""
+    cached = await cache.get(ask(question), MODEL, 0.7, 500)
+    if cached is None:
+        await cache.put(ask(question), MODEL, 0.7, 500, response)
+    return cached
+
+
+def test_exact_hit_ignores_whitespace_and_case(backend):
+    cache = ChatResponseCache(backend, ttl=60)
+    assert run(get_or_put(cache, "재고 알려줘", "A 10개")) is None
+
+    messages = [{"role": "system", "content": "재고 도우미"}, {"role": "user", "content": "  재고   알려줘 "}]
+    assert run(cache.get(messages, MODEL, 0.7, 500)) == "A 10개"
+    assert run(cache.get(messages, MODEL, 0.2, 500)) is None
+
+
+def test_semantic_hit_above_threshold(backend):
+    embedder = FakeEmbedder()
+    cache = ChatResponseCache(backend, ttl=60, embed=embedder, similarity_threshold=0.95)
+    run(get_or_put(cache, "재고 알려줘", "A 10개"))
+
+    assert run(cache.get(ask("재고 좀 알려줘"), MODEL, 0.7, 500)) == "A 10개"
+    assert cache.stats()["semantic_hits"] == 1
+
+
+def test_semantic_miss_below_threshold_embeds_once(backend):
+    embedder = FakeEmbedder()
+    cache = ChatResponseCache(backend, ttl=60, embed=embedder, similarity_threshold=0.95)
+    run(get_or_put(cache, "재고 알려줘", "A 10개"))
+    embedder.calls.clear()
+
+    assert run(get_or_put(cache, "매출 알려줘", "100만원")) is None
+
+    # get()의 유사 질문 검색에서 계산한 임베딩을 put()에서 재사용
+    assert embedder.calls == ["매출 알려줘"]
+    assert run(cache.get(ask("매출 알려줘"), MODEL, 0.7, 500)) == "100만원"
+    assert cache.stats()["semantic_entries"] == 2
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ChatResponseCache(InMemoryCache(clock=clock), ttl=60)
+    run(get_or_put(cache, "재고 알려줘", "A 10개"))
+    clock.now = 61
+
+    assert run(cache.get(ask("재고 알려줘"), MODEL, 0.7, 500)) is None
+
+
+def test_stats_count_lookups():
+    cache = ChatResponseCache(InMemoryCache(), ttl=60, embed=FakeEmbedder())
+    run(get_or_put(cache, "재고 알려줘", "A 10개"))
+    run(get_or_put(cache, "재고 알려줘", "A 10개"))
+    run(get_or_put(cache, "재고 좀 알려줘", "A 10개"))
+    cache.note_bypass()
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["semantic_hits"], stats["misses"]) == (1, 1, 1)
+    assert (stats["stores"], stats["bypassed"], stats["errors"]) == (1, 1, 0)
+    assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+    assert stats["semantic"] is True
+
+
+def test_redis_calls_run_off_the_event_loop():
+    class RecordingRedis(fakeredis.FakeRedis):
+        def get(self, name):
+            threads.append(threading.get_ident())
+            return super().get(name)
+
+        def set(self, name, value, ex=None):
+            threads.append(threading.get_ident())
+            return super().set(name, value, ex=ex)
+
+    async def lookup():
+        await get_or_put(cache, "재고 알려줘", "A 10개")
+        return threading.get_ident()
+
+    threads = []
+    cache = ChatResponseCache(RedisCache(RecordingRedis()), ttl=60)
+    loop_thread = run(lookup())
+
+    assert len(threads) == 2 and loop_thread not in threads
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from openai import AsyncOpenAI
+
+from app.core.rate_limit import InMemoryRateLimiter
+from app.routers import chatbot_api
+
+STUB_DELAY = 0.3
+
+
+def make_openai_stub() -> FastAPI:
+    """/v1/chat/completions 스텁 (STUB_DELAY초 뒤 응답, 실제 API 호출 없음)"""
+    stub = FastAPI()
+    stub.state.requests = []
+
+    @stub.post("/v1/chat/completions")
+    async def chat_completions(body: dict):
+        stub.state.requests.append(body)
+        await asyncio.sleep(STUB_DELAY)
+        if body.get("stream"):
+            chunks = [
+                {"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                 "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                for token in ("재고 ", "부족")
+            ]
+            lines = "".join(f"data: {json.dumps(c, ensure_ascii=False)}\n\n" for c in chunks) + "data: [DONE]\n\n"
+            return Response(content=lines, media_type="text/event-stream")
+        return {
+            "id": "stub", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "stub 응답"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+        }
+
+    return stub
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    stub_app = make_openai_stub()
+    openai_client = AsyncOpenAI(
+        api_key="sk-stub",
+        base_url="http://stub/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=stub_app)),
+    )
+    monkeypatch.setattr(chatbot_api, "client", openai_client)
+    monkeypatch.setattr(chatbot_api, "OPENAI_API_KEY", "sk-stub")
+    monkeypatch.setattr(chatbot_api, "chat_cache", None)
+    monkeypatch.setattr(chatbot_api, "rate_limiter", InMemoryRateLimiter(limit=100, window=60))
+    return stub_app
+
+
+def chat_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(chatbot_api.router, prefix="/api/v1/chatbot")
+    return app
+
+
+async def post_chats(count: int, path: str = "/api/v1/chatbot/chat"):
+    payload = {"messages": [{"role": "user", "content": "재고가 부족한 제품은?"}]}
+    transport = httpx.ASGITransport(app=chat_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(*(client.post(path, json=payload) for _ in range(count)))
+
+
+def test_chat_returns_stub_completion_with_usage(stub):
+    [response] = asyncio.run(post_chats(1))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["response"] == "stub 응답"
+    assert body["metadata"]["usage"]["prompt_tokens"] == 12
+    assert stub.state.requests[0]["messages"][-1]["content"] == "재고가 부족한 제품은?"
+
+
+def test_concurrent_chats_do_not_block_event_loop(stub):
+    start = time.perf_counter()
+    responses = asyncio.run(post_chats(8))
+    elapsed = time.perf_counter() - start
+
+    assert [r.status_code for r in responses] == [200] * 8
+    # 직렬 처리면 8 × STUB_DELAY
+    assert elapsed < STUB_DELAY * 4
+
+
+def test_stream_relays_tokens_after_metadata(stub):
+    [response] = asyncio.run(post_chats(1, "/api/v1/chatbot/chat/stream"))
+
+    events = [block for block in response.text.split("\n\n") if block]
+    assert events[0].startswith("event: metadata")
+    contents = [json.loads(e[len("data: "):])["content"] for e in events[1:-1]]
+    assert "".join(contents) == "재고 부족"
+    assert events[-1] == "data: [DONE]"
+
+
+def test_rate_limit_returns_429(stub, monkeypatch):
+    monkeypatch.setattr(chatbot_api, "rate_limiter", InMemoryRateLimiter(limit=2, window=60))
+
+    responses = asyncio.run(post_chats(3))
+
+    assert sorted(r.status_code for r in responses) == [200, 200, 429]
+
+
+class FakeStream:
+    """청크를 몇 개 읽었는지 / close() 호출 여부를 기록하는 OpenAI 스트림 대역"""
+
+    def __init__(self, tokens):
+        self.tokens = list(tokens)
+        self.reads = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.reads == len(self.tokens):
+            raise StopAsyncIteration
+        token = self.tokens[self.reads]
+        self.reads += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+
+    async def close(self):
+        self.closed = True
+
+
+class DisconnectingRequest:
+    """첫 청크를 보낸 뒤 연결이 끊긴 클라이언트"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    async def is_disconnected(self):
+        return self.stream.reads >= 1
+
+
+def test_stream_is_closed_when_client_disconnects():
+    stream = FakeStream(["재고 ", "부족", "합니다"])
+    completed = []
+
+    async def on_complete(text):
+        completed.append(text)
+
+    async def collect():
+        return [event async for event in chatbot_api.relay_stream(stream, DisconnectingRequest(stream), on_complete)]
+
+    events = asyncio.run(collect())
+
+    assert events == [chatbot_api.sse_event(json.dumps({"content": "재고 "}, ensure_ascii=False))]
+    assert stream.closed
+    assert stream.reads == 1
+    assert completed == []
@@ -0,0 +1,38 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.core.config import Settings
+from app.core.database import AsyncSessionLocal, async_engine, create_async_db_engine
+
+
+def test_async_url_follows_db_url_driver():
+    assert Settings(DB_URL="sqlite:///./local.db").ASYNC_DATABASE_URL == "sqlite+aiosqlite:///./local.db"
+    assert Settings(DB_URL="mysql+pymysql://u:p@h/db").ASYNC_DATABASE_URL == "mysql+aiomysql://u:p@h/db"
+    assert Settings(DB_URL="sqlite://", ASYNC_DB_URL="sqlite+aiosqlite:///x.db").ASYNC_DATABASE_URL == "sqlite+aiosqlite:///x.db"
+
+
+def test_default_async_url_uses_aiomysql():
+    assert Settings(DB_URL=None).ASYNC_DATABASE_URL.startswith("mysql+aiomysql://")
+
+
+def test_async_session_binds_to_aiosqlite():
+    assert async_engine.url.drivername == "sqlite+aiosqlite"
+
+    async def query():
+        async with AsyncSessionLocal() as session:
+            return (await session.execute(text("select 1"))).scalar()
+
+    assert asyncio.run(query()) == 1
+
+
+def test_async_engine_without_pool_options_for_sqlite():
+    engine = create_async_db_engine("sqlite+aiosqlite://")
+
+    async def query():
+        async with engine.connect() as conn:
+            value = (await conn.execute(text("select 2"))).scalar()
+        await engine.dispose()
+        return value
+
+    assert asyncio.run(query()) == 2
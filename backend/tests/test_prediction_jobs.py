@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.core import database
+from app.core.database import Base
+from app.models.prediction_job import PredictionJob
+from app.models.tenant import Tenant
+from app.services import prediction_service
+from app.services.prediction_service import (
+    STALE_JOB_MESSAGE,
+    PredictionWorkerPool,
+    fail_stale_prediction_jobs,
+    run_prediction_job,
+    touch_prediction_jobs,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    with factory() as db:
+        db.add(Tenant(id=1, name="t", code="t"))
+        db.commit()
+    return factory
+
+
+def add_job(db, status: str, age: timedelta = timedelta(0)) -> int:
+    job = PredictionJob(
+        tenant_id=1, stored_filename=f"{status}.csv", status=status, progress=0,
+        updated_at=datetime.utcnow() - age,
+    )
+    db.add(job)
+    db.commit()
+    return job.id
+
+
+def test_fail_stale_prediction_jobs_only_touches_old_unfinished_jobs(session_factory):
+    with session_factory() as db:
+        old = timedelta(hours=2)
+        stale_pending = add_job(db, "pending", old)
+        stale_processing = add_job(db, "processing", old)
+        recent_processing = add_job(db, "processing")
+        completed = add_job(db, "completed", old)
+
+    assert fail_stale_prediction_jobs() == 2
+
+    with session_factory() as db:
+        jobs = {job.id: job for job in db.query(PredictionJob)}
+        assert (jobs[stale_pending].status, jobs[stale_pending].error_message) == ("failed", STALE_JOB_MESSAGE)
+        assert jobs[stale_processing].status == "failed"
+        assert jobs[stale_processing].finished_at is not None
+        assert jobs[recent_processing].status == "processing"
+        assert jobs[completed].status == "completed"
+
+
+def test_jobs_owned_by_the_pool_are_not_failed(session_factory, monkeypatch):
+    pool = PredictionWorkerPool(max_workers=1, max_pending=2)
+    monkeypatch.setattr(prediction_service, "prediction_pool", pool)
+    with session_factory() as db:
+        owned = add_job(db, "pending", timedelta(hours=2))
+    # 프로세스를 띄우지 않고 풀이 작업을 맡은 상태만 재현
+    pool._slots.acquire()
+    pool._in_flight.add(owned)
+
+    assert fail_stale_prediction_jobs() == 0
+    pool._finish(owned)
+    assert fail_stale_prediction_jobs() == 1
+
+
+def test_touch_prediction_jobs_refreshes_unfinished_jobs(session_factory):
+    with session_factory() as db:
+        pending = add_job(db, "pending", timedelta(hours=2))
+
+    touch_prediction_jobs([pending])
+
+    assert fail_stale_prediction_jobs() == 0
+
+
+def test_run_prediction_job_skips_jobs_that_are_no_longer_pending(session_factory, monkeypatch):
+    monkeypatch.setattr(prediction_service, "run_prediction", lambda *args, **kwargs: pytest.fail("실행되면 안 됨"))
+    with session_factory() as db:
+        job_id = add_job(db, "failed")
+
+    run_prediction_job(job_id)
+
+    with session_factory() as db:
+        assert db.get(PredictionJob, job_id).status == "failed"
+
+
+def test_job_failed_while_running_is_not_completed(session_factory, monkeypatch):
+    def run_prediction(stored_filename, progress, use_cache=True):
+        with session_factory() as other:
+            job = other.get(PredictionJob, job_id)
+            job.status, job.error_message = "failed", STALE_JOB_MESSAGE
+            other.commit()
+        return {"predictions": {}, "csv_path": "a.csv", "xlsx_path": "a.xlsx"}
+
+    monkeypatch.setattr(prediction_service, "run_prediction", run_prediction)
+    with session_factory() as db:
+        job_id = add_job(db, "pending")
+
+    run_prediction_job(job_id)
+
+    with session_factory() as db:
+        job = db.get(PredictionJob, job_id)
+        assert (job.status, job.error_message, job.csv_path) == ("failed", STALE_JOB_MESSAGE, None)
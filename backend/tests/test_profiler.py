@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils.file_handler import FileHandler
+from app.utils.profiler import (
+    BLOOM_BITS_PER_ROW,
+    BLOOM_MIN_BITS,
+    ScalableBloomFilter,
+    StreamingProfiler,
+    profile_chunks,
+)
+
+
+def make_df(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "sku": [f"SKU{i % 50}" for i in range(rows)],
+        "quantity": [i % 7 for i in range(rows)],
+        "price": [float(i % 13) if i % 11 else None for i in range(rows)],
+    })
+
+
+def test_bloom_filter_is_sized_from_row_count():
+    profiler = StreamingProfiler(expected_rows=10)
+    profiler.update(make_df(10))
+    assert profiler.bloom.nbytes == BLOOM_MIN_BITS // 8
+
+
+def test_bloom_filter_grows_with_streamed_rows():
+    bloom = ScalableBloomFilter(initial_capacity=100)
+    hashes = np.random.default_rng(0).integers(0, 2 ** 63, size=10_000, dtype=np.uint64)
+    false_positives = 0
+    for start in range(0, len(hashes), 100):
+        false_positives += int(bloom.add_and_check(hashes[start:start + 100]).sum())
+
+    assert len(bloom.filters) > 1
+    assert false_positives <= 5
+    # 10,000행 × BLOOM_BITS_PER_ROW 비트의 약 2배 이하
+    assert bloom.nbytes <= 2 * 10_000 * BLOOM_BITS_PER_ROW // 8 + BLOOM_MIN_BITS // 8
+    assert bloom.add_and_check(hashes[:500]).all()
+
+
+def test_duplicates_are_counted_across_chunks():
+    df = pd.concat([make_df(300), make_df(300)], ignore_index=True)
+    expected = int(df.duplicated().sum())
+
+    # 첫 청크 크기(64행)부터 시작해 필터가 커지는 경우
+    profile = profile_chunks(df.iloc[start:start + 64] for start in range(0, len(df), 64))
+    assert profile["duplicate_count"] == expected
+    assert profile["total_rows"] == len(df)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_profile_file_matches_profile_data(tmp_path, suffix):
+    handler = FileHandler(upload_dir=str(tmp_path))
+    df = make_df(2_500)
+    path = tmp_path / f"sales{suffix}"
+    if suffix == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path, index=False)
+
+    expected = handler.profile_data(df, chunk_size=1_000)
+    profile = handler.profile_file(path, chunk_size=1_000)
+
+    for key in ("total_rows", "total_columns", "columns", "null_count", "null_by_column", "duplicate_count"):
+        assert profile[key] == expected[key]
+    assert profile["statistics"]["numeric"]["quantity"]["mean"] == pytest.approx(
+        expected["statistics"]["numeric"]["quantity"]["mean"]
+    )
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import fakeredis
+import pytest
+
+from app.core.rate_limit import InMemoryRateLimiter, RedisRateLimiter, create_rate_limiter
+
+
+WINDOW_START = 1200.0  # 60초 윈도우의 시작 시점
+
+
+class SlowRedis(fakeredis.FakeRedis):
+    """네트워크 지연을 흉내낸 클라이언트 (조회와 증가 사이에 다른 워커의 요청이 끼어들 수 있음)"""
+
+    def get(self, name):
+        time.sleep(0.01)
+        return super().get(name)
+
+
+@pytest.fixture
+def clock(clock):
+    clock.now = WINDOW_START
+    return clock
+
+
+@pytest.fixture
+def make_limiter(backend_kind, redis_server, clock):
+    def make(limit: int, window: int):
+        if backend_kind == "memory":
+            return InMemoryRateLimiter(limit, window, clock=clock)
+        return RedisRateLimiter(fakeredis.FakeRedis(server=redis_server), limit, window, clock=clock)
+
+    return make
+
+
+def test_denies_after_limit_within_window(make_limiter):
+    limiter = make_limiter(3, 60)
+
+    assert [limiter.hit("1.1.1.1") for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("2.2.2.2") is True
+    assert limiter.status("1.1.1.1")["remaining"] == 0
+
+
+def test_sliding_window_weights_previous_window(make_limiter, clock):
+    limiter = make_limiter(4, 60)
+    assert all(limiter.hit("ip") for _ in range(4))
+
+    # 다음 윈도우의 절반: 직전 4건 × 0.5 = 2건으로 계산되어 2건 더 허용
+    clock.now = WINDOW_START + 90
+    assert [limiter.hit("ip") for _ in range(3)] == [True, True, False]
+
+    # 두 윈도우가 지나면 초기화
+    clock.now = WINDOW_START + 200
+    assert limiter.hit("ip") is True
+
+
+def test_denied_requests_do_not_consume_quota(make_limiter):
+    limiter = make_limiter(2, 60)
+    for _ in range(10):
+        limiter.hit("ip")
+
+    assert limiter.status("ip")["requests_made"] == 2
+
+
+def test_redis_limit_is_shared_across_workers_under_concurrency(redis_server, clock):
+    # 같은 Redis를 쓰는 여러 워커가 동시에 요청해도 한도만큼만 통과
+    workers = [RedisRateLimiter(SlowRedis(server=redis_server), 10, 60, clock=clock) for _ in range(4)]
+    results = []
+    barrier = threading.Barrier(len(workers) * 5)
+
+    def send(limiter):
+        barrier.wait()
+        results.append(limiter.hit("ip"))
+
+    threads = [threading.Thread(target=send, args=(w,)) for w in workers for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 10
+    assert workers[0].status("ip")["requests_made"] == 10
+
+
+def test_redis_counter_keys_expire(clock):
+    client = fakeredis.FakeRedis()
+    limiter = RedisRateLimiter(client, 5, 60, clock=clock)
+    limiter.hit("ip")
+
+    [key] = client.keys("smartstock:ratelimit:ip:*")
+    assert 0 < client.ttl(key) <= 120
+
+
+def test_redis_failure_fails_open():
+    class BrokenRedis:
+        def __getattr__(self, name):
+            raise ConnectionError("redis down")
+
+    limiter = RedisRateLimiter(BrokenRedis(), 1, 60)
+
+    assert limiter.hit("ip") is True
+    assert limiter.hit("ip") is True
+    assert limiter.stats()["errors"] == 2
+
+
+def test_memory_limiter_evicts_oldest_keys(clock):
+    limiter = InMemoryRateLimiter(5, 60, max_keys=3, clock=clock)
+    for i in range(10):
+        limiter.hit(f"ip{i}")
+
+    assert limiter.stats()["tracked_keys"] == 3
+
+
+def test_create_rate_limiter_validates_backend():
+    assert isinstance(create_rate_limiter(5, 60), InMemoryRateLimiter)
+    with pytest.raises(RuntimeError):
+        create_rate_limiter(5, 60, backend="redis")
+    with pytest.raises(ValueError):
+        create_rate_limiter(5, 60, backend="memcached")
+
+
+def test_check_rate_limit_runs_redis_calls_off_the_event_loop(monkeypatch, clock):
+    from app.routers import chatbot_api
+
+    class RecordingRedis(fakeredis.FakeRedis):
+        def pipeline(self, *args, **kwargs):
+            threads.append(threading.get_ident())
+            return super().pipeline(*args, **kwargs)
+
+    async def check():
+        return threading.get_ident(), await chatbot_api.check_rate_limit("ip")
+
+    threads = []
+    monkeypatch.setattr(chatbot_api, "rate_limiter", RedisRateLimiter(RecordingRedis(), 5, 60, clock=clock))
+    loop_thread, allowed = asyncio.run(check())
+
+    assert allowed is True
+    assert threads and loop_thread not in threads
@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from app.utils import readers
+from app.utils.sniffer import sniff_csv
+
+pytestmark = pytest.mark.skipif(not readers.engine_installed("pyarrow"), reason="pyarrow 미설치")
+
+CSV = """sale_date,updated_at,sku,quantity,memo
+2024-01-01,2024-01-01 10:00:00,A100,3,정상
+2024-01-02,,B200,5,
+,2024-01-03 11:30:05,C300,,입고 지연
+"""
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return path
+
+
+def test_engines_return_the_same_frame(csv_path):
+    arrow = readers.read_csv(csv_path, engine="pyarrow")
+    c = readers.read_csv(csv_path, engine="c")
+
+    pd.testing.assert_frame_equal(arrow, c)
+    assert arrow.loc[0, "updated_at"] == "2024-01-01 10:00:00"
+    assert pd.isna(arrow.loc[1, "updated_at"])
+
+
+def test_engines_return_the_same_frame_with_sniffed_format(csv_path):
+    csv_format = sniff_csv(csv_path)
+    arrow = readers.read_csv(csv_path, engine="pyarrow", csv_format=csv_format)
+    c = readers.read_csv(csv_path, engine="c", csv_format=csv_format)
+
+    pd.testing.assert_frame_equal(arrow, c)
+
+
+def test_title_rows_fall_back_to_c_engine_with_same_dtypes(tmp_path, csv_path):
+    titled = tmp_path / "titled.csv"
+    titled.write_text("재고 내보내기\n\n" + CSV, encoding="utf-8")
+
+    from_title = readers.read_csv(titled, csv_format=sniff_csv(titled))
+    plain = readers.read_csv(csv_path, engine="pyarrow")
+
+    pd.testing.assert_frame_equal(from_title, plain)
@@ -0,0 +1,208 @@
+import multiprocessing
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import retrieval_service as rs
+from app.services.retrieval_service import HashingEmbedder, RetrievalService, TenantVectorIndex, load_embedder
+
+DIM = 64
+
+
+def add_rows(directory, worker: int, batches: int):
+    """별도 프로세스에서 같은 인덱스 디렉토리에 행 추가 (여러 uvicorn 워커 흉내)"""
+    index = TenantVectorIndex(directory, dim=DIM, hnsw_threshold=10**9)
+    embedder = HashingEmbedder(dim=DIM)
+    for batch in range(batches):
+        texts = [f"worker {worker} batch {batch} row {i} SKU{worker}{batch}{i:03d}" for i in range(50)]
+        index.add(texts, [{"i": i} for i in range(50)], embedder, source={"upload_job_id": worker})
+
+
+def assert_aligned(directory):
+    index = TenantVectorIndex(directory, dim=DIM, hnsw_threshold=10**9)
+    index.refresh()
+    assert not index.misaligned
+    vectors = np.fromfile(directory / "vectors.f32", dtype=np.float32).reshape(-1, DIM)
+    expected = HashingEmbedder(dim=DIM).encode([row["text"] for row in index._rows])
+    np.testing.assert_allclose(vectors, expected, atol=1e-6)
+    return index
+
+
+def test_concurrent_processes_keep_rows_and_vectors_aligned(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=add_rows, args=(tmp_path, w, 5)) for w in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    index = assert_aligned(tmp_path)
+    assert len(index) == 3 * 5 * 50
+
+
+def test_search_returns_matching_row(tmp_path):
+    index = TenantVectorIndex(tmp_path, dim=DIM, hnsw_threshold=10**9)
+    embedder = HashingEmbedder(dim=DIM)
+    texts = ["SKU: A100 | 상품명: 생수", "SKU: B200 | 상품명: 라면", "SKU: C300 | 상품명: 커피"]
+    assert index.add(texts, [{"n": i} for i in range(3)], embedder, source={}) == 3
+    assert index.add(texts, [{"n": i} for i in range(3)], embedder, source={}) == 0
+
+    [hit] = index.search(embedder.encode(["라면 B200"])[0], top_k=1)
+    assert hit["row"] == {"n": 1}
+
+
+def test_leftover_rows_from_interrupted_add_are_truncated(tmp_path):
+    embedder = HashingEmbedder(dim=DIM)
+    index = TenantVectorIndex(tmp_path, dim=DIM, hnsw_threshold=10**9)
+    index.add(["a row"], [{}], embedder, source={})
+    # 행만 쓰고 벡터를 쓰기 전에 중단된 추가
+    with open(tmp_path / "rows.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"hash": "x", "text": "orphan", "row": {}}\n')
+
+    other = TenantVectorIndex(tmp_path, dim=DIM, hnsw_threshold=10**9)
+    other.add(["b row"], [{}], embedder, source={})
+
+    assert [row["text"] for row in assert_aligned(tmp_path)._rows] == ["a row", "b row"]
+
+
+def test_misaligned_files_are_detected_and_rebuilt(tmp_path):
+    embedder = HashingEmbedder(dim=DIM)
+    index = TenantVectorIndex(tmp_path, dim=DIM, hnsw_threshold=10**9)
+    index.add(["a row", "b row"], [{}, {}], embedder, source={})
+    # 잠금 없이 동시에 쓰여 벡터가 행보다 많아진 상태
+    with open(tmp_path / "vectors.f32", "ab") as f:
+        f.write(embedder.encode(["lost row"]).tobytes())
+
+    fresh = TenantVectorIndex(tmp_path, dim=DIM, hnsw_threshold=10**9)
+    assert fresh.search(embedder.encode(["a row"])[0], top_k=1) == []
+    assert fresh.misaligned
+
+    assert fresh.add(["c row"], [{}], embedder, source={}) == 1
+    assert [row["text"] for row in assert_aligned(tmp_path)._rows] == ["c row"]
+
+
+def test_load_embedder_falls_back_when_model_cannot_be_loaded(monkeypatch):
+    def offline(model_name):
+        raise OSError(f"{model_name} 다운로드 실패")
+
+    monkeypatch.setattr(rs, "SentenceTransformerEmbedder", offline)
+
+    assert isinstance(load_embedder("all-MiniLM-L6-v2"), HashingEmbedder)
+
+
+def test_index_upload_queue_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(rs.settings, "EMBED_MODEL_NAME", "hashing")
+    service = RetrievalService(tmp_path, max_pending=2)
+    release = threading.Event()
+    loads = []
+
+    def load_rows():
+        release.wait(5)
+        loads.append(1)
+        return pd.DataFrame({"sku": [f"S{len(loads)}"]})
+
+    futures = [service.index_upload_async(1, job_id, load_rows) for job_id in range(4)]
+    assert [f is not None for f in futures] == [True, True, False, False]
+
+    release.set()
+    for future in futures[:2]:
+        future.result(timeout=5)
+    assert service.index_upload_async(1, 5, load_rows).result(timeout=5) is None
+    assert len(loads) == 3
+    service.shutdown()
+
+
+class BlockingEmbedder(HashingEmbedder):
+    """여러 행 임베딩(색인)은 release가 설정될 때까지 멈춤, 질문 임베딩은 바로 반환"""
+
+    def __init__(self):
+        super().__init__(dim=DIM)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def encode(self, texts):
+        if len(texts) > 1:
+            self.started.set()
+            self.release.wait(5)
+        return super().encode(texts)
+
+
+def test_search_is_not_blocked_while_embedding(tmp_path):
+    index = TenantVectorIndex(tmp_path, dim=DIM, hnsw_threshold=10**9)
+    embedder = BlockingEmbedder()
+    index.add(["SKU: A100 | 상품명: 생수"], [{"n": 0}], embedder, source={})
+
+    adding = threading.Thread(
+        target=index.add, args=([f"SKU: B{i}" for i in range(100)], [{}] * 100, embedder, {})
+    )
+    adding.start()
+    assert embedder.started.wait(5)
+
+    hits = []
+    searching = threading.Thread(target=lambda: hits.extend(index.search(embedder.encode(["생수"])[0], top_k=1)))
+    searching.start()
+    searching.join(timeout=2)
+    try:
+        assert not searching.is_alive()
+        assert hits[0]["row"] == {"n": 0}
+    finally:
+        embedder.release.set()
+        adding.join(timeout=5)
+    assert len(index) == 101
+
+
+def test_reindex_goes_through_the_bounded_queue(tmp_path, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import app.models  # noqa: F401
+    from app.core.database import Base, get_db
+    from app.models.tenant import Tenant
+    from app.models.upload_job import UploadJob
+    from app.routers import embed
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rs.settings, "EMBED_MODEL_NAME", "hashing")
+    service = RetrievalService(tmp_path / "vectors", max_pending=2)
+    monkeypatch.setattr(embed, "retrieval_service", service)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    (tmp_path / "uploads").mkdir()
+    with factory() as db:
+        db.add(Tenant(id=1, name="t", code="t"))
+        for job_id in (1, 2):
+            (tmp_path / "uploads" / f"{job_id}.csv").write_text(f"sku,quantity\nS{job_id},1\n")
+            db.add(UploadJob(id=job_id, tenant_id=1, original_filename="s.csv",
+                             stored_filename=f"{job_id}.csv", status="completed"))
+        db.commit()
+
+    app = FastAPI()
+    app.include_router(embed.router)
+    app.dependency_overrides[get_db] = lambda: factory()
+
+    # 이미 대기열 한 칸을 차지한 색인 작업
+    release = threading.Event()
+
+    def load_busy_rows():
+        release.wait(5)
+        return pd.DataFrame({"sku": ["busy"]})
+
+    busy = service.index_upload_async(1, None, load_busy_rows)
+
+    response = TestClient(app).post("/embed/reindex?tenant_id=1")
+    assert response.status_code == 202
+    assert response.json()["queued"] == [1]
+    assert response.json()["skipped"] == [2]
+
+    release.set()
+    busy.result(timeout=5)
+    service._executor.submit(lambda: None).result(timeout=5)  # 대기열 비우기
+    assert service.status(1)["rows"] == 2  # busy 작업 1행 + 업로드 1의 1행
+    service.shutdown()
@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from app.utils import sniffer
+from app.utils.sniffer import sniff_csv
+
+SAMPLE = 4096
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(sniffer, "SCAN_BLOCK_SIZE", 1024)
+    monkeypatch.setattr(sniffer, "SCAN_LIMIT", 8 * 1024)
+
+
+def write_csv(path, ascii_rows: int, tail: str, encoding: str):
+    # 앞부분은 ASCII만, 뒤쪽에만 한글 (세미콜론이 많은 자유 텍스트 컬럼)
+    lines = ["sku,quantity,memo"]
+    lines += [f"S{i},{i % 9},note {i}" for i in range(ascii_rows)]
+    lines += [f"S{i},{i % 9},{tail}" for i in range(ascii_rows, ascii_rows + 20)]
+    path.write_bytes(("\n".join(lines) + "\n").encode(encoding))
+
+
+@pytest.mark.parametrize("encoding", ["cp949", "utf-8"])
+def test_encoding_from_later_block(tmp_path, encoding):
+    path = tmp_path / "sales.csv"
+    write_csv(path, ascii_rows=400, tail="재고;부족;입고;예정", encoding=encoding)
+
+    csv_format = sniff_csv(path, sample_size=SAMPLE)
+
+    assert csv_format.encoding == encoding
+    # 구분자/헤더/타입은 이어진 앞부분 표본으로만 추정
+    assert csv_format.delimiter == ","
+    assert csv_format.has_header
+    assert csv_format.skiprows == 0
+    assert csv_format.columns == ["sku", "quantity", "memo"]
+    assert csv_format.dtypes == {"sku": "str", "quantity": "int64", "memo": "str"}
+
+    df = pd.read_csv(path, encoding=csv_format.encoding, **csv_format.read_csv_kwargs())
+    assert df["memo"].iloc[-1] == "재고;부족;입고;예정"
+
+
+def test_scan_stops_at_limit(tmp_path):
+    path = tmp_path / "sales.csv"
+    write_csv(path, ascii_rows=2000, tail="재고", encoding="cp949")
+    assert path.read_bytes()[:SAMPLE + sniffer.SCAN_LIMIT].isascii()
+
+    sample, block = sniffer._read_sample(path, SAMPLE)
+    assert len(sample) == SAMPLE
+    assert block == b""
+    assert sniff_csv(path, sample_size=SAMPLE).encoding == "utf-8"
+
+
+def test_non_ascii_sample_is_read_once(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_bytes("상품,수량\n사과,3\n배,5\n".encode("cp949"))
+
+    sample, block = sniffer._read_sample(path, SAMPLE)
+    assert block == b""
+
+    csv_format = sniff_csv(path, sample_size=SAMPLE)
+    assert csv_format.encoding == "cp949"
+    assert csv_format.columns == ["상품", "수량"]
@@ -0,0 +1,122 @@
+from app.services.token_budget import (
+    SUMMARY_MAX_QUESTIONS,
+    TOKENS_PER_MESSAGE,
+    TOKENS_PER_REPLY,
+    TokenCounter,
+    fit_to_budget,
+)
+
+
+class CharCounter(TokenCounter):
+    """글자 수 = 토큰 수 (tiktoken 유무와 무관하게 결과가 고정되도록)"""
+
+    def _get_encoding(self):
+        return None
+
+    def count_text(self, text: str) -> int:
+        return len(text)
+
+
+counter = CharCounter("test")
+SYSTEM = {"role": "system", "content": "재고 관리 도우미입니다."}
+
+
+def conversation(turns: int, size: int = 40, answer_size: int = None):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"질문{i} " + "q" * size})
+        messages.append({"role": "assistant", "content": f"답변{i} " + "a" * (size if answer_size is None else answer_size)})
+    return messages
+
+
+def test_under_budget_returns_messages_unchanged():
+    messages = [SYSTEM] + conversation(2) + [{"role": "user", "content": "마지막 질문"}]
+
+    result, metadata = fit_to_budget(messages, counter, budget=10_000)
+
+    assert result == messages
+    assert metadata["dropped_messages"] == 0
+    assert metadata["over_budget"] is False
+    assert metadata["prompt_tokens"] == counter.count_messages(messages)
+
+
+def test_drops_oldest_turns_and_keeps_system_and_last_message():
+    history = conversation(10, size=5, answer_size=80)
+    last = {"role": "user", "content": "지금 재고가 부족한 제품은?"}
+    messages = [SYSTEM] + history + [last]
+    budget = counter.count_messages(messages) // 2
+
+    result, metadata = fit_to_budget(messages, counter, budget)
+
+    assert result[0] == SYSTEM
+    assert result[-1] == last
+    assert metadata["prompt_tokens"] == counter.count_messages(result) <= budget
+    assert metadata["dropped_messages"] > 0
+    assert metadata["summarized"] is True
+    summary = result[1]
+    assert summary["role"] == "system" and "질문0" in summary["content"]
+    # 남은 대화는 사용자 질문으로 시작하고 최근 대화가 순서대로 유지됨
+    kept = result[2:-1]
+    assert kept[0]["role"] == "user"
+    assert kept == history[len(history) - len(kept):]
+
+
+def test_keeps_recent_turns_without_summary_when_summary_does_not_fit():
+    # 생략 질문 요약이 남길 수 있는 대화보다 길면 요약 없이 최근 대화만 유지
+    history = conversation(10, size=50, answer_size=5)
+    last = {"role": "user", "content": "마지막"}
+    messages = history + [last]
+    budget = counter.count_messages(history[-2:] + [last])
+
+    result, metadata = fit_to_budget(messages, counter, budget)
+
+    assert result == history[-2:] + [last]
+    assert metadata["summarized"] is False
+    assert metadata["dropped_messages"] == len(history) - 2
+    assert metadata["prompt_tokens"] == counter.count_messages(result)
+
+
+def test_system_prompt_and_last_message_over_budget():
+    last = {"role": "user", "content": "매우 긴 질문 " + "x" * 500}
+    messages = [SYSTEM] + conversation(3) + [last]
+
+    result, metadata = fit_to_budget(messages, counter, budget=100)
+
+    # 줄일 수 있는 대화는 모두 제외하지만 system/마지막 메시지는 유지하고 예산 초과를 알림
+    assert result == [SYSTEM, last]
+    assert metadata["dropped_messages"] == 6
+    assert metadata["summarized"] is False
+    assert metadata["over_budget"] is True
+    assert metadata["prompt_tokens"] == counter.count_messages([SYSTEM, last])
+
+
+def test_single_message_over_budget_is_sent_as_is():
+    messages = [{"role": "user", "content": "x" * 200}]
+
+    result, metadata = fit_to_budget(messages, counter, budget=50)
+
+    assert result == messages
+    assert metadata["over_budget"] is True
+
+
+def test_summary_lists_only_recent_dropped_questions():
+    messages = conversation(SUMMARY_MAX_QUESTIONS + 5, size=10) + [{"role": "user", "content": "마지막"}]
+    last_cost = counter.count_messages([messages[-1]])
+
+    result, metadata = fit_to_budget(messages, counter, budget=last_cost + 400)
+
+    summary = result[0]["content"]
+    assert metadata["summarized"] is True
+    assert "질문0 " not in summary
+    assert summary.count("\n- ") == SUMMARY_MAX_QUESTIONS
+
+
+def test_estimate_counts_non_ascii_per_character():
+    estimator = CharCounter("test")
+    estimator.count_text = TokenCounter.count_text.__get__(estimator)
+
+    assert estimator.count_text("abcd") == 1
+    assert estimator.count_text("재고") == 2
+    assert estimator.count_messages([{"role": "user", "content": "재고"}]) == (
+        TOKENS_PER_MESSAGE + 1 + 2 + TOKENS_PER_REPLY
+    )
@@ -0,0 +1,164 @@
+import asyncio
+import io
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.core import database
+from app.core.database import Base
+from app.models.tenant import Tenant
+from app.models.upload_job import UploadJob
+from app.services import upload_service
+from app.services.upload_service import (
+    STALE_JOB_MESSAGE,
+    UploadQueueFull,
+    UploadService,
+    UploadWorkerPool,
+    fail_stale_upload_jobs,
+    is_stale_upload_job,
+    run_upload_job,
+    touch_upload_jobs,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    # 업로드 작업 스레드가 별도 세션을 열 수 있도록 파일 SQLite 사용
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    monkeypatch.chdir(tmp_path)
+    with factory() as db:
+        db.add(Tenant(id=1, name="t", code="t"))
+        db.commit()
+    return factory
+
+
+def add_job(db, status: str, age: timedelta = timedelta(0)) -> int:
+    job = UploadJob(
+        tenant_id=1, original_filename="s.csv", stored_filename=f"{status}.csv", status=status,
+        updated_at=datetime.utcnow() - age,
+    )
+    db.add(job)
+    db.commit()
+    return job.id
+
+
+def test_fail_stale_upload_jobs_only_touches_old_unfinished_jobs(session_factory):
+    with session_factory() as db:
+        old = timedelta(hours=2)
+        stale_pending = add_job(db, "pending", old)
+        stale_processing = add_job(db, "processing", old)
+        recent_pending = add_job(db, "pending")
+        completed = add_job(db, "completed", old)
+
+    assert fail_stale_upload_jobs() == 2
+
+    with session_factory() as db:
+        statuses = {job.id: (job.status, job.error_message) for job in db.query(UploadJob)}
+    assert statuses[stale_pending] == ("failed", STALE_JOB_MESSAGE)
+    assert statuses[stale_processing] == ("failed", STALE_JOB_MESSAGE)
+    assert statuses[recent_pending][0] == "pending"
+    assert statuses[completed][0] == "completed"
+
+
+def test_is_stale_upload_job():
+    now = datetime.utcnow()
+    assert is_stale_upload_job(UploadJob(status="processing", updated_at=now - timedelta(hours=1)), now)
+    assert not is_stale_upload_job(UploadJob(status="processing", updated_at=now), now)
+    assert not is_stale_upload_job(UploadJob(status="completed", updated_at=now - timedelta(hours=1)), now)
+
+
+def test_run_upload_job_skips_jobs_that_are_no_longer_pending(session_factory):
+    with session_factory() as db:
+        job_id = add_job(db, "failed")
+
+    run_upload_job(job_id)
+
+    with session_factory() as db:
+        assert db.get(UploadJob, job_id).status == "failed"
+
+
+def test_queue_full_marks_job_failed_and_removes_saved_file(session_factory, monkeypatch):
+    monkeypatch.setattr(upload_service, "upload_pool", UploadWorkerPool(max_workers=1, max_pending=1))
+    upload_service.upload_pool._slots.acquire()  # 대기열이 가득 찬 상태
+    file = UploadFile(file=io.BytesIO(b"sale_date,sku,quantity\n2025-01-01,A,1\n"), filename="s.csv")
+
+    with session_factory() as db:
+        service = UploadService(db)
+        with pytest.raises(UploadQueueFull):
+            asyncio.run(service.process_upload(file, tenant_id=1))
+        job = db.query(UploadJob).one()
+
+        assert job.status == "failed"
+        assert job.file_size is not None
+        assert not (service.file_handler.upload_dir / job.stored_filename).exists()
+
+
+def test_jobs_owned_by_the_pool_are_not_stale(session_factory, monkeypatch):
+    pool = UploadWorkerPool(max_workers=1, max_pending=2)
+    monkeypatch.setattr(upload_service, "upload_pool", pool)
+    gate = threading.Event()
+    monkeypatch.setattr(upload_service, "run_upload_job", lambda *args: gate.wait(5))
+    with session_factory() as db:
+        running = add_job(db, "processing", timedelta(hours=2))
+        queued = add_job(db, "pending", timedelta(hours=2))
+
+    futures = [pool.submit(running), pool.submit(queued)]
+    try:
+        assert pool.owns(running) and pool.owns(queued)
+        with session_factory() as db:
+            assert not is_stale_upload_job(db.get(UploadJob, queued))
+        assert fail_stale_upload_jobs() == 0
+    finally:
+        gate.set()
+        for future in futures:
+            future.result()
+        pool.shutdown()
+    assert pool.in_flight() == []
+
+
+def test_touch_upload_jobs_refreshes_unfinished_jobs(session_factory):
+    with session_factory() as db:
+        pending = add_job(db, "pending", timedelta(hours=2))
+        completed = add_job(db, "completed", timedelta(hours=2))
+
+    touch_upload_jobs([pending, completed])
+
+    with session_factory() as db:
+        assert not is_stale_upload_job(db.get(UploadJob, pending))
+        assert db.get(UploadJob, completed).updated_at < datetime.utcnow() - timedelta(hours=1)
+
+
+def test_job_failed_during_processing_is_not_completed(session_factory, monkeypatch):
+    indexed = []
+    monkeypatch.setattr(upload_service.retrieval_service, "index_upload_async", lambda *args: indexed.append(args))
+    original_profile_file = upload_service.FileHandler.profile_file
+
+    def profile_then_fail(self, *args, **kwargs):
+        # 처리 도중 다른 쪽에서 중단된 작업으로 정리된 경우
+        with session_factory() as other:
+            job = other.get(UploadJob, job_id)
+            job.status, job.error_message = "failed", STALE_JOB_MESSAGE
+            other.commit()
+        return original_profile_file(self, *args, **kwargs)
+
+    monkeypatch.setattr(upload_service.FileHandler, "profile_file", profile_then_fail)
+    with session_factory() as db:
+        job_id = add_job(db, "pending")
+        stored_filename = db.get(UploadJob, job_id).stored_filename
+    (upload_service.FileHandler(upload_dir="uploads").upload_dir / stored_filename).write_text("a,b\n1,2\n")
+
+    run_upload_job(job_id)
+
+    with session_factory() as db:
+        job = db.get(UploadJob, job_id)
+        assert (job.status, job.error_message) == ("failed", STALE_JOB_MESSAGE)
+        assert job.profile_data is None
+    assert indexed == []
@@ -70,9 +70,18 @@ export default function UploadPage() {
         });
       }, 200);
 
-      const result = await uploadService.uploadFile(file);
-      
+      const accepted = await uploadService.uploadFile(file);
       clearInterval(progressInterval);
+
+      // 서버에서 파싱/적재가 끝날 때까지 처리 행 수로 진행률 표시
+      const result = await uploadService.waitForUpload(accepted.id, (job) => {
+        if (job.total_rows) {
+          setUploadProgress(90 + Math.floor((9 * (job.rows_processed || 0)) / job.total_rows));
+        }
+      });
+      if (result.status === 'failed') {
+        throw new Error(result.error_message || '파일 처리 중 오류가 발생했습니다');
+      }
       setUploadProgress(100);
 
       setTimeout(() => {
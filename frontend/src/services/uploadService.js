@@ -34,6 +34,21 @@ export const uploadService = {
     return response.data;
   },
 
+  // 업로드 처리(백그라운드)가 끝날 때까지 상태 조회, 완료/실패한 작업 반환
+  // maxWaitMs 안에 끝나지 않으면 오류 (처리는 서버에서 계속되며 업로드 목록에서 확인 가능)
+  waitForUpload: async (uploadJobId, onProgress, intervalMs = 1000, maxWaitMs = 10 * 60 * 1000) => {
+    const deadline = Date.now() + maxWaitMs;
+    while (Date.now() < deadline) {
+      const { upload_job } = await uploadService.getUploadProfile(uploadJobId);
+      if (onProgress) onProgress(upload_job);
+      if (upload_job.status === 'completed' || upload_job.status === 'failed') {
+        return upload_job;
+      }
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+    throw new Error('파일 처리가 오래 걸리고 있습니다. 잠시 후 업로드 목록에서 상태를 확인해주세요.');
+  },
+
   getUploadList: async (tenantId = 1, skip = 0, limit = 10) => {
     const response = await apiClient.get(
       `/upload/?tenant_id=${tenantId}&skip=${skip}&limit=${limit}`